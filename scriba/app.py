@@ -24,16 +24,21 @@ from PySide6.QtWidgets import QApplication, QSystemTrayIcon
 from . import diagnose
 from .audio.capture import AudioCapture
 from .autostart import disable_autostart, enable_autostart
-from .config import Config, config_path, load_config, save_config
+from .config import Config, config_path, load_config, logs_dir, save_config
 from .detect.vad import Detector
+from .inject.base import coalesce_queued_jobs
 from .inject.windows import InjectionBlockedError, WindowsInjector
 from .logging_setup import setup_logging
-from .messages import AudioChunk, AudioFrame, InjectJob, PostprocState, Transcript
+from .messages import InjectJob, PostprocState, Transcript
+from .queues import BoundedQueue, QueueStats, save_queue_stats
 from .singleinstance import SingleInstance
 from .stt.language import model_for_language, resolve_language
-from .stt.streaming import StreamingSession
+from .stt.residency import WAKE_DEVICE, WAKE_MODEL, PageCacheWarmer, model_files
+from .stt.scheduler import RtfTracker
+from .stt.streaming import StreamingSession, coalesce_chunks, coalesce_queued_chunks
 from .stt.whisper_local import WhisperLocalBackend
 from .text.pipeline import run_pipeline
+from .trace import TRACE, export_chrome_trace
 from .ui.hotkeys import HotkeyAction, HotkeyManager
 from .ui.tray import ScribaTray, TrayState
 from .ui.tray_pin import pin_tray_icon
@@ -141,6 +146,7 @@ class ScribaApp(QObject):
     _provision_progress = Signal(float, str)
     _provision_done = Signal(bool, str)
     _reload_done = Signal(bool, str)
+    _wake_loaded = Signal(object)  # WhisperLocalBackend, from the idle-tier loader
     _state_requested = Signal(object)  # TrayState, emitted from worker threads
     _toast_requested = Signal(str, str)
     # Hotkey callbacks fire on the `keyboard` package's hook thread; they must
@@ -168,19 +174,55 @@ class ScribaApp(QObject):
         self._initial_load_done = False  # first-ever load succeeded at least once
         self._model_loaded = False  # currently loaded (False after idle-unload)
         self._reloading = False
+        self._quiet_reload = False
         self._disabled_since: float | None = None
         self._pending_enable_after_reload = False
-
-        self._frame_queue: queue.Queue[AudioFrame] = queue.Queue()
-        self._chunk_queue: queue.Queue[AudioChunk] = queue.Queue()
-        self._inject_queue: queue.Queue[InjectJob] = queue.Queue()
+        # stt.idle_tier (user request, stt/residency.py): what idle-unload
+        # keeps. "small" loads _wake_backend, which serves dictation while
+        # _backend reloads quietly; "cache" keeps _cache_warmer re-reading
+        # the model files so that reload skips the disk.
+        self._wake_backend: WhisperLocalBackend | None = None
+        self._cache_warmer: PageCacheWarmer | None = None
+
+        # Bounded, each with its overflow policy (scriba/queues.py; user
+        # request): a stalled consumer costs shed or merged entries, not an
+        # ever-growing backlog. The frame policy asks the detector who won.
+        self._frame_queue = BoundedQueue(
+            "frames",
+            config.audio.frame_queue_max,
+            shed=lambda items: self._detector.shed_frame(items),
+        )
+        self._chunk_queue = BoundedQueue(
+            "chunks", config.streaming.chunk_queue_max, coalesce=coalesce_queued_chunks
+        )
+        self._inject_queue = BoundedQueue(
+            "inject", config.inject.queue_max, coalesce=coalesce_queued_jobs
+        )
+        self._logged_queue_stats: list[QueueStats] = []
         self._postproc_state = PostprocState()
-
-        self._capture = AudioCapture(config, self._frame_queue)
+        # Decode-speed history for adaptive partial pacing (stt/scheduler.py);
+        # outlives sessions so each utterance starts from what's been measured.
+        self._rtf_tracker = RtfTracker()
+
+        self._capture = AudioCapture(
+            config,
+            self._frame_queue,
+            on_device_opened=lambda device_id: self._detector.on_device_opened(device_id),
+        )
         self._detector = Detector(
             config, self._frame_queue, self._chunk_queue, self._capture.get_preroll
         )
         self._backend = WhisperLocalBackend(config)
+        # streaming.partial_model (user request): None = partials use _backend.
+        self._partial_backend = (
+            WhisperLocalBackend(
+                config,
+                model=config.streaming.partial_model,
+                device=config.streaming.partial_device,
+            )
+            if config.streaming.partial_model
+            else None
+        )
         self._injector = WindowsInjector(config.inject)
         self._hotkeys = HotkeyManager(config.hotkeys)
 
@@ -195,11 +237,13 @@ class ScribaApp(QObject):
         self.tray.mode_changed.connect(self._on_mode_changed)
         self.tray.language_changed.connect(self._on_language_changed)
         self.tray.microphone_changed.connect(self._on_microphone_changed)
+        self.tray.trace_export_requested.connect(self._on_trace_export_requested)
         self.tray.quit_requested.connect(self._on_quit_requested)
 
         self._provision_progress.connect(self._on_provision_progress)
         self._provision_done.connect(self._on_provision_done)
         self._reload_done.connect(self._on_reload_done)
+        self._wake_loaded.connect(self._on_wake_loaded)
         self._state_requested.connect(self.tray.set_state)
         self._toast_requested.connect(self.tray.showMessage)
         self._hotkey_fired.connect(self._on_hotkey)
@@ -214,6 +258,11 @@ class ScribaApp(QObject):
         self._idle_unload_timer.timeout.connect(self._check_idle_unload)
         self._idle_unload_timer.start()
 
+        self._queue_stats_timer = QTimer(self)
+        self._queue_stats_timer.setInterval(60_000)
+        self._queue_stats_timer.timeout.connect(self._report_queue_stats)
+        self._queue_stats_timer.start()
+
         # Devices are dynamic (hot-plug, DESIGN §7.1), unlike Mode/Language --
         # keep the tray's Microphone submenu in sync with what's actually
         # available, matching AudioCapture's own poll_interval_s cadence.
@@ -249,6 +298,7 @@ class ScribaApp(QObject):
 
     def shutdown(self) -> None:
         self._stop_event.set()
+        self._report_queue_stats()
         self._hotkeys.stop()
         try:
             self._capture.stop()
@@ -256,23 +306,73 @@ class ScribaApp(QObject):
             logger.exception("error stopping audio capture")
         self._guard.release()
 
+    def _report_queue_stats(self) -> None:
+        """Logs each pipeline queue's depth, high-water mark and drop/merge
+        counters when they changed since the last report, and saves them
+        for `--diagnose` (scriba/queues.py)."""
+        stats = [q.stats() for q in (self._frame_queue, self._chunk_queue, self._inject_queue)]
+        if stats == self._logged_queue_stats:
+            return
+        self._logged_queue_stats = stats
+        for s in stats:
+            logger.info(
+                "queue %s: depth %d, high-water %d/%d, coalesced %d, dropped %d, overflowed %d",
+                s.name,
+                s.depth,
+                s.high_water,
+                s.maxsize,
+                s.coalesced,
+                s.dropped,
+                s.overflowed,
+            )
+        try:
+            save_queue_stats(stats)
+        except OSError:
+            logger.exception("could not save queue stats")
+
     def _start_pipeline(self) -> None:
         self._capture.start()
-        threading.Thread(target=self._detector.run, args=(self._stop_event,), daemon=True).start()
-        threading.Thread(target=self._stt_loop, args=(self._stop_event,), daemon=True).start()
-        threading.Thread(target=self._inject_loop, args=(self._stop_event,), daemon=True).start()
+        # Named for the latency trace's thread tracks (scriba/trace.py).
+        stop = (self._stop_event,)
+        threading.Thread(target=self._detector.run, args=stop, name="detector", daemon=True).start()
+        threading.Thread(target=self._stt_loop, args=stop, name="stt", daemon=True).start()
+        threading.Thread(target=self._inject_loop, args=stop, name="inject", daemon=True).start()
 
     # --- provisioning (runs on a transient thread, DESIGN §7.4) --------
 
     def _provision_worker(self) -> None:
+        # VAD first (a ~2 MB download at most): its session must exist before
+        # capture starts, or the detector thread builds it on the first frame
+        # while frames back up behind it. If Silero can't be loaded the
+        # detector switches to the spectral VAD (detect/spectral.py) here.
+        try:
+            self._detector.prewarm(len(self._capture.list_devices()))
+        except Exception:
+            logger.exception("Silero VAD prewarm failed")
         try:
             self._backend.load(lambda frac, label: self._provision_progress.emit(frac, label))
         except Exception as exc:
             logger.exception("STT model failed to load on all fallback rungs")
             self._provision_done.emit(False, str(exc))
             return
+        self._load_partial_backend()
         self._provision_done.emit(True, self._backend.descriptor)
 
+    def _load_partial_backend(self) -> None:
+        """Loads the `streaming.partial_model` backend, if one is configured.
+        Not fatal: on failure partials fall back to the main model."""
+        if self._partial_backend is None:
+            return
+        try:
+            self._partial_backend.load(
+                lambda frac, label: self._provision_progress.emit(frac, f"partials: {label}")
+            )
+        except Exception:
+            logger.exception("partial model failed to load; partials use the main model")
+            self._partial_backend = None
+            return
+        logger.info("partial passes use %s", self._partial_backend.descriptor)
+
     def _on_provision_progress(self, fraction: float, label: str) -> None:
         self.tray.set_state(TrayState.PROVISIONING)
         self.tray.update_status(model=f"{label} {fraction * 100:.0f}%")
@@ -297,38 +397,96 @@ class ScribaApp(QObject):
 
     def _apply_rung_effects(self) -> None:
         self.degraded = self._backend.rung > 1
-        if self._backend.rung in _CPU_FALLBACK_RUNGS:
+        if self._backend.rung in _CPU_FALLBACK_RUNGS and self._partial_backend is None:
             # DESIGN §7.4a: "the DEGRADED CPU fallback rungs force [streaming]
             # off automatically (CPU decode isn't fast enough to re-decode on
-            # a cadence)". Rungs 2/4 are the CPU rungs (whisper_local.py).
+            # a cadence)". Rungs 2/4 are the CPU rungs (whisper_local.py). A
+            # separate, small partial model keeps up on the CPU, so not then.
             logger.info("STT fell back to a CPU rung; disabling streaming partials")
             self._config.streaming.enabled = False
 
     # --- idle-unload / reload (frees ~1.35GB host RAM when disabled a while) --
 
     def _check_idle_unload(self) -> None:
+        warmer = self._cache_warmer
+        if warmer is not None and not self._model_loaded and not self._reloading and warmer.due():
+            # "cache" tier: re-read every few minutes, before the OS evicts the
+            # files; never while the last pass is still reading
+            threading.Thread(target=warmer.warm, daemon=True).start()
         minutes = self._config.stt.idle_unload_minutes
         if minutes <= 0 or not self._model_loaded or self._reloading or self.enabled:
             return
         if self._disabled_since is None or time.monotonic() - self._disabled_since < minutes * 60:
             return
-        logger.info("idle %d+ min with dictation off; unloading STT model to free RAM", minutes)
+        tier = self._config.stt.idle_tier
+        logger.info(
+            "idle %d+ min with dictation off; unloading STT model to free RAM (idle tier %s)",
+            minutes,
+            tier,
+        )
         self._backend.unload()
+        if self._partial_backend is not None:
+            self._partial_backend.unload()
         self._model_loaded = False
-        self.tray.update_status(model="unloaded (idle)")
-
-    def _reload_backend(self) -> None:
+        if tier == "small":
+            threading.Thread(target=self._load_wake_backend, daemon=True).start()
+            self.tray.update_status(model=f"unloaded (idle; {WAKE_MODEL} on {WAKE_DEVICE} ready)")
+        elif tier == "cache":
+            self._cache_warmer = PageCacheWarmer(model_files(self._config.stt.model))
+            threading.Thread(target=self._cache_warmer.warm, daemon=True).start()
+            self.tray.update_status(model="unloaded (idle; files kept cached)")
+        else:
+            self.tray.update_status(model="unloaded (idle)")
+
+    def _load_wake_backend(self) -> None:
+        """Idle tier "small", worker thread: loads the small CPU model that
+        serves dictation the moment it's re-enabled, and hands it to the Qt
+        main thread, which owns the reload state it has to be checked
+        against."""
+        backend = WhisperLocalBackend(self._config, model=WAKE_MODEL, device=WAKE_DEVICE)
+        try:
+            backend.load(lambda frac, label: None)  # idle: nothing to show progress on
+        except Exception:
+            logger.exception("idle wake model (%s) failed to load", WAKE_MODEL)
+            return
+        self._wake_loaded.emit(backend)
+
+    def _on_wake_loaded(self, backend: WhisperLocalBackend) -> None:
+        """Installs the idle wake model, or drops it if a reload started (or
+        finished) while it loaded, or an earlier idle period's load already
+        installed one."""
+        if self._model_loaded or self._reloading or self._wake_backend is not None:
+            backend.unload()
+            return
+        logger.info("idle wake model ready: %s", backend.descriptor)
+        self._wake_backend = backend
+
+    def _session_backends(self) -> tuple[WhisperLocalBackend, WhisperLocalBackend | None]:
+        """Backend and partial backend for an utterance starting now: the
+        idle wake model until `_backend` is back, so the swap happens at an
+        utterance boundary, never mid-utterance."""
+        wake = self._wake_backend
+        if wake is not None and not self._model_loaded:
+            return wake, None
+        return self._backend, self._partial_backend
+
+    def _reload_backend(self, quiet: bool = False) -> None:
         """(Re)loads `self._backend` per current config, with tray PROVISIONING
         state + live progress + start/finish toasts, so it's unmistakable
         that something is happening rather than the tray looking stuck.
         Used both for reactivating after an idle-unload and for an explicit
-        model switch from the tray menu."""
+        model switch from the tray menu.
+
+        `quiet`: dictation is already running on the idle wake model, so
+        there's nothing to wait for -- no PROVISIONING state, no toasts."""
         if self._reloading:
             return
         self._reloading = True
+        self._quiet_reload = quiet
         self._model_loaded = False
-        self._state_requested.emit(TrayState.PROVISIONING)
-        self._toast_requested.emit("Scriba", "Loading speech model…")
+        if not quiet:
+            self._state_requested.emit(TrayState.PROVISIONING)
+            self._toast_requested.emit("Scriba", "Loading speech model…")
         threading.Thread(target=self._reload_worker, daemon=True).start()
 
     def _reload_worker(self) -> None:
@@ -339,10 +497,18 @@ class ScribaApp(QObject):
             logger.exception("STT model (re)load failed")
             self._reload_done.emit(False, str(exc))
             return
+        if self._partial_backend is not None:
+            self._partial_backend.unload()
+        self._load_partial_backend()
         self._reload_done.emit(True, self._backend.descriptor)
 
     def _on_reload_done(self, success: bool, message: str) -> None:
         self._reloading = False
+        if not success and self._quiet_reload and self._wake_backend is not None:
+            # keep dictating on the wake model; the next activation retries
+            logger.error("STT model reload failed; staying on %s: %s", WAKE_MODEL, message)
+            self.tray.update_status(model=f"{self._wake_backend.descriptor} (reload failed)")
+            return
         if not success:
             self._pending_enable_after_reload = False
             self._state_requested.emit(TrayState.ERROR)
@@ -350,8 +516,15 @@ class ScribaApp(QObject):
             logger.error("STT model reload failed: %s", message)
             return
         self._model_loaded = True
+        # the next utterance starts on _backend; one in flight keeps its reference
+        self._wake_backend = None
+        self._cache_warmer = None
         self._apply_rung_effects()
         self.tray.update_status(model=self._backend.descriptor)
+        if self._quiet_reload:
+            logger.info("STT model back after idle: %s", self._backend.descriptor)
+            self._refresh_idle_state()
+            return
         self._toast_requested.emit("Scriba", "Speech model ready")
         if self._pending_enable_after_reload:
             self._pending_enable_after_reload = False
@@ -369,7 +542,9 @@ class ScribaApp(QObject):
         already the audible cue (a second, distinct tone was redundant).
 
         If the model was idle-unloaded, activating instead kicks off a
-        reload and defers actually enabling until it finishes."""
+        reload and defers actually enabling until it finishes -- unless the
+        idle wake model is loaded: then dictation starts on it right away
+        and the reload runs quietly behind it."""
         if enabled == self.enabled:
             return
         if not enabled:
@@ -378,10 +553,13 @@ class ScribaApp(QObject):
             self.tray.set_enabled_checked(False)
             self._refresh_idle_state()
             return
-        if not self._initial_load_done or self._reloading:
+        waking = not self._model_loaded and self._wake_backend is not None
+        if not self._initial_load_done or (self._reloading and not waking):
             self.tray.set_enabled_checked(False)  # reject; keep the checkbox honest
             return
-        if not self._model_loaded:
+        if waking:
+            self._reload_backend(quiet=True)  # no-op if it's already running
+        elif not self._model_loaded:
             self.tray.set_enabled_checked(False)  # not enabled yet -- reload first
             self._pending_enable_after_reload = True
             self._reload_backend()
@@ -434,6 +612,20 @@ class ScribaApp(QObject):
         self._pending_enable_after_reload = was_enabled
         self._reload_backend()
 
+    def _on_trace_export_requested(self) -> None:
+        path = logs_dir() / f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        try:
+            n_events = export_chrome_trace(path)
+        except OSError as exc:
+            logger.exception("latency trace export failed")
+            self.tray.showMessage("Scriba: trace export failed", str(exc))
+            return
+        logger.info("latency trace: %d events written to %s", n_events, path)
+        self.tray.showMessage(
+            "Scriba: latency trace saved",
+            f"{n_events} events in {path.name} (log folder); open it in ui.perfetto.dev",
+        )
+
     def _on_quit_requested(self) -> None:
         app = QApplication.instance()
         if app is not None:
@@ -464,10 +656,11 @@ class ScribaApp(QObject):
         if self._config.general.mode != "push_to_talk":
             return
         self._set_enabled(False)
-        # An utterance already in flight (VAD triggered while the key was
-        # held) finishes naturally via VAD endpoint rather than being cut
-        # here -- Detector has no force-endpoint hook. True instant-on-
-        # release PTT would need one; out of scope for this integration pass.
+        # An utterance in flight (VAD triggered while the key was held) ends
+        # at key-up instead of waiting out vad.endpoint_silence_ms: the
+        # detector flushes the frames already captured, then emits the final
+        # chunk, which the STT worker still finishes while disabled.
+        self._detector.force_endpoint()
 
     def _hotkey_language_switch(self) -> None:
         order = ["en", "de"]
@@ -497,53 +690,73 @@ class ScribaApp(QObject):
 
         while not stop_event.is_set():
             try:
-                chunk = self._chunk_queue.get(timeout=0.1)
+                batch = [self._chunk_queue.get(timeout=0.1)]
             except queue.Empty:
                 continue
-            try:
-                if chunk.utterance_id != active_utterance_id:
-                    if not self.enabled:
-                        # only start new utterances while armed; in-flight ones finish
-                        if chunk.utterance_id != last_skipped_id:
-                            last_skipped_id = chunk.utterance_id
-                            logger.debug(
-                                "skipping utterance %d (disabled)", chunk.utterance_id
+            # Drain whatever queued up during the last decode and merge it per
+            # utterance: one buffer append and at most one partial pass per
+            # drain, straight to the final pass if the endpoint is already in.
+            while True:
+                try:
+                    batch.append(self._chunk_queue.get_nowait())
+                except queue.Empty:
+                    break
+            for chunk in coalesce_chunks(batch):
+                try:
+                    if chunk.utterance_id != active_utterance_id:
+                        if not self.enabled:
+                            # only start new utterances while armed; in-flight ones finish
+                            if chunk.utterance_id != last_skipped_id:
+                                last_skipped_id = chunk.utterance_id
+                                logger.debug(
+                                    "skipping utterance %d (disabled)", chunk.utterance_id
+                                )
+                            continue
+                        foreground = self._injector.foreground_window()
+                        hwnd = foreground.hwnd if foreground else None
+                        backend, partial_backend = self._session_backends()
+                        with TRACE.span("language", chunk.utterance_id) as trace_args:
+                            probs = (
+                                backend.detect_language_probs(chunk.pcm)
+                                if self._config.general.language == "mixed"
+                                else None
                             )
-                        continue
-                    foreground = self._injector.foreground_window()
-                    hwnd = foreground.hwnd if foreground else None
-                    probs = (
-                        self._backend.detect_language_probs(chunk.pcm)
-                        if self._config.general.language == "mixed"
-                        else None
-                    )
-                    chunk.language = resolve_language(
-                        self._config.general.language, probs, self._config.stt
-                    )
-                    active_utterance_id = chunk.utterance_id
-                    logger.info(
-                        "utterance %d started (device %s, language %s)",
-                        chunk.utterance_id,
-                        chunk.device_id,
-                        chunk.language or "auto",
+                            chunk.language = resolve_language(
+                                self._config.general.language, probs, self._config.stt
+                            )
+                            trace_args["language"] = chunk.language or "auto"
+                        active_utterance_id = chunk.utterance_id
+                        logger.info(
+                            "utterance %d started (device %s, language %s)",
+                            chunk.utterance_id,
+                            chunk.device_id,
+                            chunk.language or "auto",
+                        )
+                        tracker.begin(hwnd)
+                        session = StreamingSession(
+                            backend,
+                            self._config,
+                            emit=emit,
+                            rtf_tracker=self._rtf_tracker,
+                            clock=time.monotonic,  # AudioFrame/AudioChunk timebase
+                            on_text=self._detector.observe_text,
+                            partial_backend=partial_backend,
+                        )
+                        self._state_requested.emit(TrayState.LISTENING)
+
+                    assert session is not None
+                    session.feed(chunk)
+
+                    if chunk.is_final:
+                        session = None
+                        active_utterance_id = None
+                except Exception:
+                    logger.exception(
+                        "stt loop: error handling chunk for utterance %s", chunk.utterance_id
                     )
-                    tracker.begin(hwnd)
-                    session = StreamingSession(self._backend, self._config, emit=emit)
-                    self._state_requested.emit(TrayState.LISTENING)
-
-                assert session is not None
-                session.feed(chunk)
-
-                if chunk.is_final:
                     session = None
                     active_utterance_id = None
-            except Exception:
-                logger.exception(
-                    "stt loop: error handling chunk for utterance %s", chunk.utterance_id
-                )
-                session = None
-                active_utterance_id = None
-                tracker.reset()
+                    tracker.reset()
 
     def _handle_transcript(self, transcript: Transcript, tracker: _RevisionTracker) -> None:
         foreground = self._injector.foreground_window()
@@ -562,7 +775,10 @@ class ScribaApp(QObject):
             return
 
         self._state_requested.emit(TrayState.TRANSCRIBING)
-        jobs, next_state = run_pipeline(transcript, self._postproc_state, self._config, foreground)
+        with TRACE.span("pipeline", transcript.utterance_id):
+            jobs, next_state = run_pipeline(
+                transcript, self._postproc_state, self._config, foreground
+            )
         self._postproc_state = next_state
 
         if not jobs:
@@ -594,9 +810,22 @@ class ScribaApp(QObject):
 
 
 def main() -> int:
+    if sys.argv[1:2] == ["bench"]:
+        # Headless replay harness (scriba/bench/): dispatched before any
+        # Qt/CUDA/single-instance setup so it can run alongside a live Scriba.
+        from .bench.cli import main as bench_main
+
+        return bench_main(sys.argv[2:])
+
     parser = argparse.ArgumentParser(prog="scriba")
     parser.add_argument("--diagnose", action="store_true", help="print diagnostics and exit")
     parser.add_argument("--debug", action="store_true", help="enable DEBUG logging")
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="PATH",
+        help="on exit, write the latency trace (Chrome/Perfetto JSON) to PATH",
+    )
     autostart_group = parser.add_mutually_exclusive_group()
     autostart_group.add_argument(
         "--autostart", action="store_true", help="register Scriba to start at login, then exit"
@@ -640,6 +869,9 @@ def main() -> int:
 
     exit_code = qt_app.exec()
     scriba_app.shutdown()
+    if args.trace is not None:
+        n_events = export_chrome_trace(args.trace)
+        logger.info("latency trace: %d events written to %s", n_events, args.trace)
     return exit_code
 
 
@@ -0,0 +1,215 @@
+"""Growable int16 PCM accumulator shared by every stage that collects audio.
+
+`np.concatenate([buf, new])` per frame -- the pattern `StreamingSession`,
+`UtteranceSegmenter` and `FrameChunker` each used to accumulate audio --
+allocates a fresh array and copies the whole buffer on every 32 ms frame:
+O(n^2) bytes copied over an utterance, and ~30 short-lived allocations per
+second on the hot STT/detector threads. `PcmBuffer` keeps one backing array
+that doubles when full (amortized O(1) append), hands out zero-copy views,
+and trims from the front by moving a start offset (the streaming window's
+and committed-audio trimming's cut), only compacting when an append would
+otherwise have to grow.
+
+`FrameChunker` (capture.py's 512-sample re-framer) and `RingBuffer` (the
+per-device pre-roll ring) live here too, for the same reason as `PcmBuffer`
+itself: this module is deliberately free of `sounddevice`, so the detector
+and STT sides and headless tests/benches can import them without PortAudio.
+capture.py re-exports both.
+"""
+
+import numpy as np
+
+_DEFAULT_CAPACITY = 16000 * 4  # 4 s @ 16 kHz; grows by doubling as needed
+_FRAME_SAMPLES = 512  # Silero's required frame size (capture.py's _BLOCKSIZE)
+_RING_SLACK = 16000 // 4  # 250 ms of extra ring beyond the readable window
+
+
+class PcmBuffer:
+    """Amortized-O(1) append-only int16 sample buffer with cheap front trimming.
+
+    Views returned by `view()` alias the backing array: they stay valid (and
+    unchanged) until the next `append`/`trim_front`/`clear` on this buffer,
+    so consume them synchronously. Anything that crosses a thread boundary
+    must be a copy or come from `take()`.
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY) -> None:
+        self._data = np.empty(max(1, capacity), dtype=np.int16)
+        self._start = 0
+        self._end = 0
+        self.reallocations = 0  # backing-array (re)allocations after construction
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def size(self) -> int:
+        """Number of samples held (ndarray-style alias of `len()`)."""
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return self._data.size
+
+    def view(self) -> np.ndarray:
+        """Zero-copy view of the held samples (see class docstring on lifetime)."""
+        return self._data[self._start : self._end]
+
+    def append(self, samples: np.ndarray) -> None:
+        n = samples.size
+        if n == 0:
+            return
+        if self._end + n > self._data.size:
+            self._make_room(n)
+        self._data[self._end : self._end + n] = samples
+        self._end += n
+
+    def trim_front(self, n: int) -> None:
+        """Drops the oldest `n` samples (all of them if `n >= len(self)`)."""
+        self._start = min(self._start + max(0, n), self._end)
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def clear(self) -> None:
+        self._start = self._end = 0
+
+    def take(self) -> np.ndarray:
+        """Returns the held samples as an array this buffer no longer touches, and empties it.
+
+        Hands over the backing array itself when the contents start at 0 (no
+        copy); the buffer then re-allocates lazily on its next append.
+        """
+        if self._start == 0:
+            out = self._data[: self._end]
+            self._data = np.empty(0, dtype=np.int16)
+        else:
+            out = self.view().copy()
+        self._start = self._end = 0
+        return out
+
+    def _make_room(self, n: int) -> None:
+        held = self._end - self._start
+        needed = held + n
+        if needed <= self._data.size // 2 and self._start:
+            # Plenty of space once the trimmed head is reclaimed: compact in
+            # place rather than grow.
+            self._data[:held] = self._data[self._start : self._end]
+        else:
+            capacity = max(self._data.size, 1)
+            while capacity < needed:
+                capacity *= 2
+            data = np.empty(capacity, dtype=np.int16)
+            data[:held] = self._data[self._start : self._end]
+            self._data = data
+            self.reallocations += 1
+        self._start = 0
+        self._end = held
+
+
+class FrameChunker:
+    """Re-chunks a variable-length sample stream into exact 512-sample frames.
+
+    The native-rate resample path can produce off-by-one frame lengths (e.g. a
+    22050 Hz device's 706-sample block resamples to 513 samples), and Silero
+    VAD hard-requires 512 -- so resampled output is accumulated here and only
+    complete frames are emitted; the remainder carries into the next callback.
+
+    When nothing is carried over (e.g. a 48 kHz device, whose 1536-sample
+    blocks resample to exactly 512), frames are zero-copy views of `samples`
+    -- callers pass a fresh array per call, as `StreamingResampler` makes -- and
+    nothing is allocated. Only when a remainder is carried is it joined with
+    the new samples, in one allocation per call (the old unconditional
+    `np.concatenate`); the remainder itself lives in a preallocated
+    `PcmBuffer` that never grows.
+    """
+
+    def __init__(self, frame_samples: int = _FRAME_SAMPLES):
+        self._frame_samples = frame_samples
+        self._residual = PcmBuffer(frame_samples)
+
+    def push(self, samples: np.ndarray) -> list[np.ndarray]:
+        size = self._frame_samples
+        if len(self._residual):
+            samples = np.concatenate([self._residual.view(), samples])
+            self._residual.clear()
+        n_frames = len(samples) // size
+        self._residual.append(samples[n_frames * size :])
+        return [samples[i * size : (i + 1) * size] for i in range(n_frames)]
+
+
+class RingBuffer:
+    """Fixed-capacity rolling window of the most recent int16 mono samples,
+    written by one thread and read by another without a lock.
+
+    Deviation (user request): this used to take a `threading.Lock` on every
+    `push` -- i.e. in the PortAudio callback, contending with the detector's
+    `get_preroll` -- and `read()` always built a fresh `np.concatenate`.
+    Now it is single-producer/single-consumer: `push` (the device's callback
+    thread only) copies the samples in and then publishes them by advancing
+    a monotonic write index, and readers derive everything from one snapshot
+    of that index.
+
+    The backing array is `capacity + slack` samples but only the newest
+    `capacity` are ever readable, so after a reader snapshots the index the
+    producer can write `slack` more samples (250 ms of audio by default)
+    before it reaches anything the reader may still be looking at.
+    `views()` returns that window as two zero-copy slices (oldest first);
+    they are intact as long as they're consumed well within `slack` --
+    copying them into a `PcmBuffer` is. `read()` is the copying form: the
+    producer announces how far a push will reach before it writes, and
+    `read()` checks that after its copy, dropping any samples the producer
+    lapped meanwhile instead of returning torn audio.
+    """
+
+    def __init__(self, capacity: int, slack: int = _RING_SLACK):
+        self._capacity = max(0, capacity)
+        self._size = self._capacity + max(0, slack) if self._capacity else 0
+        self._buf = np.zeros(self._size, dtype=np.int16)
+        self._written = 0  # samples ever pushed; advanced only after they're in place
+        self._writing = 0  # what `_written` becomes once the push in progress lands
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def write_index(self) -> int:
+        """Total samples pushed so far (monotonic)."""
+        return self._written
+
+    def push(self, samples: np.ndarray) -> None:
+        """Appends `samples`, overwriting the oldest. Producer thread only."""
+        n = len(samples)
+        if self._capacity == 0 or n == 0:
+            return
+        self._writing = self._written + n  # announce before touching any slot
+        kept = samples[-self._size :]
+        pos = (self._written + n - len(kept)) % self._size
+        first = min(len(kept), self._size - pos)
+        self._buf[pos : pos + first] = kept[:first]
+        self._buf[: len(kept) - first] = kept[first:]
+        self._written += n  # publish
+
+    def views(self) -> tuple[np.ndarray, np.ndarray]:
+        """The newest `min(capacity, write_index)` samples as two zero-copy
+        slices, oldest first (the second is empty unless the window wraps)."""
+        return self._views_at(self._written)
+
+    def read(self) -> np.ndarray:
+        """The newest samples as one contiguous copy (see class docstring)."""
+        written = self._written
+        older, newer = self._views_at(written)
+        out = np.concatenate((older, newer))
+        lapped = self._writing - written - (self._size - len(out))
+        return out[lapped:] if lapped > 0 else out
+
+    def _views_at(self, written: int) -> tuple[np.ndarray, np.ndarray]:
+        fill = min(written, self._capacity)
+        if fill == 0:
+            empty = self._buf[:0]
+            return empty, empty
+        start = (written - fill) % self._size
+        end = start + fill
+        if end <= self._size:
+            return self._buf[start:end], self._buf[:0]
+        return self._buf[start:], self._buf[: end - self._size]
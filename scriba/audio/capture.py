@@ -10,6 +10,7 @@ import math
 import queue
 import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import numpy as np
@@ -18,6 +19,8 @@ from scipy.signal import resample_poly
 
 from ..config import Config
 from ..messages import AudioFrame, device_id_for_name
+from .buffer import FrameChunker, RingBuffer
+from .resample import StreamingResampler
 
 logger = logging.getLogger(__name__)
 
@@ -34,45 +37,12 @@ class DeviceInfo:
     enabled: bool
 
 
-class RingBuffer:
-    """Fixed-capacity rolling buffer of the most recent int16 mono samples."""
-
-    def __init__(self, capacity: int):
-        self._capacity = max(0, capacity)
-        self._buf = np.zeros(self._capacity, dtype=np.int16)
-        self._pos = 0
-        self._fill = 0
-        self._lock = threading.Lock()
-
-    def push(self, samples: np.ndarray) -> None:
-        if self._capacity == 0 or len(samples) == 0:
-            return
-        with self._lock:
-            n = len(samples)
-            if n >= self._capacity:
-                self._buf[:] = samples[-self._capacity :]
-                self._pos = 0
-                self._fill = self._capacity
-                return
-            end = self._pos + n
-            if end <= self._capacity:
-                self._buf[self._pos : end] = samples
-            else:
-                first = self._capacity - self._pos
-                self._buf[self._pos :] = samples[:first]
-                self._buf[: n - first] = samples[first:]
-            self._pos = end % self._capacity
-            self._fill = min(self._capacity, self._fill + n)
-
-    def read(self) -> np.ndarray:
-        with self._lock:
-            if self._fill < self._capacity:
-                return self._buf[: self._fill].copy()
-            return np.concatenate([self._buf[self._pos :], self._buf[: self._pos]])
-
-
 def resample_to_16k(pcm: np.ndarray, source_rate: int) -> np.ndarray:
-    """Resample int16 mono `pcm` from `source_rate` to 16 kHz int16 mono."""
+    """Resample int16 mono `pcm` from `source_rate` to 16 kHz int16 mono.
+
+    One-shot: treats `pcm` as the whole signal. Live capture streams use a
+    per-device `StreamingResampler` instead (resample.py).
+    """
     if source_rate == _TARGET_RATE:
         return pcm.astype(np.int16, copy=False)
     gcd = math.gcd(source_rate, _TARGET_RATE)
@@ -84,29 +54,6 @@ def resample_to_16k(pcm: np.ndarray, source_rate: int) -> np.ndarray:
 _device_id = device_id_for_name
 
 
-class FrameChunker:
-    """Re-chunks a variable-length sample stream into exact 512-sample frames.
-
-    The native-rate resample path can produce off-by-one frame lengths (e.g. a
-    22050 Hz device's 706-sample block resamples to 513 samples), and Silero
-    VAD hard-requires 512 -- so resampled output is accumulated here and only
-    complete frames are emitted; the remainder carries into the next callback.
-    """
-
-    def __init__(self, frame_samples: int = _BLOCKSIZE):
-        self._frame_samples = frame_samples
-        self._residual = np.zeros(0, dtype=np.int16)
-
-    def push(self, samples: np.ndarray) -> list[np.ndarray]:
-        buf = np.concatenate([self._residual, samples])
-        n_frames = len(buf) // self._frame_samples
-        self._residual = buf[n_frames * self._frame_samples :]
-        return [
-            buf[i * self._frame_samples : (i + 1) * self._frame_samples]
-            for i in range(n_frames)
-        ]
-
-
 def _best_input_entries() -> dict[str, dict]:
     """Enumerate input-capable devices, deduped by name (preferring WASAPI on Windows).
 
@@ -163,6 +110,10 @@ class AudioCapture:
     """Owns one PortAudio InputStream per enabled device, plus hot-plug polling.
 
     `frame_queue` receives `AudioFrame`s pushed from PortAudio callback threads.
+    `on_device_opened(device_id)` is called after each stream opens (at
+    `start()`, on hot-plug polls and on `refresh_devices()`), outside the
+    device lock -- `ScribaApp` wires it to `Detector.on_device_opened` so the
+    VAD is warm for the new device before its frames need scoring.
     """
 
     def __init__(
@@ -170,10 +121,12 @@ class AudioCapture:
         config: Config,
         frame_queue: "queue.Queue[AudioFrame]",
         poll_interval_s: float = _POLL_INTERVAL_S,
+        on_device_opened: Callable[[str], None] | None = None,
     ):
         self._config = config
         self._frame_queue = frame_queue
         self._poll_interval_s = poll_interval_s
+        self._on_device_opened = on_device_opened
         self._streams: dict[str, sd.InputStream] = {}
         self._prerolls: dict[str, RingBuffer] = {}
         self._lock = threading.Lock()
@@ -195,12 +148,16 @@ class AudioCapture:
             for device_id in list(self._streams):
                 self._close_device(device_id)
 
-    def get_preroll(self, device_id: str) -> np.ndarray:
-        with self._lock:
-            buf = self._prerolls.get(device_id)
+    def get_preroll(self, device_id: str) -> tuple[np.ndarray, ...]:
+        """The device's pre-roll as zero-copy `RingBuffer.views()` pieces,
+        oldest first (none if it isn't open). Takes no lock: the ring is
+        lock-free for its one reader, and a single dict read is atomic --
+        so the detector never waits on a hot-plug poll holding `_lock`
+        while it opens a stream."""
+        buf = self._prerolls.get(device_id)
         if buf is None:
-            return np.zeros(0, dtype=np.int16)
-        return buf.read()
+            return ()
+        return buf.views()
 
     def list_devices(self) -> list[DeviceInfo]:
         return list_devices(self._config.audio.enabled_devices)
@@ -225,12 +182,21 @@ class AudioCapture:
     def _open_matching_devices(self) -> None:
         entries = _best_input_entries()
         enabled_devices = self._config.audio.enabled_devices
+        opened = []
         with self._lock:
             for name, entry in entries.items():
                 device_id = _device_id(name)
                 enabled = not enabled_devices or name in enabled_devices
                 if enabled and device_id not in self._streams:
                     self._open_device(device_id, entry)
+                    if device_id in self._streams:
+                        opened.append(device_id)
+        if self._on_device_opened is not None:
+            for device_id in opened:
+                try:
+                    self._on_device_opened(device_id)
+                except Exception:
+                    logger.exception("device-open hook failed for device %s", device_id)
 
     def _drop_missing_devices(self) -> None:
         present_ids = {_device_id(name) for name in _best_input_entries()}
@@ -341,14 +307,17 @@ class AudioCapture:
                 logger.exception("error closing stream for device %s", device_id)
 
     def _make_callback(self, device_id: str, preroll: RingBuffer, source_rate: int):
-        chunker = FrameChunker() if source_rate != _TARGET_RATE else None
+        # One resampler per stream: its filter history runs across callbacks
+        # (resample.py), and a reopened device starts a fresh one.
+        resampler = StreamingResampler(source_rate) if source_rate != _TARGET_RATE else None
+        chunker = FrameChunker() if resampler is not None else None
 
         def callback(indata, frames, time_info, status):
             if status:
                 logger.warning("stream status for device %s: %s", device_id, status)
             pcm = indata[:, 0]
-            if chunker is not None:
-                out_frames = chunker.push(resample_to_16k(pcm, source_rate))
+            if resampler is not None:
+                out_frames = chunker.push(resampler.push(pcm))
             else:
                 out_frames = [pcm.copy()]
             for frame in out_frames:
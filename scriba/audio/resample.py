@@ -0,0 +1,92 @@
+"""Stateful streaming polyphase resampler for native-rate capture (DESIGN.md §7.1).
+
+`resample_to_16k` (capture.py) runs `scipy.signal.resample_poly` on each
+PortAudio block in isolation: it re-designs the same FIR on every callback,
+treats each block edge as if the signal were zero beyond it (a small
+discontinuity every 32 ms -- exactly the kind of broadband click VAD and
+Whisper both react to), and rounds each block's output length up, so
+e.g. 22.05 kHz blocks came out 513 samples long and the stream slowly
+gained samples relative to real time.
+
+`StreamingResampler` is the same filter -- `resample_poly`'s own Kaiser
+design, so the passband is unchanged -- designed once per device and run as
+one continuous stream: the tail of each block is kept as history for the
+next, and output positions are tracked in absolute sample counts, so the
+output is what resampling the whole recording in one call would give
+(delayed by the filter's group delay, see the class docstring), with no
+per-block rounding.
+Deliberately free of `sounddevice` for the same reason as buffer.py.
+"""
+
+import math
+
+import numpy as np
+from scipy.signal import firwin, upfirdn
+
+_TARGET_RATE = 16000
+
+
+class StreamingResampler:
+    """Resamples one int16 mono stream from `source_rate` to `target_rate`,
+    block by block, with the filter state carried across blocks.
+
+    Output is causal: it lags the input by the filter's group delay (10
+    output samples, 0.625 ms, from 44.1/48 kHz; 20 from 8 kHz), and its first
+    samples are the filter ringing in from silence. Not trimming that keeps
+    output counts block-aligned -- a 1536-sample 48 kHz block always yields
+    exactly 512 samples, one Silero frame, so `FrameChunker` stays on its
+    zero-copy path. Blocks whose length isn't a whole number of output
+    samples (44.1 kHz) yield one sample more or fewer from block to block;
+    over the stream the count is exact.
+
+    `source_rate == target_rate` passes samples through untouched.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int = _TARGET_RATE):
+        gcd = math.gcd(source_rate, target_rate)
+        self._up, self._down = target_rate // gcd, source_rate // gcd
+        # resample_poly's default design: Kaiser(5.0), cutoff at the lower
+        # Nyquist, 10 zero crossings either side, gain `up`.
+        max_rate = max(self._up, self._down)
+        half_len = 10 * max_rate
+        self._h = (
+            firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)) * self._up
+            if max_rate > 1
+            else None
+        )
+        self._history = np.zeros(0, dtype=np.float32)
+        self._base = 0  # absolute input index of `_history[0]` (a multiple of `down`)
+        self._next_out = 0  # absolute index of the next output sample
+
+    def push(self, samples: np.ndarray) -> np.ndarray:
+        """Resamples the next block of the stream; returns int16 output samples."""
+        if self._h is None:
+            return samples.astype(np.int16, copy=False)
+        up, down = self._up, self._down
+        buf = np.concatenate([self._history, samples.astype(np.float32)])
+        n_end = self._base + len(buf)
+        # Outputs whose filter span ends inside what's been received so far.
+        last_out = (n_end * up - 1) // down
+        if last_out < self._next_out:
+            self._history = buf
+            return np.zeros(0, dtype=np.int16)
+
+        # `buf` starts on a multiple of `down`, so upfirdn's output grid lines
+        # up with the absolute one: its index i is absolute output base*up/down + i.
+        y = upfirdn(self._h, buf, up, down)
+        offset = self._base * up // down
+        out = y[self._next_out - offset : last_out + 1 - offset]
+        self._next_out = last_out + 1
+
+        # Keep only the input the next output's filter span still reaches back to.
+        needed = max(0, -(-(self._next_out * down - (len(self._h) - 1)) // up))
+        new_base = needed // down * down
+        self._history = buf[new_base - self._base :]
+        self._base = new_base
+        return np.clip(np.round(out), -32768, 32767).astype(np.int16)
+
+    def reset(self) -> None:
+        """Starts a new stream (e.g. the device was reopened)."""
+        self._history = np.zeros(0, dtype=np.float32)
+        self._base = 0
+        self._next_out = 0
@@ -0,0 +1,203 @@
+"""`scriba bench` / `python -m scriba.bench` command line (replay harness, see replay.py).
+
+Headless and Windows-free on purpose: nothing here (or in replay.py)
+imports `scriba.app`, `scriba.audio.capture` (PortAudio) or `scriba.inject`
+(Win32), so it runs on a plain Linux CI box. `scriba bench ...` on the
+installed app just dispatches here before any Qt/Win32 setup happens.
+
+Examples::
+
+    python -m scriba.bench --synthetic 3                       # fake STT, no model download
+    python -m scriba.bench take1.wav take2.wav --stt whisper --model tiny
+    python -m scriba.bench --synthetic 3 --set vad.endpoint_silence_ms=400 -o run.json
+    python -m scriba.bench --synthetic 3 --hesitation-s 0.5 --set vad.endpoint_adaptive=true
+    python -m scriba.bench --synthetic 3 --set streaming.partial_model=base   # two-model cascade
+    python -m scriba.bench --micro accumulate                  # one building block, see micro.py
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tomllib
+from dataclasses import asdict
+from pathlib import Path
+
+from ..config import Config, ConfigError, config_from_dict, load_config
+from ..stt.base import SttBackend
+from ..stt.language import model_for_language
+from .micro import MICROBENCHMARKS
+from .replay import FakeSttBackend, run_bench
+from .signals import BenchSignal, load_wav, synthetic_speech
+
+
+def _parse_override(text: str) -> tuple[str, str, object]:
+    """`section.key=value`, with `value` parsed as a TOML value (bare words fall back to str)."""
+    target, sep, raw = text.partition("=")
+    section, dot, key = target.strip().partition(".")
+    if not sep or not dot:
+        raise argparse.ArgumentTypeError(f"expected section.key=value, got {text!r}")
+    try:
+        value = tomllib.loads(f"v = {raw.strip()}")["v"]
+    except tomllib.TOMLDecodeError:
+        value = raw.strip()
+    return section, key, value
+
+
+def _build_config(args: argparse.Namespace) -> Config:
+    config = load_config(args.config) if args.config else Config()
+    raw = asdict(config)
+    for section, key, value in args.overrides:
+        if section not in raw:
+            raise ConfigError(f"unknown config section {section!r}")
+        raw[section][key] = value
+    return config_from_dict(raw)
+
+
+def _build_backend(args: argparse.Namespace, config: Config) -> SttBackend:
+    if args.stt == "fake":
+        return FakeSttBackend(rtf=args.fake_rtf)
+
+    # Imported lazily: faster-whisper/CTranslate2 are slow to import and
+    # unnecessary for --stt fake runs.
+    from ..stt.whisper_local import WhisperLocalBackend
+
+    config.stt.model = args.model or model_for_language(config.general.language)
+    config.stt.device = args.device
+    if args.device == "cpu":
+        config.stt.compute_type = "int8"
+    backend = WhisperLocalBackend(config)
+    backend.load(lambda frac, label: print(f"  {label} {frac * 100:.0f}%", file=sys.stderr))
+    return backend
+
+
+def _build_partial_backend(args: argparse.Namespace, config: Config) -> SttBackend | None:
+    """The `streaming.partial_model` cascade's partial backend, if one is configured.
+
+    With `--stt fake` the model name only switches the cascade on; the
+    partial model is modeled as a cheaper, less accurate `FakeSttBackend`.
+    """
+    if not config.streaming.partial_model:
+        return None
+    if args.stt == "fake":
+        return FakeSttBackend(rtf=args.fake_partial_rtf, word_error_rate=args.fake_partial_wer)
+
+    from ..stt.whisper_local import WhisperLocalBackend
+
+    streaming = config.streaming
+    backend = WhisperLocalBackend(
+        config, model=streaming.partial_model, device=streaming.partial_device
+    )
+    backend.load(
+        lambda frac, label: print(f"  partials: {label} {frac * 100:.0f}%", file=sys.stderr)
+    )
+    return backend
+
+
+def _signals(args: argparse.Namespace) -> list[BenchSignal]:
+    signals = [load_wav(path) for path in args.wavs]
+    signals += [
+        synthetic_speech(
+            n_utterances=3, utterance_s=args.utterance_s, seed=seed, hesitation_s=args.hesitation_s
+        )
+        for seed in range(args.synthetic)
+    ]
+    return signals
+
+
+def _write_report(report: dict, output: Path | None) -> None:
+    text = json.dumps(report, indent=2)
+    if output:
+        output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="scriba bench",
+        description="Replay WAV files or synthetic speech through VAD -> STT -> post-processing "
+        "on a simulated clock and report latency / real-time factor as JSON.",
+    )
+    parser.add_argument("wavs", nargs="*", type=Path, help="16-bit PCM WAV files to replay")
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        metavar="N",
+        help="also replay N synthetic speech-shaped signals (3 utterances each)",
+    )
+    parser.add_argument("--utterance-s", type=float, default=4.0, help="synthetic utterance length")
+    parser.add_argument(
+        "--hesitation-s",
+        type=float,
+        default=0.0,
+        help="add a mid-utterance pause this long to each synthetic utterance",
+    )
+    parser.add_argument("--stt", choices=("fake", "whisper"), default="fake")
+    parser.add_argument("--fake-rtf", type=float, default=0.1, help="modeled RTF for --stt fake")
+    parser.add_argument(
+        "--fake-partial-rtf",
+        type=float,
+        default=0.03,
+        help="modeled RTF of the streaming.partial_model stand-in for --stt fake",
+    )
+    parser.add_argument(
+        "--fake-partial-wer",
+        type=float,
+        default=0.15,
+        help="modeled word error rate of that stand-in (vs. 0 for the final model)",
+    )
+    parser.add_argument("--model", help="--stt whisper model (default: derived from language)")
+    parser.add_argument("--device", choices=("cpu", "cuda", "auto"), default="cpu")
+    parser.add_argument("--config", type=Path, help="config.toml to start from (default: defaults)")
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        type=_parse_override,
+        default=[],
+        metavar="SECTION.KEY=VALUE",
+        help="override one config value, e.g. --set streaming.interval_ms=500 (repeatable)",
+    )
+    parser.add_argument(
+        "--micro",
+        choices=sorted(MICROBENCHMARKS),
+        help="run one microbenchmark (micro.py) instead of a replay",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--debug", action="store_true", help="enable DEBUG logging")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.WARNING,
+        format="%(asctime)s %(levelname)-8s %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    if args.micro:
+        _write_report(MICROBENCHMARKS[args.micro](), args.output)
+        return 0
+
+    signals = _signals(args)
+    if not signals:
+        print(
+            "scriba bench: nothing to replay (pass WAV files and/or --synthetic N)", file=sys.stderr
+        )
+        return 2
+
+    config = _build_config(args)
+    backend = _build_backend(args, config)
+    partial_backend = _build_partial_backend(args, config)
+    report = run_bench(signals, config, backend, partial_backend=partial_backend)
+
+    _write_report(report, args.output)
+    summary = report["summary"]
+    print(
+        f"{summary['utterances']} utterance(s); final latency ms: {summary['final_latency_ms']}",
+        file=sys.stderr,
+    )
+    return 0
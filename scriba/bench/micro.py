@@ -0,0 +1,585 @@
+"""Microbenchmarks for single hot-path building blocks (`scriba bench --micro NAME`).
+
+Where replay.py measures the pipeline end to end, these isolate one
+mechanism and compare it against the pattern it replaced, so a change's
+effect is visible without the noise of a whole replay. Each returns a
+JSON-serializable dict; `MICROBENCHMARKS` maps the CLI name to it.
+"""
+
+import queue
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+from scipy.signal import resample_poly
+
+from ..audio.buffer import FrameChunker, PcmBuffer
+from ..audio.denoise import DELAY_SAMPLES, NoiseGate
+from ..audio.resample import StreamingResampler
+from ..config import Config
+from ..detect.spectral import SpectralFluxVad
+from ..detect.vad import Detector, PerDeviceVad, SileroVadEngine
+from ..messages import AudioFrame
+from ..stt.features import MelFeatureCache
+from .signals import synthetic_speech
+
+_SAMPLE_RATE = 16000
+_FRAME = 512
+
+
+def _measure(fn: Callable[[], None], allocations: int, bytes_copied: int, repeats: int = 5) -> dict:
+    """Best-of-`repeats` wall time and the tracemalloc peak of one `fn()` run,
+    alongside the array allocations / bytes copied the caller counted for it
+    (structural counts, kept out of the timed loop)."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "wall_ms": round(best * 1000, 3),
+        "allocations": allocations,
+        "bytes_copied": bytes_copied,
+        "peak_kib": peak // 1024,
+    }
+
+
+def _chunker_case(block: int, n_blocks: int) -> dict:
+    """`FrameChunker` vs the old unconditional-concatenate re-framer for one block size."""
+    blocks = [np.full(block, i % 100, dtype=np.int16) for i in range(n_blocks)]
+
+    def concat() -> None:
+        residual = np.zeros(0, dtype=np.int16)
+        for samples in blocks:
+            buf = np.concatenate([residual, samples])
+            residual = buf[len(buf) // _FRAME * _FRAME :]
+
+    def chunker() -> None:
+        framer = FrameChunker()
+        for samples in blocks:
+            framer.push(samples)
+
+    # Old: one array per push holding remainder + block. New: the same join,
+    # but only on pushes that start with a carried remainder.
+    concat_bytes = joins = join_bytes = residual = 0
+    for _ in blocks:
+        concat_bytes += 2 * (residual + block)
+        if residual:
+            joins += 1
+            join_bytes += 2 * (residual + block)
+        residual = (residual + block) % _FRAME
+    return {
+        "concatenate": _measure(concat, n_blocks, concat_bytes),
+        "frame_chunker": _measure(chunker, 1 + joins, join_bytes),
+    }
+
+
+def accumulate(utterance_s: float = 30.0) -> dict:
+    """Per-utterance cost of collecting audio: `np.concatenate` vs `PcmBuffer`.
+
+    `session`: the streaming session's utterance buffer, one 512-sample
+    frame appended at a time (the segmenter's pre-confirm buffer is the same
+    pattern, just shorter). `frame_chunker_*`: re-framing resampled device
+    callbacks into 512-sample frames -- 48 kHz blocks land on exactly 512,
+    22.05 kHz ones on 513 (a remainder carried on every push).
+    """
+    n_frames = int(utterance_s * _SAMPLE_RATE / _FRAME)
+    frames = [np.full(_FRAME, i % 100, dtype=np.int16) for i in range(n_frames)]
+
+    def session_concat() -> None:
+        buf = np.zeros(0, dtype=np.int16)
+        for frame in frames:
+            buf = np.concatenate([buf, frame])
+
+    session_buf = PcmBuffer()
+
+    def session_buffer() -> None:
+        nonlocal session_buf
+        session_buf = PcmBuffer((15 + 1) * _SAMPLE_RATE)
+        for frame in frames:
+            session_buf.append(frame)
+
+    session_buffer()
+    return {
+        "utterance_s": utterance_s,
+        "frames": n_frames,
+        "session": {
+            "concatenate": _measure(
+                session_concat, n_frames, sum(2 * _FRAME * (i + 1) for i in range(n_frames))
+            ),
+            "pcm_buffer": _measure(
+                session_buffer, 1 + session_buf.reallocations, 2 * _FRAME * n_frames
+            ),
+        },
+        "frame_chunker_48k": _chunker_case(512, n_frames),
+        "frame_chunker_22k": _chunker_case(513, n_frames),
+    }
+
+
+def vad_batch(audio_s: float = 10.0, max_devices: int = 4) -> dict:
+    """Detector VAD cost vs device count: one batch-1 Silero run per device
+    per tick (the old per-device `SileroVad`s) vs one batched run per tick.
+
+    Reported as VAD CPU (wall) ms per second of audio; the time the detector
+    spends per 32 ms tick is `ms_per_audio_s * 0.032`. Needs the Silero
+    model (downloaded on first use); reports it as unavailable otherwise.
+    """
+    try:
+        sequential = SileroVadEngine()
+        sequential.load()
+    except Exception as exc:  # any download/onnxruntime failure
+        return {"error": f"Silero VAD unavailable: {exc}"}
+    batched = SileroVadEngine(session=sequential.session)  # one session, two state sets
+
+    n_ticks = int(audio_s * _SAMPLE_RATE / _FRAME)
+    rng = np.random.default_rng(0)
+    pcm = (rng.standard_normal((n_ticks, _FRAME)) * 3000).astype(np.int16)
+    results: dict[str, dict] = {}
+    for n_devices in range(1, max_devices + 1):
+        ticks = [[AudioFrame(f"dev{d}", frame, 0.0) for d in range(n_devices)] for frame in pcm]
+
+        def per_device(engine=sequential, ticks=ticks) -> None:
+            for tick in ticks:
+                for frame in tick:
+                    engine.process([frame])
+
+        def one_batch(engine=batched, ticks=ticks) -> None:
+            for tick in ticks:
+                engine.process(tick)
+
+        case = {}
+        for name, fn in (("per_device", per_device), ("batched", one_batch)):
+            best = float("inf")
+            for _ in range(3):
+                t0 = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - t0)
+            case[name] = {"ms_per_audio_s": round(best * 1000 / audio_s, 3)}
+        case["runs_per_tick"] = {"per_device": n_devices, "batched": 1}
+        results[f"{n_devices}_devices"] = case
+    return {"audio_s": audio_s, "devices": results}
+
+
+def frame_features(n_frames: int = 2000) -> dict:
+    """Per-frame feature cost on the detector side: before, RMS in float64
+    and the VAD's own float32 conversion / normalization / context
+    concatenate, per frame per device; after, `AudioFrame` derives float32
+    samples, RMS and peak once (on the capture thread) and the batched VAD
+    copies `samples` straight into its input tensor.
+
+    `detector_thread` is what still runs on the detector thread per frame;
+    `capture_thread` is the `AudioFrame` construction moved off it.
+    """
+    rng = np.random.default_rng(0)
+    pcm = [(rng.standard_normal(_FRAME) * 3000).astype(np.int16) for _ in range(n_frames)]
+    frames = [AudioFrame("dev", p, 0.0) for p in pcm]
+    context = np.zeros((1, 64), dtype=np.float32)
+    x = np.empty((1, 64 + _FRAME), dtype=np.float32)
+
+    def before() -> None:
+        for p in pcm:
+            float(np.sqrt(np.mean(p.astype(np.float64) ** 2)))
+            chunk = p.astype(np.float32).reshape(1, _FRAME) / 32768.0
+            np.concatenate([context, chunk], axis=1)
+
+    def after_detector() -> None:
+        level = 0.0
+        for frame in frames:
+            level = max(level, frame.rms)
+            x[0, 64:] = frame.samples
+
+    def after_capture() -> None:
+        for p in pcm:
+            AudioFrame("dev", p, 0.0)
+
+    return {
+        "frames": n_frames,
+        # float64 copy + its square + float32 copy + its scaled copy + the concatenate
+        "before": _measure(before, 5 * n_frames, n_frames * _FRAME * (8 + 8 + 4 + 4 + 4)),
+        "after": {
+            "detector_thread": _measure(after_detector, 0, n_frames * _FRAME * 4),
+            "capture_thread": _measure(after_capture, n_frames, n_frames * _FRAME * 4),
+        },
+    }
+
+
+def _resample_case(rate: int, audio_s: float) -> dict:
+    block = round(rate * _FRAME / _SAMPLE_RATE)  # capture.py's native blocksize
+    t = np.arange(int(rate * audio_s)) / rate
+    rng = np.random.default_rng(0)
+    signal = (np.sin(2 * np.pi * 440 * t) * 8000 + rng.standard_normal(t.size) * 300).astype(
+        np.int16
+    )
+    blocks = [signal[i : i + block] for i in range(0, signal.size, block)]
+    gcd = np.gcd(rate, _SAMPLE_RATE)
+    up, down = _SAMPLE_RATE // gcd, rate // gcd
+    reference = resample_poly(signal.astype(np.float32), up, down)
+    delay = 10 * max(up, down) // down  # StreamingResampler's group delay, in output samples
+
+    def per_block() -> list[np.ndarray]:
+        return [
+            np.clip(np.round(resample_poly(b.astype(np.float32), up, down)), -32768, 32767).astype(
+                np.int16
+            )
+            for b in blocks
+        ]
+
+    def streaming() -> list[np.ndarray]:
+        resampler = StreamingResampler(rate)
+        return [resampler.push(b) for b in blocks]
+
+    case = {}
+    for name, fn, lag in (("per_block", per_block, 0), ("streaming", streaming, delay)):
+        best = float("inf")
+        for _ in range(3):
+            t0 = time.perf_counter()
+            out = np.concatenate(fn())
+            best = min(best, time.perf_counter() - t0)
+        # Deviation from resampling the whole signal at once, away from the
+        # signal's own start/end: per-block edge effects show up here.
+        n = min(out.size - lag, reference.size) - 100
+        error = np.abs(out[lag + 100 : lag + n].astype(np.float64) - reference[100:n])
+        case[name] = {
+            "ms_per_audio_s": round(best * 1000 / audio_s, 3),
+            "max_abs_error": round(float(error.max()), 1),
+            "samples_out": int(out.size),
+        }
+    case["samples_expected"] = int(signal.size * up // down)
+    return case
+
+
+def resample(audio_s: float = 10.0) -> dict:
+    """Native-rate capture resampling: `resample_poly` per callback block
+    (old `resample_to_16k` path) vs the per-device `StreamingResampler`.
+
+    `max_abs_error` (int16 units) is each output's deviation from
+    resampling the whole signal in one call -- the per-block version's
+    block-edge discontinuities; the streaming one should only show rounding.
+    `samples_out` vs `samples_expected` shows per-block length rounding.
+    """
+    return {
+        "audio_s": audio_s,
+        "44100": _resample_case(44100, audio_s),
+        "48000": _resample_case(48000, audio_s),
+    }
+
+
+def mel_features(utterance_s: float = 15.0, interval_s: float = 0.8) -> dict:
+    """Feature extraction per streaming pass vs utterance length: faster-whisper's
+    `FeatureExtractor` on the whole buffer (what every pass did) vs the
+    session's `MelFeatureCache`, one pass per `interval_s` of audio.
+
+    `max_abs_error` is the cache's largest deviation from the full
+    extraction over all passes (normalized log-mel units).
+    """
+    # Imported here: the faster_whisper package pulls in CTranslate2, which
+    # the other microbenchmarks don't need.
+    from faster_whisper.feature_extractor import FeatureExtractor
+
+    extractor = FeatureExtractor(feature_size=128)  # large-v3 / turbo / distil-large-v3
+    pcm = (np.random.default_rng(0).standard_normal(int(utterance_s * _SAMPLE_RATE)) * 3000).astype(
+        np.int16
+    )
+    step = int(interval_s * _SAMPLE_RATE)
+    sizes = list(range(step, pcm.size + 1, step))
+    full_s = [float("inf")] * len(sizes)
+    cached_s = [float("inf")] * len(sizes)
+    error = 0.0
+    for _ in range(3):
+        cache = MelFeatureCache(extractor.mel_filters)
+        for i, size in enumerate(sizes):
+            t0 = time.perf_counter()
+            reference = extractor(pcm[:size].astype(np.float32) / 32768.0)
+            t1 = time.perf_counter()
+            features = cache.features(pcm[:size])
+            t2 = time.perf_counter()
+            full_s[i] = min(full_s[i], t1 - t0)
+            cached_s[i] = min(cached_s[i], t2 - t1)
+            error = max(error, float(np.abs(features - reference).max()))
+    return {
+        "interval_s": interval_s,
+        "passes": [
+            {
+                "audio_s": round(size / _SAMPLE_RATE, 2),
+                "full_ms": round(full * 1000, 3),
+                "cached_ms": round(cached * 1000, 3),
+            }
+            for size, full, cached in zip(sizes, full_s, cached_s, strict=True)
+        ],
+        "total_ms": {
+            "full": round(sum(full_s) * 1000, 2),
+            "cached": round(sum(cached_s) * 1000, 2),
+        },
+        "max_abs_error": error,
+    }
+
+
+def denoise(strength: float = 0.8, noise_dbfs: float = -32.0, interval_s: float = 0.8) -> dict:
+    """`NoiseGate` (once per frame, detector thread) vs the `noisereduce` pass
+    it replaced (whole buffer, before every streaming decode pass), on
+    `synthetic_speech` under pink-ish noise plus a 100 Hz hum.
+
+    The gate sees every frame and learns from the ground-truth gaps (what a
+    perfect VAD would call non-speech); the old denoiser sees each
+    utterance's decode buffer -- 400 ms pre-roll to 600 ms of endpoint
+    silence -- growing by `interval_s` per pass. CPU is per second of audio
+    each one handles. `speech_rms` is output over clean RMS inside the
+    speech spans (1.0 = level preserved), `snr_db` the signal-to-residual
+    ratio there against the clean signal, `gap_rms` what's left of the
+    noise between utterances (gate only: the old one never saw the gaps).
+    """
+    # Only this baseline still uses noisereduce; keep it off the other benchmarks' imports.
+    import noisereduce
+
+    signal = synthetic_speech(n_utterances=3, noise_dbfs=-120.0, seed=1)
+    clean = signal.pcm.astype(np.float32) / 32768.0
+    rng = np.random.default_rng(5)
+    white = rng.standard_normal(clean.size)
+    pink = np.cumsum(white)
+    pink -= np.convolve(pink, np.ones(400) / 400, mode="same")
+    hum = np.sin(2 * np.pi * 100 * np.arange(clean.size) / _SAMPLE_RATE)
+    noise = 0.6 * pink / pink.std() + 0.4 * white + 0.5 * hum
+    noise *= 10 ** (noise_dbfs / 20) / noise.std()
+    pcm = np.clip(np.rint((clean + noise) * 32768), -32768, 32767).astype(np.int16)
+    noisy = pcm.astype(np.float32) / 32768.0
+    speech = np.zeros(clean.size, dtype=bool)
+    for start, end in signal.speech_spans:
+        speech[int(start * _SAMPLE_RATE) : int(end * _SAMPLE_RATE)] = True
+
+    def rms(samples: np.ndarray) -> float:
+        return float(np.sqrt(np.mean(samples**2)))
+
+    def quality(out: np.ndarray) -> dict:
+        residual = out[speech] - clean[speech]
+        return {
+            "speech_rms": round(rms(out[speech]) / rms(clean[speech]), 3),
+            "snr_db": round(
+                float(10 * np.log10(np.sum(clean[speech] ** 2) / np.sum(residual**2))), 2
+            ),
+        }
+
+    gate = NoiseGate(strength)
+    n_frames = pcm.size // _FRAME
+    gated = np.zeros_like(noisy)
+    for i in range(n_frames):
+        frame = AudioFrame("bench", pcm[i * _FRAME : (i + 1) * _FRAME], 0.0)
+        gated[i * _FRAME : (i + 1) * _FRAME] = gate.process(
+            frame.samples, not speech[i * _FRAME : (i + 1) * _FRAME].any()
+        )
+    gated = np.concatenate([gated[DELAY_SAMPLES:] / 32768.0, np.zeros(DELAY_SAMPLES)])
+    gaps = ~speech
+    gaps[:_SAMPLE_RATE] = False  # while the profile is still being learned
+
+    reduced = noisy.copy()
+    old_s = old_final_s = old_audio_s = 0.0
+    step = int(interval_s * _SAMPLE_RATE)
+    for start, end in signal.speech_spans:
+        lo = int((start - 0.4) * _SAMPLE_RATE)
+        hi = int((end + 0.6) * _SAMPLE_RATE)
+        old_audio_s += (hi - lo) / _SAMPLE_RATE
+        for pass_end in [*range(lo + step, hi, step), hi]:
+            t0 = time.perf_counter()
+            out = noisereduce.reduce_noise(
+                y=noisy[lo:pass_end], sr=_SAMPLE_RATE, stationary=False, prop_decrease=0.3
+            )
+            pass_s = time.perf_counter() - t0
+            old_s += pass_s
+        old_final_s += pass_s
+        reduced[lo:hi] = out
+
+    audio_s = n_frames * _FRAME / _SAMPLE_RATE
+    return {
+        "noise_dbfs": noise_dbfs,
+        "input": quality(noisy),
+        "noise_gate": {
+            "strength": strength,
+            "cpu_ms_per_audio_s": round(gate.process_s / audio_s * 1000, 2),
+            **quality(gated),
+            "gap_rms": round(rms(gated[gaps]) / rms(noisy[gaps]), 3),
+        },
+        "per_pass_noisereduce": {
+            "prop_decrease": 0.3,
+            "cpu_ms_per_audio_s": round(old_s / old_audio_s * 1000, 2),
+            "final_pass_only_cpu_ms_per_audio_s": round(old_final_s / old_audio_s * 1000, 2),
+            **quality(reduced),
+        },
+    }
+
+
+class _LevelVad:
+    """Stand-in single-stream VAD for `locked_vad` when Silero can't load:
+    a level threshold, so arbitration and segmentation behave, at no cost."""
+
+    def reset(self) -> None:
+        pass
+
+    def process_frame(self, pcm: np.ndarray) -> float:
+        return 0.9 if np.abs(pcm).max() > 1500 else 0.1
+
+
+def locked_vad(audio_s: float = 60.0, max_devices: int = 4) -> dict:
+    """Detector CPU vs device count during continuous dictation, with the
+    losing devices scored on every frame (the old behavior) vs skipped while
+    the arbiter's winner is locked (`vad.skip_losing_devices`).
+
+    Every device hears the same speech at a different level, with its own
+    noise. Reported per second of audio: detector wall ms, and the VAD rows
+    scored (one row = one device's frame through Silero, whether alone or
+    in a batch) -- including the pre-roll replays that resync the skipped
+    devices when each utterance closes. Without the Silero model the rows
+    are still exact but the wall time covers only the detector itself.
+    """
+    try:
+        silero = SileroVadEngine()
+        silero.load()
+        vad_name = "silero"
+    except Exception as exc:  # any download/onnxruntime failure
+        silero = None
+        vad_name = f"level stand-in (Silero unavailable: {type(exc).__name__})"
+    speech = synthetic_speech(
+        n_utterances=max(1, int(audio_s / 6.5)), utterance_s=6.0, gap_s=0.5, lead_s=0.5
+    ).pcm.astype(np.float64)
+    n_ticks = speech.size // _FRAME
+    preroll_frames = Config().vad.pre_roll_ms * _SAMPLE_RATE // 1000 // _FRAME + 1
+    rng = np.random.default_rng(0)
+    results: dict[str, dict] = {}
+    for n_devices in range(1, max_devices + 1):
+        devices = [f"dev{d}" for d in range(n_devices)]
+        streams = [
+            np.clip(speech * (1.0 - 0.15 * d) + rng.normal(0, 60, speech.size), -32768, 32767)
+            .astype(np.int16)[: n_ticks * _FRAME]
+            .reshape(n_ticks, _FRAME)
+            for d in range(n_devices)
+        ]
+        case: dict[str, dict] = {}
+        for name, skip in (("score_all", False), ("skip_losers", True)):
+            config = Config()
+            config.vad.skip_losing_devices = skip
+            engine = (
+                SileroVadEngine(session=silero.session)
+                if silero is not None
+                else PerDeviceVad(_LevelVad)
+            )
+            rows = 0
+            process = engine.process
+
+            def counted(frames, process=process):
+                nonlocal rows
+                rows += len(frames)
+                return process(frames)
+
+            engine.process = counted  # type: ignore[method-assign]
+            history = {d: [] for d in devices}
+            detector = Detector(
+                config,
+                queue.Queue(),
+                queue.Queue(),
+                lambda d, history=history: tuple(history[d][-preroll_frames:]),
+                vad=engine,
+            )
+            t0 = time.perf_counter()
+            for tick in range(n_ticks):
+                frames = []
+                for device, stream in zip(devices, streams, strict=True):
+                    history[device].append(stream[tick])
+                    frames.append(AudioFrame(device, stream[tick], tick * _FRAME / _SAMPLE_RATE))
+                detector.process_frames(frames)
+            elapsed = time.perf_counter() - t0
+            seconds = n_ticks * _FRAME / _SAMPLE_RATE
+            case[name] = {
+                "ms_per_audio_s": round(elapsed * 1000 / seconds, 3),
+                "vad_rows_per_audio_s": round(rows / seconds, 1),
+            }
+        results[f"{n_devices}_devices"] = case
+    return {
+        "audio_s": round(n_ticks * _FRAME / _SAMPLE_RATE, 1),
+        "vad": vad_name,
+        "devices": results,
+    }
+
+
+def _speech_frames(signal) -> np.ndarray:
+    """Ground truth per frame: its centre falls inside one of `speech_spans`."""
+    centres = (np.arange(signal.pcm.size // _FRAME) + 0.5) * _FRAME / _SAMPLE_RATE
+    truth = np.zeros(centres.size, dtype=bool)
+    for start, end in signal.speech_spans:
+        truth |= (centres >= start) & (centres < end)
+    return truth
+
+
+def vad_backends(noise_dbfs: tuple[float, ...] = (-55.0, -40.0, -30.0), seeds: int = 3) -> dict:
+    """Frame-level agreement and CPU of the `vad.backend`s on synthetic speech.
+
+    For each noise level, every backend scores the same signals frame by
+    frame; reported are its agreement with the ground-truth speech spans
+    (`accuracy`, plus the false-alarm rate on non-speech frames and the
+    miss rate on speech frames, at `vad.threshold`), its agreement with
+    Silero, and its wall ms per second of audio. Spans include the short
+    gaps between syllables, and a backend's hold after the last syllable
+    counts as false alarms, so neither backend reaches 1.0. Silero needs
+    its model (downloaded on first use) and is left out without it.
+
+    The spectral VAD's weights were fitted on these very signals, so its
+    ground-truth numbers here flatter it; `agreement_with_silero` is the
+    number to accept a change to those weights on.
+    """
+    threshold = Config().vad.threshold
+    backends: dict[str, Callable[[], object]] = {"spectral": SpectralFluxVad}
+    try:
+        silero = SileroVadEngine()
+        silero.load()
+        backends = {"silero": lambda: SileroVadEngine(session=silero.session), **backends}
+        note = None
+    except Exception as exc:  # any download/onnxruntime failure
+        note = f"Silero VAD unavailable: {type(exc).__name__}"
+    results: dict[str, dict] = {}
+    for noise in noise_dbfs:
+        signals = [
+            synthetic_speech(n_utterances=4, noise_dbfs=noise, seed=seed) for seed in range(seeds)
+        ]
+        truth = np.concatenate([_speech_frames(signal) for signal in signals])
+        audio_s = sum(signal.duration_s for signal in signals)
+        decisions: dict[str, np.ndarray] = {}
+        case: dict[str, dict] = {}
+        for name, factory in backends.items():
+            probs = []
+            elapsed = 0.0
+            for signal in signals:
+                backend = factory()
+                frames = [
+                    AudioFrame("mic", signal.pcm[i * _FRAME : (i + 1) * _FRAME], 0.0)
+                    for i in range(signal.pcm.size // _FRAME)
+                ]
+                t0 = time.perf_counter()
+                probs += [backend.process([frame])[0] for frame in frames]  # type: ignore[attr-defined]
+                elapsed += time.perf_counter() - t0
+            speech = decisions[name] = np.array(probs) >= threshold
+            case[name] = {
+                "accuracy": round(float(np.mean(speech == truth)), 3),
+                "false_alarm": round(float(np.mean(speech[~truth])), 3),
+                "miss": round(float(np.mean(~speech[truth])), 3),
+                "ms_per_audio_s": round(elapsed * 1000 / audio_s, 3),
+            }
+        if "silero" in decisions:
+            case["spectral"]["agreement_with_silero"] = round(
+                float(np.mean(decisions["spectral"] == decisions["silero"])), 3
+            )
+        results[f"{noise:g}_dbfs"] = case
+    return {"threshold": threshold, "note": note, "noise": results}
+
+
+MICROBENCHMARKS: dict[str, Callable[[], dict]] = {
+    "accumulate": accumulate,
+    "vad_batch": vad_batch,
+    "frame_features": frame_features,
+    "resample": resample,
+    "mel_features": mel_features,
+    "denoise": denoise,
+    "locked_vad": locked_vad,
+    "vad_backends": vad_backends,
+}
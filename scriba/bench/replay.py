@@ -0,0 +1,625 @@
+"""Offline replay of the capture -> VAD -> STT -> post-processing path on a simulated clock.
+
+Feeds a `BenchSignal` through the real `Detector` (one synthetic device, one
+512-sample `AudioFrame` every 32 ms of *signal* time), the real
+`StreamingSession` and the real `run_pipeline`, and measures the latencies
+DESIGN.md §6 budgets for but nothing measured before: end-of-speech ->
+final text, first partial, partial cadence, and per-stage real-time factor.
+
+Simulated clock: the detector side advances in lockstep with the signal
+(frame `i` is "delivered" at the end of its 32 ms), while the STT side is
+modeled as the single-owner worker thread it is in `ScribaApp._stt_loop` --
+it only picks up a chunk once the chunk exists *and* the worker is free,
+and every decode/post-processing call advances its clock by the wall time
+it actually took (plus `FakeSttBackend`'s modeled cost). So a backend that
+can't keep up shows up as queueing delay on later chunks and late finals,
+exactly like the live app, while the run itself takes only as long as the
+decodes do. Injection is not modeled (it needs a Windows foreground window).
+"""
+
+import logging
+import queue
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+from ..config import Config
+from ..detect.base import VadBackend
+from ..detect.vad import Detector, PerDeviceVad, SileroVad, load_vad_backend, vad_backend
+from ..messages import AudioChunk, AudioFrame, PostprocState, Transcript, WordTiming
+from ..stt.base import SttBackend
+from ..stt.language import resolve_language
+from ..stt.scheduler import RtfTracker
+from ..stt.streaming import StreamingSession, coalesce_chunks
+from ..text.pipeline import run_pipeline
+from .signals import SAMPLE_RATE, BenchSignal
+
+logger = logging.getLogger(__name__)
+
+_DEVICE_ID = "bench"
+_FRAME_SAMPLES = 512
+_FRAME_S = _FRAME_SAMPLES / SAMPLE_RATE
+_TAIL_PAD_S = 0.5  # extra silence after the endpoint window so the last utterance closes
+_PAUSE_RMS = 32768 * 10 ** (-50 / 20)  # FakeSttBackend's "pause" level
+
+_FAKE_WORDS = (
+    "the quick brown fox jumps over the lazy dog while scriba types every word "
+    "it hears into whatever window currently has focus"
+).split()
+
+
+class SimClock:
+    """The STT worker's simulated time, in seconds of signal time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+
+class FakeSttBackend:
+    """Deterministic `SttBackend` double with a modeled decode cost.
+
+    Emits `words_per_s` words per second of decoded audio from a fixed word
+    list (so consecutive streaming passes extend each other the way a real
+    model's do), and reports a simulated cost of `overhead_s + rtf * audio_s`
+    per decode, which the replay clock charges on top of the (near-zero)
+    real wall time. Lets the harness run anywhere, with no model download.
+
+    A decode primed with `initial_prompt` continues the word list after the
+    prompt's words, and `word_timestamps=True` spaces the words evenly over
+    the buffer -- enough for `streaming.trim_committed` to behave (and
+    produce the same text) as it would on a real model.
+
+    Like Whisper, it closes the text with a period when the buffer ends in
+    a pause (the last `pause_s` below -50 dBFS RMS) -- whether the speaker
+    is done or only hesitating, which is what `vad.endpoint_adaptive` has
+    to be measured against.
+
+    `word_error_rate > 0` stands in for a smaller model: that fraction of
+    word positions come out as a different word, the same one on every
+    pass (so partials stay stable among themselves and only disagree with
+    an error-free final) -- the `streaming.partial_model` cascade's churn.
+    """
+
+    def __init__(
+        self,
+        rtf: float = 0.1,
+        overhead_s: float = 0.02,
+        words_per_s: float = 2.5,
+        pause_s: float = 0.15,
+        word_error_rate: float = 0.0,
+    ):
+        self.rtf = rtf
+        self.overhead_s = overhead_s
+        self.words_per_s = words_per_s
+        self.pause_s = pause_s
+        self.word_error_rate = word_error_rate
+
+    def load(self, progress_cb: Callable[[float, str], None]) -> None:
+        progress_cb(1.0, "ready")
+
+    def unload(self) -> None:
+        pass
+
+    @property
+    def descriptor(self) -> str:
+        wer = f"-wer{self.word_error_rate:g}" if self.word_error_rate else ""
+        return f"fake-rtf{self.rtf:g}{wer}/none/sim"
+
+    def _word(self, index: int) -> str:
+        # Knuth multiplicative hash of the position: a fixed, well-spread
+        # subset of positions is misheard.
+        misheard = (index * 2654435761) % 2**32 < self.word_error_rate * 2**32
+        return _FAKE_WORDS[(index * 7 + 3 if misheard else index) % len(_FAKE_WORDS)]
+
+    def simulated_cost_s(self, n_samples: int) -> float:
+        return self.overhead_s + self.rtf * n_samples / SAMPLE_RATE
+
+    def transcribe(
+        self,
+        pcm: np.ndarray,
+        language: str | None,
+        hotwords: str | None = None,
+        initial_prompt: str | None = None,
+        word_timestamps: bool = False,
+        final: bool = False,
+    ) -> Transcript:
+        duration_s = pcm.size / SAMPLE_RATE
+        n_words = int(duration_s * self.words_per_s)
+        offset = len(initial_prompt.split()) if initial_prompt else 0
+        words = [self._word(offset + i) for i in range(n_words)]
+        tail = pcm[-int(self.pause_s * SAMPLE_RATE) :].astype(np.float32)
+        if words and float(np.sqrt(np.mean(tail**2))) < _PAUSE_RMS:
+            words[-1] += "."
+        if words and not offset:
+            words[0] = words[0].capitalize()  # sentence-cased, as Whisper's output is
+        step = 1.0 / self.words_per_s
+        return Transcript(
+            text=" ".join(words),
+            avg_logprob=-0.2,
+            no_speech_prob=0.05,
+            duration_s=duration_s,
+            language=language or "en",
+            words=(
+                [WordTiming(w, i * step, (i + 0.8) * step) for i, w in enumerate(words)]
+                if word_timestamps
+                else []
+            ),
+        )
+
+
+@dataclass
+class _DecodeRecord:
+    wall_s: float
+    cost_s: float
+    audio_s: float
+
+
+class _TimedBackend:
+    """Wraps the real backend: charges each decode to the `SimClock` and records it."""
+
+    def __init__(self, inner: SttBackend, clock: SimClock) -> None:
+        self._inner = inner
+        self._clock = clock
+        self.decodes: list[_DecodeRecord] = []
+
+    def load(self, progress_cb: Callable[[float, str], None]) -> None:
+        self._inner.load(progress_cb)
+
+    def unload(self) -> None:
+        self._inner.unload()
+
+    @property
+    def descriptor(self) -> str:
+        return self._inner.descriptor
+
+    def transcribe(
+        self,
+        pcm: np.ndarray,
+        language: str | None,
+        hotwords: str | None = None,
+        initial_prompt: str | None = None,
+        **extra: object,
+    ) -> Transcript:
+        t0 = time.perf_counter()
+        transcript = self._inner.transcribe(
+            pcm, language, hotwords=hotwords, initial_prompt=initial_prompt, **extra
+        )
+        wall_s = time.perf_counter() - t0
+        cost_s = wall_s
+        if isinstance(self._inner, FakeSttBackend):
+            cost_s += self._inner.simulated_cost_s(pcm.size)
+        self._clock.now += cost_s
+        self.decodes.append(_DecodeRecord(wall_s, cost_s, pcm.size / SAMPLE_RATE))
+        return transcript
+
+
+class _RecordingVad:
+    """Wraps the detector's VAD engine, recording every probability and the wall time spent.
+    Frames the energy pre-gate kept from the engine are recorded as probability 0.
+    `fallback`: a Silero engine that fails to load is replaced by the spectral
+    VAD, as `Detector` does for its own (the wrapper hides it from the detector)."""
+
+    def __init__(
+        self, inner: VadBackend, probs: list[float], timing: list[float], fallback: bool = False
+    ) -> None:
+        self._inner = inner
+        self._probs = probs
+        self._timing = timing
+        self._fallback = fallback
+
+    def load(self) -> None:
+        self._inner = load_vad_backend(self._inner, self._fallback)
+
+    def prewarm(self, batch_size: int = 1) -> None:
+        self._inner.prewarm(batch_size)
+
+    def reset(self, device_id: str | None = None) -> None:
+        self._inner.reset(device_id)
+
+    def skip(self, frames: Sequence[AudioFrame]) -> None:
+        self._inner.skip(frames)
+        self._probs.extend(0.0 for _ in frames)
+
+    def process(self, frames: Sequence[AudioFrame]) -> list[float]:
+        t0 = time.perf_counter()
+        probs = self._inner.process(frames)
+        self._timing.append(time.perf_counter() - t0)
+        self._probs.extend(probs)
+        return probs
+
+
+@dataclass
+class UtteranceTrace:
+    """Everything the harness measured for one utterance; times are signal seconds."""
+
+    utterance_id: int
+    speech_onset_s: float
+    speech_end_s: float | None = None
+    endpoint_s: float | None = None
+    partial_emits_s: list[float] = field(default_factory=list)
+    first_partial_s: float | None = None
+    final_emit_s: float | None = None
+    final_text: str | None = None
+    audio_s: float = 0.0
+    postproc_wall_s: float = 0.0
+    partials_skipped: int = 0
+    speculative_hits: int = 0
+    speculative_misses: int = 0
+    buffered_audio_s: float = 0.0  # audio the decode passes would have decoded untrimmed
+    decoded_audio_s: float = 0.0  # ...and what they decoded (stt.trim_silence)
+    typed_text: str = ""  # what the revision protocol (§7.4a) has typed so far
+    partial_backspaces: int = 0  # erased by one partial revising another
+    final_backspaces: int = 0  # erased by the final revising the last partial
+    escalation: str = ""  # why the final pass was re-decoded with beam search, if it was
+    escalation_ms: float = 0.0  # ...and that re-decode's wall time
+
+    def to_report(self) -> dict:
+        cadence = np.diff(self.partial_emits_s) if len(self.partial_emits_s) > 1 else []
+        return {
+            "utterance_id": self.utterance_id,
+            "speech_onset_s": round(self.speech_onset_s, 3),
+            "speech_end_s": _round(self.speech_end_s),
+            "endpoint_s": _round(self.endpoint_s),
+            "endpoint_wait_ms": _ms(self.endpoint_s, self.speech_end_s),
+            "audio_s": round(self.audio_s, 3),
+            "final_latency_ms": _ms(self.final_emit_s, self.speech_end_s),
+            "first_partial_latency_ms": _ms(self.first_partial_s, self.speech_onset_s),
+            "partials": len(self.partial_emits_s),
+            "partials_skipped": self.partials_skipped,
+            "speculative_hits": self.speculative_hits,
+            "speculative_misses": self.speculative_misses,
+            "decoded_audio_s": round(self.decoded_audio_s, 3),
+            "trimmed_audio_s": round(self.buffered_audio_s - self.decoded_audio_s, 3),
+            "partial_backspaces": self.partial_backspaces,
+            "final_backspaces": self.final_backspaces,
+            "beam_escalation": self.escalation or None,
+            "beam_escalation_ms": round(self.escalation_ms, 1) if self.escalation else None,
+            "partial_cadence_ms": _round(float(np.mean(cadence)) * 1000 if len(cadence) else None),
+            "final_text": self.final_text,
+        }
+
+
+def _round(value: float | None, digits: int = 3) -> float | None:
+    return None if value is None else round(value, digits)
+
+
+def _ms(later: float | None, earlier: float | None) -> float | None:
+    if later is None or earlier is None:
+        return None
+    return round((later - earlier) * 1000, 1)
+
+
+class _SimSttWorker:
+    """`ScribaApp._stt_loop` on the simulated clock: session lifecycle + pipeline timing."""
+
+    def __init__(
+        self,
+        backend: _TimedBackend,
+        config: Config,
+        clock: SimClock,
+        traces: dict[int, UtteranceTrace],
+        on_text: Callable[[int, str], None] | None = None,
+        partial_backend: _TimedBackend | None = None,
+    ) -> None:
+        self._backend = backend
+        self._partial_backend = partial_backend
+        self._config = config
+        self._clock = clock
+        self._traces = traces
+        self._on_text = on_text
+        self._pending: deque[AudioChunk] = deque()
+        self._session: StreamingSession | None = None
+        self._active_id: int | None = None
+        self._postproc_state = PostprocState()
+        self._rtf_tracker = RtfTracker()
+
+    def submit(self, chunk: AudioChunk) -> None:
+        self._pending.append(chunk)
+
+    def advance(self, until: float) -> None:
+        """Processes queued chunks that exist by `until`, while the worker is free by then.
+
+        Like `_stt_loop`, each time the worker frees up it drains every chunk
+        that exists at that moment and feeds them coalesced.
+        """
+        while self._pending and self._pending[0].t_monotonic <= until and self._clock.now <= until:
+            self._clock.now = max(self._clock.now, self._pending[0].t_monotonic)
+            batch = []
+            while self._pending and self._pending[0].t_monotonic <= self._clock.now:
+                batch.append(self._pending.popleft())
+            for chunk in coalesce_chunks(batch):
+                self._feed(chunk)
+
+    def _feed(self, chunk: AudioChunk) -> None:
+        if chunk.utterance_id != self._active_id:
+            chunk.language = resolve_language(self._config.general.language, None, self._config.stt)
+            self._active_id = chunk.utterance_id
+            self._session = StreamingSession(
+                self._backend,
+                self._config,
+                emit=self._on_transcript,
+                rtf_tracker=self._rtf_tracker,
+                clock=lambda: self._clock.now,
+                on_text=self._on_text,
+                partial_backend=self._partial_backend,
+            )
+        assert self._session is not None
+        self._session.feed(chunk)
+        if chunk.is_final:
+            trace = self._traces[chunk.utterance_id]
+            trace.partials_skipped = self._session.cadence.skipped_behind
+            trace.speculative_hits = self._session.speculation.hits
+            trace.speculative_misses = self._session.speculation.misses
+            trace.buffered_audio_s = self._session.trim.buffered_s
+            trace.decoded_audio_s = self._session.trim.decoded_s
+            self._session = None
+            self._active_id = None
+
+    def _on_transcript(self, transcript: Transcript) -> None:
+        trace = self._traces[transcript.utterance_id]
+        if transcript.is_partial:
+            trace.partial_emits_s.append(self._clock.now)
+            if trace.first_partial_s is None and transcript.text.strip():
+                trace.first_partial_s = self._clock.now
+            trace.partial_backspaces += _retype(trace, " ".join(transcript.text.split()))
+            return
+        t0 = time.perf_counter()
+        jobs, self._postproc_state = run_pipeline(
+            transcript, self._postproc_state, self._config, None
+        )
+        trace.postproc_wall_s = time.perf_counter() - t0
+        self._clock.now += trace.postproc_wall_s
+        trace.final_emit_s = self._clock.now
+        trace.final_text = "".join(job.text for job in jobs)
+        trace.final_backspaces = _retype(trace, trace.final_text)
+        trace.audio_s = transcript.duration_s
+        trace.escalation = transcript.escalation
+        trace.escalation_ms = transcript.escalation_ms
+
+
+def _retype(trace: UtteranceTrace, text: str) -> int:
+    """`_RevisionTracker.diff_job` (app.py): backspaces needed to turn the
+    typed text into `text`; records `text` as typed."""
+    common = 0
+    for typed_char, new_char in zip(trace.typed_text, text, strict=False):
+        if typed_char != new_char:
+            break
+        common += 1
+    erase = len(trace.typed_text) - common
+    trace.typed_text = text
+    return erase
+
+
+def replay_signal(
+    signal: BenchSignal,
+    config: Config,
+    backend: SttBackend,
+    vad_factory: Callable[[], SileroVad] | None = None,
+    partial_backend: SttBackend | None = None,
+) -> dict:
+    """Runs one signal through detector + streaming STT + pipeline; returns its report dict.
+
+    `vad_factory` swaps the `vad.backend` engine for a single-stream stand-in
+    (tests; anywhere the Silero model can't be downloaded). `partial_backend`
+    runs the partial passes (`streaming.partial_model`), on the same
+    simulated worker as the final ones -- one STT thread, as in the app.
+    """
+    longest_endpoint_ms = max(config.vad.endpoint_silence_ms, config.vad.endpoint_incomplete_ms)
+    tail = np.zeros(int((longest_endpoint_ms / 1000 + _TAIL_PAD_S) * SAMPLE_RATE), dtype=np.int16)
+    pcm = np.concatenate([signal.pcm, tail])
+    n_frames = pcm.size // _FRAME_SAMPLES
+    pre_roll_samples = round(config.vad.pre_roll_ms * SAMPLE_RATE / 1000)
+
+    probs: list[float] = []
+    vad_timing: list[float] = []
+    clock = SimClock()
+    timed_backend = _TimedBackend(backend, clock)
+    timed_partial = _TimedBackend(partial_backend, clock) if partial_backend is not None else None
+    traces: dict[int, UtteranceTrace] = {}
+    # Pass text for the adaptive endpoint, as (signal time it exists, utterance, text):
+    # the detector only sees it once the decode that produced it has finished.
+    texts: deque[tuple[float, int, str]] = deque()
+    worker = _SimSttWorker(
+        timed_backend,
+        config,
+        clock,
+        traces,
+        on_text=lambda utterance_id, text: texts.append((clock.now, utterance_id, text)),
+        partial_backend=timed_partial,
+    )
+
+    # AudioCapture pushes each frame into the pre-roll ring *before* queueing
+    # it, so at trigger time the ring ends with the frame being processed.
+    position = 0
+    last_preroll_len = 0
+
+    def get_preroll(_device_id: str) -> np.ndarray:
+        nonlocal last_preroll_len
+        preroll = pcm[max(0, position - pre_roll_samples) : position]
+        last_preroll_len = preroll.size
+        return preroll
+
+    chunk_queue: queue.Queue[AudioChunk] = queue.Queue()
+    detector = Detector(
+        config,
+        queue.Queue(),
+        chunk_queue,
+        get_preroll,
+        vad=_RecordingVad(
+            PerDeviceVad(vad_factory) if vad_factory is not None else vad_backend(config.vad),
+            probs,
+            vad_timing,
+            fallback=vad_factory is None and config.vad.backend == "silero",
+        ),
+    )
+    detector.prewarm()  # as the app does: session setup isn't part of the measured VAD cost
+
+    threshold = config.vad.threshold
+    for i in range(n_frames):
+        position = (i + 1) * _FRAME_SAMPLES
+        frame_end_s = position / SAMPLE_RATE
+        frame = AudioFrame(_DEVICE_ID, pcm[i * _FRAME_SAMPLES : position], frame_end_s)
+        while texts and texts[0][0] <= frame_end_s:
+            _t, utterance_id, text = texts.popleft()
+            detector.observe_text(utterance_id, text)
+        detector.process_frame(frame)
+        while not chunk_queue.empty():
+            chunk = chunk_queue.get_nowait()
+            if chunk.utterance_id not in traces:
+                n_pending = (chunk.pcm.size - last_preroll_len) // _FRAME_SAMPLES
+                onset_frame = i - n_pending + 1
+                traces[chunk.utterance_id] = UtteranceTrace(
+                    chunk.utterance_id, speech_onset_s=onset_frame * _FRAME_S
+                )
+            if chunk.is_final:
+                trace = traces[chunk.utterance_id]
+                trace.endpoint_s = frame_end_s
+                last_speech = next((j for j in range(i, -1, -1) if probs[j] >= threshold), None)
+                if last_speech is not None:
+                    trace.speech_end_s = (last_speech + 1) * _FRAME_S
+            worker.submit(chunk)
+        worker.advance(until=frame_end_s)
+    worker.advance(until=float("inf"))
+
+    # An endpoint inside a ground-truth speech span cut one spoken utterance in two.
+    premature_cuts = (
+        sum(
+            any(start < t.endpoint_s < end for start, end in signal.speech_spans)
+            for t in traces.values()
+            if t.endpoint_s is not None
+        )
+        if signal.speech_spans
+        else None
+    )
+
+    partial_decodes = timed_partial.decodes if timed_partial is not None else []
+    decodes = timed_backend.decodes + partial_decodes
+    decode_audio_s = sum(d.audio_s for d in decodes)
+    utterance_audio_s = sum(t.audio_s for t in traces.values())
+    return {
+        "name": signal.name,
+        "duration_s": round(signal.duration_s, 3),
+        "expected_utterances": len(signal.speech_spans) or None,
+        "premature_cuts": premature_cuts,
+        "utterances": [traces[k].to_report() for k in sorted(traces)],
+        "vad_inferences": len(probs) - detector.gated_frames,
+        "vad_gated": detector.gated_frames,
+        "decodes": len(decodes),
+        "partial_model_decodes": len(partial_decodes),
+        "decode_audio_s": round(decode_audio_s, 3),
+        "rtf": {
+            "vad": _rtf(sum(vad_timing), signal.duration_s),
+            "stt": _rtf(sum(d.wall_s for d in decodes), decode_audio_s),
+            "stt_simulated": _rtf(sum(d.cost_s for d in decodes), decode_audio_s),
+            "postproc": _rtf(sum(t.postproc_wall_s for t in traces.values()), utterance_audio_s),
+        },
+    }
+
+
+def _rtf(wall_s: float, audio_s: float) -> float | None:
+    return round(wall_s / audio_s, 5) if audio_s > 0 else None
+
+
+def _distribution(values: list[float]) -> dict | None:
+    if not values:
+        return None
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        "mean": round(float(arr.mean()), 1),
+        "p50": round(float(np.percentile(arr, 50)), 1),
+        "p90": round(float(np.percentile(arr, 90)), 1),
+        "max": round(float(arr.max()), 1),
+    }
+
+
+def run_bench(
+    signals: list[BenchSignal],
+    config: Config,
+    backend: SttBackend,
+    vad_factory: Callable[[], SileroVad] | None = None,
+    partial_backend: SttBackend | None = None,
+) -> dict:
+    """Replays every signal and aggregates a JSON-serializable report.
+
+    The full effective `config` is embedded so two runs (e.g. before/after a
+    commit, or with a different `vad.endpoint_silence_ms`) can be diffed
+    directly; `summary` holds the headline latency distributions in ms.
+    """
+    results = [
+        replay_signal(signal, config, backend, vad_factory, partial_backend) for signal in signals
+    ]
+    utterances = [u for r in results for u in r["utterances"]]
+
+    def collect(key: str) -> list[float]:
+        return [u[key] for u in utterances if u[key] is not None]
+
+    hits = sum(u["speculative_hits"] for u in utterances)
+    misses = sum(u["speculative_misses"] for u in utterances)
+    cuts = [r["premature_cuts"] for r in results if r["premature_cuts"] is not None]
+    escalation_ms = collect("beam_escalation_ms")
+    decoded_s = sum(u["decoded_audio_s"] for u in utterances)
+    trimmed_s = sum(u["trimmed_audio_s"] for u in utterances)
+
+    return {
+        "backend": backend.descriptor,
+        "partial_backend": partial_backend.descriptor if partial_backend is not None else None,
+        "config": asdict(config),
+        "signals": results,
+        "summary": {
+            "utterances": len(utterances),
+            "final_latency_ms": _distribution(collect("final_latency_ms")),
+            "first_partial_latency_ms": _distribution(collect("first_partial_latency_ms")),
+            "partial_cadence_ms": _distribution(collect("partial_cadence_ms")),
+            # Endpoint silence actually waited (speech end -> endpoint), against
+            # endpoints that fired mid-utterance (synthetic signals only): the
+            # trade-off vad.endpoint_adaptive makes.
+            "endpoint": {
+                "wait_ms": _distribution(collect("endpoint_wait_ms")),
+                "premature_cuts": sum(cuts) if cuts else None,
+            },
+            # Revision churn (§7.4a): characters backspaced by partials revising
+            # each other, and by the final revising the last partial -- what a
+            # weaker streaming.partial_model costs.
+            "backspaces": {
+                "partials": sum(u["partial_backspaces"] for u in utterances),
+                "final": sum(u["final_backspaces"] for u in utterances),
+            },
+            # Speculative final passes (stt.speculative_final): a miss is one
+            # wasted decode, a hit is a final decode taken off the critical path.
+            "speculative_final": {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+            },
+            # Decode input saved by stt.trim_silence, over every pass: the
+            # pre-roll, endpoint silence (and, with max_pause_ms, long pauses)
+            # no longer decoded.
+            "silence_trim": {
+                "decoded_s": round(decoded_s, 3),
+                "saved_s": round(trimmed_s, 3),
+                "saved_fraction": (
+                    round(trimmed_s / (decoded_s + trimmed_s), 3) if decoded_s + trimmed_s else None
+                ),
+            },
+            # VAD runs saved by the energy pre-gate (vad.energy_gate_db):
+            # frames at the noise floor while nothing was in progress.
+            "vad_gate": {
+                "inferences": sum(r["vad_inferences"] for r in results),
+                "gated": sum(r["vad_gated"] for r in results),
+            },
+            # Final passes re-decoded with beam search (stt.escalate_*): how
+            # often, and the extra wall time, per escalation and averaged over
+            # every final pass.
+            "beam_escalation": {
+                "escalated": len(escalation_ms),
+                "rate": round(len(escalation_ms) / len(utterances), 3) if utterances else None,
+                "cost_ms": _distribution(escalation_ms),
+                "mean_cost_per_final_ms": (
+                    round(sum(escalation_ms) / len(utterances), 1) if utterances else None
+                ),
+            },
+        },
+    }
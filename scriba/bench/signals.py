@@ -0,0 +1,124 @@
+"""Bench inputs: WAV loading and synthetic speech-shaped signals (int16 mono @ 16 kHz).
+
+Both return the same `BenchSignal` shape the replay harness consumes.
+`speech_spans` is ground truth for synthetic signals and empty for WAV files
+(the harness then derives speech boundaries from the VAD's own per-frame
+probabilities instead).
+"""
+
+import math
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from scipy.signal import resample_poly
+
+SAMPLE_RATE = 16000
+
+
+@dataclass
+class BenchSignal:
+    name: str
+    pcm: np.ndarray  # int16 mono @ 16 kHz
+    speech_spans: list[tuple[float, float]] = field(default_factory=list)  # seconds
+
+    @property
+    def duration_s(self) -> float:
+        return self.pcm.size / SAMPLE_RATE
+
+
+def load_wav(path: Path) -> BenchSignal:
+    """Reads a PCM WAV file, downmixing to mono and resampling to 16 kHz as needed.
+
+    Uses the stdlib `wave` module, so only uncompressed PCM (8/16/32-bit) is
+    supported -- which is what any recorder's "save as WAV" produces.
+    """
+    with wave.open(str(path), "rb") as wav:
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        rate = wav.getframerate()
+        raw = wav.readframes(wav.getnframes())
+
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) * 256.0
+    elif width == 2:
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32)
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype=np.int32).astype(np.float32) / 65536.0
+    else:
+        raise ValueError(f"{path}: unsupported sample width {width * 8} bits")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE:
+        gcd = math.gcd(rate, SAMPLE_RATE)
+        samples = resample_poly(samples, SAMPLE_RATE // gcd, rate // gcd)
+    pcm = np.clip(np.round(samples), -32768, 32767).astype(np.int16)
+    return BenchSignal(name=Path(path).name, pcm=pcm)
+
+
+def _syllable(rng: np.random.Generator, duration_s: float, f0: float) -> np.ndarray:
+    """One voiced "syllable": a jittered harmonic stack under a raised-cosine envelope."""
+    n = int(duration_s * SAMPLE_RATE)
+    t = np.arange(n) / SAMPLE_RATE
+    pitch = f0 * (1.0 + 0.08 * np.sin(2 * np.pi * rng.uniform(2.0, 5.0) * t))
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    tone = np.zeros(n)
+    for harmonic in range(1, 9):
+        # crude formant shaping: energy peaks around 500 Hz and 1.5 kHz
+        freq = harmonic * f0
+        gain = np.exp(-(((freq - 500) / 300) ** 2)) + 0.6 * np.exp(-(((freq - 1500) / 400) ** 2))
+        tone += (gain + 0.05) * np.sin(harmonic * phase)
+    envelope = 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n) / max(n - 1, 1))
+    return tone * envelope
+
+
+def synthetic_speech(
+    n_utterances: int = 3,
+    utterance_s: float = 4.0,
+    gap_s: float = 1.5,
+    lead_s: float = 1.0,
+    noise_dbfs: float = -55.0,
+    seed: int = 0,
+    hesitation_s: float = 0.0,
+) -> BenchSignal:
+    """Speech-shaped test signal: `n_utterances` bursts of syllables separated by silence.
+
+    Not intelligible speech (there's no TTS dependency to lean on), so the
+    words an STT backend produces from it mean nothing -- but its 3-6 Hz
+    syllable rhythm, short intra-word gaps and voiced harmonic structure
+    exercise VAD segmentation, the streaming cadence and endpointing the way
+    real dictation does, deterministically per `seed`.
+
+    `hesitation_s > 0` adds one pause of that length halfway through each
+    utterance -- the speaker stopping to think mid-sentence. It stays inside
+    the utterance's `speech_spans` entry: an endpoint there is a premature cut.
+    """
+    rng = np.random.default_rng(seed)
+    pieces: list[np.ndarray] = [np.zeros(int(lead_s * SAMPLE_RATE))]
+    spans: list[tuple[float, float]] = []
+    cursor = pieces[0].size
+    for _ in range(n_utterances):
+        start = cursor
+        f0 = rng.uniform(110.0, 210.0)
+        target = int(utterance_s * SAMPLE_RATE)
+        hesitate = hesitation_s > 0
+        while cursor - start < target:
+            syllable = _syllable(rng, rng.uniform(0.12, 0.28), f0)
+            pause = np.zeros(int(rng.uniform(0.03, 0.12) * SAMPLE_RATE))
+            if hesitate and cursor - start >= target // 2:
+                pause = np.zeros(int(hesitation_s * SAMPLE_RATE))
+                target += pause.size  # on top of `utterance_s` of speech
+                hesitate = False
+            pieces += [syllable, pause]
+            cursor += syllable.size + pause.size
+        spans.append((start / SAMPLE_RATE, (cursor - pause.size) / SAMPLE_RATE))
+        gap = np.zeros(int(gap_s * SAMPLE_RATE))
+        pieces.append(gap)
+        cursor += gap.size
+
+    signal = np.concatenate(pieces)
+    signal *= 0.3 / max(float(np.max(np.abs(signal))), 1e-9)
+    signal += rng.normal(0.0, 10 ** (noise_dbfs / 20), signal.size)
+    pcm = np.clip(np.round(signal * 32767), -32768, 32767).astype(np.int16)
+    return BenchSignal(name=f"synthetic-{seed}", pcm=pcm, speech_spans=spans)
@@ -42,7 +42,10 @@ def adaptation_dir() -> Path:
 
 _GENERAL_MODES = {"push_to_talk", "toggle", "wake_word"}
 _LANGUAGES = {"en", "de", "auto", "mixed"}
+_VAD_BACKENDS = {"silero", "spectral"}
 _STT_DEVICES = {"auto", "cuda", "cpu"}
+_STT_STANDBY = {"warm", "download"}
+_STT_IDLE_TIERS = {"small", "cache", "unload"}
 _STT_BACKENDS = {"local", "aws"}
 _INJECT_METHODS = {"type", "paste"}
 _STREAMING_POLICIES = {"eager", "stable"}
@@ -69,15 +72,45 @@ class AudioConfig:
     # (see the note): falls back to the sounddevice path per-device if the
     # WASAPI open fails, so worst case is no different from before.
     wasapi_speech_category: bool = True
+    # Bounded pipeline queues (scriba/queues.py; user request): frames
+    # queued for the detector, all devices together (128 = 4 s of one mic,
+    # 1 s of four). Past it, the oldest frame of a device that isn't the
+    # locked winner is dropped first, then the oldest frame.
+    frame_queue_max: int = 128
 
 
 @dataclass
 class VadConfig:
+    # "silero" (ONNX, ~2 MB model download) or "spectral": the pure-NumPy
+    # spectral-flux VAD (detect/spectral.py; user request), which is also
+    # what "silero" falls back to when its model can't be loaded. Its
+    # weights were hand-fitted on synthetic speech, so with "spectral" the
+    # thresholds below (and vad.threshold itself) are provisional: tuned
+    # against Silero's probabilities, not the spectral VAD's, until
+    # `scriba bench --micro vad_backends` shows them agreeing on real audio.
+    backend: str = "silero"
     threshold: float = 0.5
     endpoint_silence_ms: int = 600
+    # Adaptive endpoint (detect/endpoint.py; user request): choose the
+    # required silence from how the latest partial's text ends -- shorter
+    # after a complete sentence or a trailing "period"/"new line" command,
+    # longer after a filler or dangling "and". Needs text during the wait:
+    # streaming partials and/or stt.speculative_final. Opt-in until measured
+    # on real speech (a period Whisper puts at a mid-thought pause cuts it).
+    endpoint_adaptive: bool = False
+    endpoint_complete_ms: int = 300
+    endpoint_incomplete_ms: int = 1000
     pre_roll_ms: int = 400
     min_speech_ms: int = 250
     max_utterance_s: int = 30
+    # While one mic holds an utterance (MicArbiter's sticky winner), don't
+    # VAD-score the others; their state is rebuilt from their pre-roll when
+    # the utterance closes (detect/vad.py Detector; user request).
+    skip_losing_devices: bool = True
+    # Energy pre-gate (detect/pregate.py; user request): while no utterance
+    # is in progress, frames within this many dB of the device's adaptive
+    # noise floor skip the VAD (probability 0). 0 scores every frame.
+    energy_gate_db: float = 3.0
 
 
 @dataclass
@@ -107,16 +140,53 @@ class SttConfig:
     # minutes with dictation disabled; reloads on next activation. 0 disables
     # idle-unload (model stays resident forever once loaded).
     idle_unload_minutes: int = 60
-    # Spectral-gating background-noise suppression on the audio buffer right
-    # before each decode pass (user request: background noise hurt accuracy
-    # noticeably more than it does for Windows' own dictation). ~20-60ms
-    # overhead per decode on this machine, negligible against the latency
-    # budget (DESIGN §6). Default OFF: at full strength this measurably
-    # gutted real speech (a VAD-trimmed utterance buffer is almost all
-    # signal, with no long quiet stretch for the algorithm to calibrate
-    # against, so it over-gates) -- confirmed live, dictation produced
-    # nothing at all, even shouting. Kept opt-in until tuned further.
+    # What idle-unload keeps (stt/residency.py; user request): "unload"
+    # (default) frees everything; "small" (opt-in) keeps a small int8 CPU
+    # model loaded (~200 MB RAM) so dictation works the moment it's
+    # re-enabled, while this model reloads in the background and takes over
+    # at the next utterance; "cache" (opt-in) keeps the model files in the OS
+    # page cache so the reload skips the disk.
+    idle_tier: str = "unload"
+    # What a background thread does with the next fallback rung (§9) while a
+    # CUDA rung is active (whisper_local.py; user request): "download"
+    # (default) only makes sure its files are on disk; a CUDA OOM then loses
+    # that utterance while the thread loads and installs the rung, never
+    # the STT thread. "warm" (opt-in) also loads and warms it and keeps it
+    # resident, so the OOM swap is instant and the utterance is retried --
+    # at the cost of a second model copy in RAM (~1.5 GB for the CPU int8
+    # rung) for the whole session, OOM or not.
+    standby: str = "download"
+    # Spectral-gating background-noise suppression (user request: background
+    # noise hurt accuracy noticeably more than it does for Windows' own
+    # dictation). Runs once per captured frame on the detector thread, with
+    # a noise profile learned from the frames VAD scores as non-speech
+    # (audio/denoise.py); the STT thread only sees cleaned audio. Default
+    # OFF: the per-pass noisereduce it replaced gutted real speech at full
+    # strength (no quiet stretch in a VAD-trimmed buffer to calibrate from),
+    # and the streaming gate hasn't been tried live yet.
     denoise: bool = False
+    # Attenuation of spectral bins at the learned noise floor: 1.0 removes them.
+    denoise_strength: float = 0.8
+    # Start the final decode partway into the endpoint silence instead of
+    # after vad.endpoint_silence_ms, and use it if the endpoint confirms
+    # (StreamingSession; user request).
+    speculative_final: bool = True
+    speculative_after_ms: int = 160  # of endpoint silence; 0 = at the first silent frame
+    # Decode only from trim_guard_ms before the first VAD-speech frame in the
+    # buffer to trim_guard_ms after the last, dropping pre-roll and endpoint
+    # silence (StreamingSession; user request). max_pause_ms > 0 also
+    # shortens longer internal pauses to that length; 0 keeps them.
+    trim_silence: bool = True
+    trim_guard_ms: int = 200
+    max_pause_ms: int = 0
+    # Confidence-gated beam search (user request): partial passes always
+    # decode greedily; the final pass decodes with beam_size first and is
+    # re-decoded with escalate_beam_size only when that result crosses one
+    # of the thresholds below (whisper_local.py). 1 = never escalate.
+    escalate_beam_size: int = 5
+    escalate_logprob_below: float = -0.5
+    escalate_no_speech_above: float = 0.4
+    escalate_compression_above: float = 2.0
 
 
 @dataclass
@@ -130,6 +200,20 @@ class StreamingConfig:
     policy: str = "eager"
     interval_ms: int = 800
     window_s: int = 15
+    trim_committed: bool = False
+    adaptive: bool = True
+    # Two-model cascade (user request): a smaller model (e.g. "base", "small")
+    # for the partial passes; the final pass keeps stt.model. "" = stt.model
+    # for both. partial_device: where it runs ("cpu" leaves the GPU to the
+    # final pass).
+    partial_model: str = ""
+    partial_device: str = "cpu"
+    # Keep the utterance's log-mel features across passes and transform only
+    # new audio (stt/features.py; user request).
+    feature_cache: bool = True
+    # Chunks queued for the STT worker; past it, queued chunks of the same
+    # utterance are merged (scriba/queues.py), never dropped.
+    chunk_queue_max: int = 64
 
 
 @dataclass
@@ -145,6 +229,9 @@ class InjectConfig:
     method: str = "type"
     per_char_delay_ms: int = 2
     per_app: dict[str, str] = field(default_factory=dict)
+    # Jobs queued for the injector; past it, queued partial jobs are folded
+    # into the next job of their utterance (scriba/queues.py).
+    queue_max: int = 32
 
 
 @dataclass
@@ -199,16 +286,30 @@ def _validate(config: Config) -> None:
         raise ConfigError(
             f"general.language must be one of {_LANGUAGES}, got {config.general.language!r}"
         )
+    if config.vad.backend not in _VAD_BACKENDS:
+        raise ConfigError(f"vad.backend must be one of {_VAD_BACKENDS}, got {config.vad.backend!r}")
     if not 0.0 < config.vad.threshold < 1.0:
         raise ConfigError(f"vad.threshold must be in (0, 1), got {config.vad.threshold}")
     if config.vad.endpoint_silence_ms <= 0:
         raise ConfigError("vad.endpoint_silence_ms must be positive")
+    if config.vad.endpoint_complete_ms <= 0:
+        raise ConfigError("vad.endpoint_complete_ms must be positive")
+    if config.vad.endpoint_incomplete_ms <= 0:
+        raise ConfigError("vad.endpoint_incomplete_ms must be positive")
     if config.vad.pre_roll_ms < 0:
         raise ConfigError("vad.pre_roll_ms must be >= 0")
     if config.vad.min_speech_ms < 0:
         raise ConfigError("vad.min_speech_ms must be >= 0")
     if config.vad.max_utterance_s <= 0:
         raise ConfigError("vad.max_utterance_s must be positive")
+    if config.vad.energy_gate_db < 0:
+        raise ConfigError("vad.energy_gate_db must be >= 0")
+    if config.audio.frame_queue_max < 1:
+        raise ConfigError("audio.frame_queue_max must be >= 1")
+    if config.streaming.chunk_queue_max < 1:
+        raise ConfigError("streaming.chunk_queue_max must be >= 1")
+    if config.inject.queue_max < 1:
+        raise ConfigError("inject.queue_max must be >= 1")
     if not 0.0 < config.wake_word.threshold < 1.0:
         raise ConfigError(
             f"wake_word.threshold must be in (0, 1), got {config.wake_word.threshold}"
@@ -229,6 +330,31 @@ def _validate(config: Config) -> None:
         raise ConfigError("stt.language_confidence_min must be in (0, 1)")
     if config.stt.idle_unload_minutes < 0:
         raise ConfigError("stt.idle_unload_minutes must be >= 0")
+    if config.stt.speculative_after_ms < 0:
+        raise ConfigError("stt.speculative_after_ms must be >= 0")
+    if config.stt.trim_guard_ms < 0:
+        raise ConfigError("stt.trim_guard_ms must be >= 0")
+    if config.stt.max_pause_ms < 0:
+        raise ConfigError("stt.max_pause_ms must be >= 0")
+    if config.stt.idle_tier not in _STT_IDLE_TIERS:
+        raise ConfigError(
+            f"stt.idle_tier must be one of {_STT_IDLE_TIERS}, got {config.stt.idle_tier!r}"
+        )
+    if config.stt.standby not in _STT_STANDBY:
+        raise ConfigError(f"stt.standby must be one of {_STT_STANDBY}, got {config.stt.standby!r}")
+    if not 0.0 <= config.stt.denoise_strength <= 1.0:
+        raise ConfigError("stt.denoise_strength must be in [0, 1]")
+    if config.stt.escalate_beam_size < 1:
+        raise ConfigError("stt.escalate_beam_size must be >= 1")
+    if not 0.0 <= config.stt.escalate_no_speech_above <= 1.0:
+        raise ConfigError("stt.escalate_no_speech_above must be in [0, 1]")
+    if config.stt.escalate_compression_above <= 0:
+        raise ConfigError("stt.escalate_compression_above must be positive")
+    if config.streaming.partial_device not in _STT_DEVICES:
+        raise ConfigError(
+            f"streaming.partial_device must be one of {_STT_DEVICES}, "
+            f"got {config.streaming.partial_device!r}"
+        )
     if config.streaming.policy not in _STREAMING_POLICIES:
         raise ConfigError(
             f"streaming.policy must be one of {_STREAMING_POLICIES}, "
@@ -278,13 +404,20 @@ enabled_devices = []           # empty = all input devices
 device_priority = []           # optional ordered list of preferred device names
 wasapi_speech_category = true  # raw WASAPI capture requesting AudioCategory_Speech;
                                 # falls back to sounddevice per-device if unavailable
+frame_queue_max = 128          # frames awaiting the VAD; past it, losing mics' go first
 
 [vad]
+backend = "silero"             # silero | spectral (pure NumPy, no download; silero's fallback)
 threshold = 0.5
 endpoint_silence_ms = 600
+endpoint_adaptive = false      # pick the endpoint silence from the partial text's ending
+endpoint_complete_ms = 300     # ...after "done." / a trailing "period"/"new line" command
+endpoint_incomplete_ms = 1000  # ...after a filler or a dangling "and"/"the"/","
 pre_roll_ms = 400
 min_speech_ms = 250
 max_utterance_s = 30
+skip_losing_devices = true     # don't VAD-score the other mics while one holds an utterance
+energy_gate_db = 3.0           # idle frames this close to the noise floor skip the VAD; 0 = off
 
 [wake_word]
 model = "hey_jarvis"           # until custom "hey scriba" is trained
@@ -303,7 +436,19 @@ languages = ["en", "de"]       # candidate set for language = "mixed"
 language_confidence_min = 0.6  # below this, fall back to languages[0]
 initial_prompt = ""            # optional decoder priming, see DESIGN §7.10(a)
 idle_unload_minutes = 60       # unload model to free host RAM after this long disabled; 0 = never
+idle_tier = "unload"           # ...keeping: unload | small (CPU model, instant wake) | cache
+standby = "download"           # next fallback rung on CUDA OOM: download (files only) | warm
 denoise = false                # background-noise suppression, opt-in
+denoise_strength = 0.8         # ...attenuation at the learned noise floor, 0-1
+speculative_final = true       # run the final decode during the endpoint silence wait
+speculative_after_ms = 160     # ...once this much of it has passed (rides out short pauses)
+trim_silence = true            # don't decode pre-roll/endpoint silence (VAD-scored)
+trim_guard_ms = 200            # ...but keep this much around the speech
+max_pause_ms = 0               # shorten longer internal pauses to this; 0 = keep
+escalate_beam_size = 5         # re-decode an unsure final pass with this beam; 1 = never
+escalate_logprob_below = -0.5  # ...when its avg_logprob is below this,
+escalate_no_speech_above = 0.4 # ...or its no_speech_prob is above this,
+escalate_compression_above = 2.0  # ...or its text compresses better than this (repetition)
 
 [adaptation]
 enabled = false                # "flag last utterance" accent flywheel, DESIGN §7.10(d)
@@ -313,6 +458,12 @@ enabled = true                 # Windows-parity partials, DESIGN §7.4a
 policy = "eager"               # eager | stable
 interval_ms = 800
 window_s = 15
+trim_committed = false         # cut LocalAgreement-committed audio from the re-decode window
+adaptive = true                # stretch/skip partials to what the measured decode speed allows
+partial_model = ""             # smaller model for partials only, e.g. "base"; "" = stt.model
+partial_device = "cpu"         # auto | cuda | cpu, for partial_model
+feature_cache = true           # reuse log-mel features across partial passes
+chunk_queue_max = 64           # chunks awaiting the STT worker; past it, merged per utterance
 
 [postproc]
 filler_removal = true
@@ -323,6 +474,7 @@ blocklist_extra = []
 [inject]
 method = "type"                # type | paste
 per_char_delay_ms = 2
+queue_max = 32                 # jobs awaiting injection; past it, stale partials are folded
 
 [inject.per_app]               # exe name -> method override
 # "someapp.exe" = "paste"
@@ -2,9 +2,10 @@
 
 Multiple enabled microphones all hear the same speech, but exactly one
 stream may feed an utterance -- otherwise the user gets double text. Every
-enabled device runs its own `SileroVad` independently; this module decides,
-once one or more of them cross the speech threshold, which single device
-gets to drive the `UtteranceSegmenter` for that utterance.
+enabled device gets its own Silero VAD state (scored in one batch, vad.py);
+this module decides, once one or more of them cross the speech threshold,
+which single device gets to drive the `UtteranceSegmenter` for that
+utterance.
 """
 
 from dataclasses import dataclass, field
@@ -60,6 +61,16 @@ class MicArbiter:
         self._window_start: float | None = None
         self._candidates: dict[str, _Candidate] = {}
 
+    @property
+    def winner(self) -> str | None:
+        """The locked winning device_id; None while no utterance holds one."""
+        return self._winner
+
+    @property
+    def idle(self) -> bool:
+        """True while no device holds the lock or is competing for it."""
+        return self._winner is None and self._window_start is None
+
     def reset(self) -> None:
         """Unlocks the sticky winner and discards any in-progress arbitration window."""
         self._winner = None
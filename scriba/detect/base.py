@@ -0,0 +1,36 @@
+"""`VadBackend` protocol -- what the `Detector` scores frames with (DESIGN.md §7.2).
+
+Like `SttBackend` (stt/base.py), a structural protocol: implementations
+don't inherit from it. The detector scores every device through one
+backend, one frame per device per `process()` call, so a backend keeps
+whatever per-device state it needs keyed by `AudioFrame.device_id` and
+creates it on a device's first frame.
+
+- `SileroVadEngine` (vad.py): batched Silero ONNX -- the default.
+- `SpectralFluxVad` (spectral.py, user request): pure NumPy, no download;
+  `vad.backend = "spectral"`, and the fallback when Silero can't load.
+- `PerDeviceVad` (vad.py): adapts single-stream stand-ins (tests, bench).
+
+`load()` does any one-off setup (and may download, so may raise);
+`prewarm(n)` additionally readies `n`-wide batches, off the detector
+thread. `skip(frames)` is told about frames the detector didn't score
+(the energy pre-gate, detect/pregate.py) so a backend with temporal
+context can keep it continuous.
+"""
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from ..messages import AudioFrame
+
+
+class VadBackend(Protocol):
+    def load(self) -> None: ...
+
+    def prewarm(self, batch_size: int = 1) -> None: ...
+
+    def reset(self, device_id: str | None = None) -> None: ...
+
+    def skip(self, frames: Sequence[AudioFrame]) -> None: ...
+
+    def process(self, frames: Sequence[AudioFrame]) -> list[float]: ...
@@ -0,0 +1,153 @@
+"""Endpoint predicates: how much trailing silence ends an utterance (DESIGN.md §6, §7.2).
+
+`UtteranceSegmenter` used to end every confirmed utterance after one fixed
+`vad.endpoint_silence_ms` of sub-threshold frames -- the dominant term in
+the §6 latency budget, and the same wait whether the speaker just said
+"...see you tomorrow." or trailed off on "...and, um". The segmenter now
+asks an `EndpointPredicate` on every silent frame instead.
+
+`FixedEndpoint` is the old behavior. `TranscriptEndpoint` (user request,
+`vad.endpoint_adaptive`) also reads the text of the utterance's latest
+decode pass -- streaming partials, and the speculative final pass
+(streaming.py), which lands during the silence wait itself -- and picks
+the required silence from how that text ends (`classify_ending`): a
+syntactically complete ending shortens it to `vad.endpoint_complete_ms`,
+an obviously unfinished one lengthens it to `vad.endpoint_incomplete_ms`,
+anything else keeps `vad.endpoint_silence_ms`.
+
+The text arrives from the STT thread (`observe`) while the detector thread
+polls (`endpoint_reached`); the hand-off is a single tuple attribute
+swapped whole, so neither side takes a lock. Text that hasn't arrived yet
+simply means the default wait -- a slow decode can never make the
+endpoint *later* than the fixed one unless the text says the speaker
+isn't done.
+"""
+
+import logging
+import re
+from typing import Literal, Protocol
+
+from ..config import VadConfig
+from ..text.commands import trailing_command_output
+from ..text.pipeline import FILLER_WORDS
+
+logger = logging.getLogger(__name__)
+
+_FRAME_MS = 512 / 16  # one Silero frame at 16 kHz (vad.py's _FRAME_MS)
+
+Ending = Literal["complete", "incomplete"]
+
+# Words an utterance essentially never ends on: conjunctions, articles,
+# prepositions, EN + DE. Kept to unambiguous ones -- "so" or "da" end real
+# sentences often enough that they'd only cost latency.
+_DANGLING_WORDS = frozenset(
+    """
+    and or but because if than that which whose the a an to of with for from
+    into onto in on at by about as like while although though when whether
+    und oder aber denn weil wenn als dass ob der die das den dem des ein eine
+    einen einem einer zu mit von für auf an in bei nach aus über unter
+    """.split()
+)
+_FILLERS = frozenset(FILLER_WORDS)
+_SENTENCE_END_RE = re.compile(r"[.?!]['\")\]]*$")
+_TRAILING_OFF_RE = re.compile(r"(\.\.\.|…|[,;:\-–—])['\")\]]*$")
+_EDGE_PUNCT = ".,;:!?…\"'()[]-–—"
+
+
+def classify_ending(text: str) -> Ending | None:
+    """Whether `text` ends like a finished utterance, an unfinished one, or
+    neither (None).
+
+    A trailing filler word, dangling conjunction/article/preposition or
+    continuation punctuation (`...`, `,`, `:`) means "incomplete"; it wins
+    over a period, since a partial pass often punctuates "and." before the
+    speaker has carried on. Otherwise sentence-final `.?!`, or a trailing
+    spoken command that ends a sentence or line (text/commands.py:
+    "period", "new line", ...), means "complete"; a trailing "comma" or
+    "colon" command counts as incomplete, like its output.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    last_word = text.split()[-1].strip(_EDGE_PUNCT).lower()
+    if last_word in _FILLERS or last_word in _DANGLING_WORDS:
+        return "incomplete"
+    if _TRAILING_OFF_RE.search(text):
+        return "incomplete"
+    command = trailing_command_output(text)
+    if command is not None:
+        return "incomplete" if command in (",", ":") else "complete"
+    if _SENTENCE_END_RE.search(text):
+        return "complete"
+    return None
+
+
+def _frames(ms: float) -> int:
+    return max(1, round(ms / _FRAME_MS))
+
+
+class EndpointPredicate(Protocol):
+    """What `UtteranceSegmenter` consults to end an utterance on silence."""
+
+    def observe(self, utterance_id: int, text: str) -> None:
+        """The latest decode pass's text for `utterance_id` (any thread)."""
+
+    def endpoint_reached(self, utterance_id: int | None, silence_frames: int) -> bool:
+        """True once `silence_frames` consecutive sub-threshold frames end
+        `utterance_id` (None: a not-yet-confirmed candidate)."""
+        ...
+
+
+class FixedEndpoint:
+    """`vad.endpoint_silence_ms`, whatever was said."""
+
+    def __init__(self, vad_config: VadConfig) -> None:
+        self._frames = _frames(vad_config.endpoint_silence_ms)
+
+    def observe(self, utterance_id: int, text: str) -> None:
+        pass
+
+    def endpoint_reached(self, utterance_id: int | None, silence_frames: int) -> bool:
+        return silence_frames >= self._frames
+
+
+class TranscriptEndpoint:
+    """Required silence chosen from the utterance's latest pass text (module docstring)."""
+
+    def __init__(self, vad_config: VadConfig) -> None:
+        self._default = _frames(vad_config.endpoint_silence_ms)
+        self._by_ending: dict[Ending | None, int] = {
+            "complete": _frames(vad_config.endpoint_complete_ms),
+            "incomplete": _frames(vad_config.endpoint_incomplete_ms),
+            None: self._default,
+        }
+        # (utterance_id, required frames, ending): replaced whole by `observe`.
+        self._latest: tuple[int, int, Ending | None] | None = None
+
+    def observe(self, utterance_id: int, text: str) -> None:
+        ending = classify_ending(text)
+        previous = self._latest
+        if previous is None or previous[0] != utterance_id or previous[2] != ending:
+            logger.debug(
+                "utterance %d: text ends %s -> endpoint after %.0f ms of silence",
+                utterance_id,
+                ending or "neutrally",
+                self._by_ending[ending] * _FRAME_MS,
+            )
+        self._latest = (utterance_id, self._by_ending[ending], ending)
+
+    def required_frames(self, utterance_id: int | None) -> int:
+        latest = self._latest
+        if latest is None or utterance_id is None or latest[0] != utterance_id:
+            return self._default
+        return latest[1]
+
+    def endpoint_reached(self, utterance_id: int | None, silence_frames: int) -> bool:
+        return silence_frames >= self.required_frames(utterance_id)
+
+
+def endpoint_predicate(vad_config: VadConfig) -> EndpointPredicate:
+    """The predicate `vad_config` asks for (`Detector`'s default)."""
+    if vad_config.endpoint_adaptive:
+        return TranscriptEndpoint(vad_config)
+    return FixedEndpoint(vad_config)
@@ -0,0 +1,67 @@
+"""Energy pre-gate in front of the VAD (DESIGN.md §7.2).
+
+The detector scores every frame of every device with Silero, around the
+clock: in a silent room, and with dictation switched off, that's an ONNX
+run every 32 ms per mic that can only ever say "no". `EnergyPreGate`
+(user request) tracks one device's noise floor from the RMS each
+`AudioFrame` already carries and lets the `Detector` skip the run --
+reporting probability 0 -- for frames that sit clearly at that floor.
+
+The floor falls fast and rises slowly (`_FLOOR_FALL`, `_FLOOR_RISE_DB`),
+so it hugs the quiet end of the room's noise, and a louder room only
+makes the gate pass more frames until it has caught up -- every way the
+estimate can be wrong costs inferences, not words. Quiet speech onsets
+are guarded three ways: a frame is only gated within `margin_db` of the
+floor and below `_CEILING_DBFS` absolute; any frame above that margin
+holds the gate open for the next `_HANGOVER_FRAMES`, so a soft word that
+dips back toward the floor mid-onset is still scored; and the detector
+only consults the gate while nothing is in progress -- no arbitration
+window, no candidate or utterance in the segmenter -- so the
+probabilities an utterance's boundaries and chunks are built from are
+always Silero's own.
+"""
+
+import math
+
+_FLOOR_FALL = 0.2  # of the gap, per frame, when the level drops below the floor
+_FLOOR_RISE_DB = 0.02  # dB per frame (~0.6 dB/s) while it stays above
+_CALIBRATION_FRAMES = 31  # ~1 s of audio before the floor is trusted
+_HANGOVER_FRAMES = 16  # ~0.5 s of scoring after anything above the margin
+_CEILING_DBFS = -35.0  # never gate a frame louder than this, whatever the floor
+_SILENT_DBFS = -120.0  # digital silence (rms 0), kept finite
+
+
+class EnergyPreGate:
+    """One device's adaptive noise floor and skip decision (module docstring).
+
+    `observe(rms)` takes each frame's `AudioFrame.rms` (relative to full
+    scale), updates the floor and returns True if the frame may skip the
+    VAD. `margin_db` is `vad.energy_gate_db`.
+    """
+
+    def __init__(self, margin_db: float = 3.0) -> None:
+        self._margin_db = margin_db
+        self._floor_db: float | None = None
+        self._frames = 0
+        self._hangover = 0
+
+    @property
+    def floor_dbfs(self) -> float | None:
+        return self._floor_db
+
+    def observe(self, rms: float) -> bool:
+        level = 20.0 * math.log10(rms) if rms > 0 else _SILENT_DBFS
+        if self._floor_db is None:
+            self._floor_db = level
+        elif level < self._floor_db:
+            self._floor_db += _FLOOR_FALL * (level - self._floor_db)
+        else:
+            self._floor_db += min(level - self._floor_db, _FLOOR_RISE_DB)
+        self._frames += 1
+        if level >= self._floor_db + self._margin_db or level >= _CEILING_DBFS:
+            self._hangover = _HANGOVER_FRAMES
+            return False
+        if self._hangover:
+            self._hangover -= 1
+            return False
+        return self._frames > _CALIBRATION_FRAMES
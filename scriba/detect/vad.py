@@ -17,7 +17,9 @@ so if a future model tag changes it, this wrapper needs updating too.
 import logging
 import queue
 import threading
-from collections.abc import Callable
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -25,9 +27,16 @@ import numpy as np
 import onnxruntime as ort
 import requests
 
+from ..audio.buffer import PcmBuffer, RingBuffer
+from ..audio.denoise import NoiseGate
 from ..config import Config, VadConfig, models_dir
 from ..messages import AudioChunk, AudioFrame
+from ..trace import TRACE
 from .arbiter import MicArbiter
+from .base import VadBackend
+from .endpoint import EndpointPredicate, FixedEndpoint, endpoint_predicate
+from .pregate import EnergyPreGate
+from .spectral import SpectralFluxVad
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +45,6 @@ _FRAME_SAMPLES = 512
 _FRAME_MS = _FRAME_SAMPLES / _SAMPLE_RATE * 1000  # 32.0 ms, fixed by DESIGN §7.1's blocksize=512
 _CONTEXT_SAMPLES = 64
 _STATE_SHAPE = (2, 1, 128)
-_INT16_FULL_SCALE = 32768.0
 
 _MODEL_TAG = "v6.2.1"
 _MODEL_URL = (
@@ -65,48 +73,220 @@ def ensure_model_downloaded(path: Path | None = None) -> Path:
     return path
 
 
+def _open_session(model_path: Path | None) -> ort.InferenceSession:
+    opts = ort.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+    return ort.InferenceSession(
+        str(ensure_model_downloaded(model_path)),
+        sess_options=opts,
+        providers=["CPUExecutionProvider"],
+    )
+
+
+class SileroVadEngine:
+    """Batched Silero VAD for every monitored device: one shared ONNX session,
+    one recurrent state + 64-sample context per `device_id`.
+
+    Deviation (user request): DESIGN §7.2's "run Silero VAD independently per
+    enabled device" used to mean one `SileroVad` (own session, own batch-1
+    `run()`) per device -- with 3-4 mics that's 3-4 ONNX calls every 32 ms
+    on the one detector thread. Silero's `input`/`state` tensors carry a
+    batch dimension, so `process()` stacks the frames that arrived for
+    different devices in the same tick into a single `run()` and splits the
+    returned state back out per device. Devices stay independent -- each row
+    only ever sees its own state and context.
+
+    The session is created lazily (first `process()`/`load()`), so
+    constructing an engine is free and never touches the network; `session`
+    injects a stand-in for tests. `prewarm()` does that work ahead of time,
+    from another thread (`Detector.prewarm`), so a device's first frame
+    never pays for it on the detector thread.
+    """
+
+    def __init__(self, model_path: Path | None = None, session: object | None = None):
+        self._model_path = model_path
+        self._session = session
+        self._load_lock = threading.Lock()
+        self._warm_batch = 0  # largest batch size prewarm() has already run
+        self._states: dict[str, np.ndarray] = {}  # device_id -> (2, 1, 128)
+        self._contexts: dict[str, np.ndarray] = {}  # device_id -> (64,)
+        self._sr = np.array(_SAMPLE_RATE, dtype=np.int64)
+
+    def load(self) -> None:
+        """Creates the ONNX session (downloading the model if needed); idempotent
+        and safe to call from several threads (the session is built once)."""
+        if self._session is None:
+            with self._load_lock:
+                if self._session is None:
+                    self._session = _open_session(self._model_path)
+
+    def prewarm(self, batch_size: int = 1) -> None:
+        """Loads the session and runs one silent batch of every size up to
+        `batch_size` not yet run, so onnxruntime's first-run allocation for a
+        new batch shape (a newly plugged-in device widens the batch) happens
+        here rather than on the detector thread. Touches no device's state;
+        safe to call concurrently with `process()`.
+        """
+        self.load()
+        with self._load_lock:
+            sizes = range(self._warm_batch + 1, batch_size + 1)
+            self._warm_batch = max(self._warm_batch, batch_size)
+        for n in sizes:
+            self._session.run(  # type: ignore[union-attr]
+                None,
+                {
+                    "input": np.zeros((n, _CONTEXT_SAMPLES + _FRAME_SAMPLES), dtype=np.float32),
+                    "state": np.zeros((_STATE_SHAPE[0], n, _STATE_SHAPE[2]), dtype=np.float32),
+                    "sr": self._sr,
+                },
+            )
+
+    @property
+    def session(self) -> object:
+        """The (loaded) ONNX session, for sharing with another engine."""
+        self.load()
+        return self._session
+
+    def reset(self, device_id: str | None = None) -> None:
+        """Clears one device's recurrent state (all devices' if `device_id` is None)."""
+        if device_id is None:
+            self._states.clear()
+            self._contexts.clear()
+        else:
+            self._states.pop(device_id, None)
+            self._contexts.pop(device_id, None)
+
+    def skip(self, frames: Sequence[AudioFrame]) -> None:
+        """Frames the detector didn't score (energy pre-gate): each device's
+        64-sample context still advances to the end of its frame, so the
+        next frame that is scored is seen with the audio that really
+        preceded it. The recurrent state keeps where the last scored frame
+        left it."""
+        for frame in frames:
+            self._contexts[frame.device_id] = frame.samples[-_CONTEXT_SAMPLES:].copy()
+
+    def process(self, frames: Sequence[AudioFrame]) -> list[float]:
+        """Speech probability for each 512-sample frame, in order.
+
+        Device ids must be distinct within one call (one frame per device
+        per tick -- a device's second frame depends on its first's state).
+        Reads each frame's precomputed float32 `samples`, so the only
+        per-call allocations are the batch's input and state tensors.
+        """
+        self.load()
+        n = len(frames)
+        x = np.empty((n, _CONTEXT_SAMPLES + _FRAME_SAMPLES), dtype=np.float32)
+        state = np.zeros((_STATE_SHAPE[0], n, _STATE_SHAPE[2]), dtype=np.float32)
+        for i, frame in enumerate(frames):
+            if frame.samples.shape[-1] != _FRAME_SAMPLES:
+                raise ValueError(
+                    f"expected {_FRAME_SAMPLES} samples, got {frame.samples.shape[-1]}"
+                )
+            context = self._contexts.get(frame.device_id)
+            if context is None:
+                x[i, :_CONTEXT_SAMPLES] = 0.0
+            else:
+                x[i, :_CONTEXT_SAMPLES] = context
+            x[i, _CONTEXT_SAMPLES:] = frame.samples
+            previous = self._states.get(frame.device_id)
+            if previous is not None:
+                state[:, i] = previous[:, 0]
+        out, new_state = self._session.run(  # type: ignore[union-attr]
+            None, {"input": x, "state": state, "sr": self._sr}
+        )
+        for i, frame in enumerate(frames):
+            self._states[frame.device_id] = new_state[:, i : i + 1]
+            self._contexts[frame.device_id] = x[i, -_CONTEXT_SAMPLES:]
+        return [float(p) for p in np.asarray(out).reshape(n, -1)[:, 0]]
+
+
+class PerDeviceVad:
+    """`SileroVadEngine`'s interface over one single-stream VAD per device.
+
+    For stand-ins that only know how to score one stream (`reset()` +
+    `process_frame(pcm) -> float`, like `SileroVad`): tests' synthetic VADs
+    and the replay bench's. Instances come from `factory`, lazily per device.
+    """
+
+    def __init__(self, factory: Callable[[], "SileroVad"]):
+        self._factory = factory
+        self._vads: dict[str, SileroVad] = {}
+
+    def load(self) -> None:
+        pass
+
+    def prewarm(self, batch_size: int = 1) -> None:
+        pass
+
+    def reset(self, device_id: str | None = None) -> None:
+        targets = self._vads.values() if device_id is None else [self._vads.get(device_id)]
+        for vad in targets:
+            if vad is not None:
+                vad.reset()
+
+    def skip(self, frames: Sequence[AudioFrame]) -> None:
+        pass  # single-stream stand-ins keep no context to advance
+
+    def process(self, frames: Sequence[AudioFrame]) -> list[float]:
+        probs = []
+        for frame in frames:
+            # Not dict.setdefault(id, factory()): the default is evaluated
+            # eagerly, which would rebuild e.g. a ~190 ms ONNX session on
+            # EVERY frame and leave the detector hopelessly behind.
+            vad = self._vads.get(frame.device_id)
+            if vad is None:
+                vad = self._vads[frame.device_id] = self._factory()
+            probs.append(vad.process_frame(frame.pcm))
+        return probs
+
+
+def vad_backend(vad_config: VadConfig) -> VadBackend:
+    """The backend `vad.backend` names (`Detector`'s default)."""
+    if vad_config.backend == "spectral":
+        return SpectralFluxVad()
+    return SileroVadEngine()
+
+
+def load_vad_backend(vad: VadBackend, fallback: bool) -> VadBackend:
+    """Loads `vad` and returns the backend to score with: with `fallback`
+    (a Silero engine), a `SpectralFluxVad` if `vad` fails to load; without,
+    the failure propagates."""
+    try:
+        vad.load()
+    except Exception:
+        if not fallback:
+            raise
+        logger.exception("Silero VAD unavailable; falling back to the spectral VAD")
+        return SpectralFluxVad()
+    return vad
+
+
 class SileroVad:
-    """Stateful per-stream wrapper around the Silero VAD ONNX model.
+    """Single-stream Silero VAD: a `SileroVadEngine` holding exactly one device's state.
 
-    One instance owns exactly one recurrent state; use one instance per
-    monitored device (DESIGN §7.2: "Run Silero VAD independently per enabled
-    device") so devices' VAD runs never interfere with each other.
+    Kept for one-stream callers (and its own model test); the detector
+    scores all devices through one batched `SileroVadEngine` instead.
     """
 
     def __init__(self, model_path: Path | None = None):
-        self._model_path = ensure_model_downloaded(model_path)
-        opts = ort.SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
-        self._session = ort.InferenceSession(
-            str(self._model_path), sess_options=opts, providers=["CPUExecutionProvider"]
-        )
-        self._state: np.ndarray = np.zeros(0)
-        self._context: np.ndarray = np.zeros(0)
-        self.reset()
+        self._engine = SileroVadEngine(model_path)
+        self._engine.load()
 
     def reset(self) -> None:
         """Clears recurrent state; call when this device's stream restarts."""
-        self._state = np.zeros(_STATE_SHAPE, dtype=np.float32)
-        self._context = np.zeros((1, _CONTEXT_SAMPLES), dtype=np.float32)
+        self._engine.reset()
 
     def process_frame(self, pcm: np.ndarray) -> float:
         """Returns the speech probability for one 512-sample @16kHz int16 mono frame."""
-        if pcm.shape[-1] != _FRAME_SAMPLES:
-            raise ValueError(f"expected {_FRAME_SAMPLES} samples, got {pcm.shape[-1]}")
-        chunk = pcm.astype(np.float32).reshape(1, _FRAME_SAMPLES) / _INT16_FULL_SCALE
-        x = np.concatenate([self._context, chunk], axis=1)
-        sr = np.array(_SAMPLE_RATE, dtype=np.int64)
-        out, state = self._session.run(None, {"input": x, "state": self._state, "sr": sr})
-        self._state = state
-        self._context = x[:, -_CONTEXT_SAMPLES:]
-        return float(out.item())
+        return self._engine.process([AudioFrame("", pcm, 0.0)])[0]
 
 
 @dataclass
 class _PendingFrame:
     pcm: np.ndarray
     t_monotonic: float
+    prob: float
 
 
 class UtteranceSegmenter:
@@ -117,7 +297,8 @@ class UtteranceSegmenter:
     supplied by the caller (the detector orchestrator, using the winning
     device's frames per the MicArbiter's choice), so this class is fully
     testable with synthetic probability sequences -- see
-    tests/test_vad_segmentation.py.
+    tests/test_vad_segmentation.py. Speech start/confirm and each endpoint
+    are recorded to the latency trace (scriba/trace.py) at those timestamps.
 
     Only one utterance is ever open at a time (this mirrors the arbiter: at
     most one device feeds an utterance system-wide), so a single instance is
@@ -145,16 +326,22 @@ class UtteranceSegmenter:
       cut anyway so utterance length stays bounded. The cut chunk carries
       `is_final=True`, and a new utterance (fresh `utterance_id`, no pre-roll,
       since it's a seamless continuation) begins on the very next frame.
+    - How much silence ends an utterance is the `endpoint` predicate's call
+      (detect/endpoint.py), asked once per sub-threshold frame: by default
+      a fixed `endpoint_silence_ms`; `TranscriptEndpoint` varies it with
+      the utterance's latest partial text (user request).
     """
 
     def __init__(
         self,
         vad_config: VadConfig,
-        get_preroll: Callable[[str], np.ndarray | None],
+        get_preroll: Callable[[str], np.ndarray | Sequence[np.ndarray] | None],
+        endpoint: EndpointPredicate | None = None,
     ):
         self._threshold = vad_config.threshold
         self._min_speech_frames = round(vad_config.min_speech_ms / _FRAME_MS)
         self._endpoint_frames = max(1, round(vad_config.endpoint_silence_ms / _FRAME_MS))
+        self._endpoint = endpoint if endpoint is not None else FixedEndpoint(vad_config)
         self._max_frames = max(1, round(vad_config.max_utterance_s * 1000 / _FRAME_MS))
         self._get_preroll = get_preroll
         self._next_utterance_id = 1
@@ -178,12 +365,14 @@ class UtteranceSegmenter:
         self._triggered = False
         self._confirmed = False
         self._pretrig_frame: _PendingFrame | None = None
-        self._pending: list[_PendingFrame] = []
-        self._preroll: np.ndarray | None = None
+        self._pending: PcmBuffer | None = None  # pre-roll + frames since trigger, until confirm
+        self._pending_probs: list[float] = []  # VAD probs of `_pending`'s frames (not pre-roll)
         self._utterance_id: int | None = None
+        self._device_id: str | None = None  # device of the in-flight utterance
         self._frames_since_start = 0
         self._speech_span_frames = 0
         self._silence_run = 0
+        self._speech_start_t = 0.0  # first frame of the trigger pair, for the trace
 
     def _mint_utterance_id(self) -> int:
         utterance_id = self._next_utterance_id
@@ -205,18 +394,38 @@ class UtteranceSegmenter:
             self._pretrig_frame = None
             return None
         if self._pretrig_frame is None:
-            self._pretrig_frame = _PendingFrame(pcm, t_monotonic)
+            self._pretrig_frame = _PendingFrame(pcm, t_monotonic, prob)
             return None
 
         # Second consecutive qualifying frame: trigger. Capture pre-roll now,
         # before any further audio is buffered, so it can't double-count.
         self._triggered = True
+        self._device_id = device_id
         self._confirmed = False
+        self._speech_start_t = self._pretrig_frame.t_monotonic
         self._frames_since_start = 2
         self._speech_span_frames = 2
         self._silence_run = 0
-        self._pending = [self._pretrig_frame, _PendingFrame(pcm, t_monotonic)]
-        self._preroll = self._get_preroll(device_id)
+        # Pre-roll and the frames buffered until `min_speech_ms` confirms go
+        # into one buffer sized for exactly that, so confirming hands it over
+        # as the first chunk without a concatenate (audio/buffer.py).
+        # `get_preroll` may hand back zero-copy views of the capture ring
+        # (`RingBuffer.views()`, oldest piece first); appending them here is
+        # the one copy the pre-roll gets.
+        preroll = self._get_preroll(device_id)
+        if preroll is None:
+            preroll = ()
+        elif isinstance(preroll, np.ndarray):
+            preroll = (preroll,)
+        self._pending = PcmBuffer(
+            sum(piece.size for piece in preroll)
+            + (max(self._min_speech_frames, 2) + 1) * _FRAME_SAMPLES
+        )
+        for piece in preroll:
+            self._pending.append(piece)
+        self._pending.append(self._pretrig_frame.pcm)
+        self._pending.append(pcm)
+        self._pending_probs = [self._pretrig_frame.prob, prob]
         self._pretrig_frame = None
 
         if self._speech_span_frames >= self._min_speech_frames:
@@ -233,22 +442,29 @@ class UtteranceSegmenter:
         else:
             self._silence_run += 1
 
-        if self._silence_run >= self._endpoint_frames:
+        if self._silence_run and self._endpoint.endpoint_reached(
+            self._utterance_id, self._silence_run
+        ):
             was_confirmed = self._confirmed
             utterance_id = self._utterance_id
             self._reset_idle()
             if was_confirmed:
+                TRACE.record_monotonic("endpoint", utterance_id, t_monotonic, cause="vad")
                 return AudioChunk(
                     utterance_id=utterance_id,  # type: ignore[arg-type]
                     device_id=device_id,
                     pcm=pcm,
                     t_monotonic=t_monotonic,
                     is_final=True,
+                    tentative_end=True,
+                    vad_probs=np.array([prob], dtype=np.float32),
                 )
             return None  # discarded candidate: shorter than min_speech_ms, emit nothing
 
         if not self._confirmed:
-            self._pending.append(_PendingFrame(pcm, t_monotonic))
+            assert self._pending is not None
+            self._pending.append(pcm)
+            self._pending_probs.append(prob)
             if self._speech_span_frames >= self._min_speech_frames:
                 return self._confirm(device_id, t_monotonic)
             return None
@@ -262,32 +478,74 @@ class UtteranceSegmenter:
                     pcm=pcm,
                     t_monotonic=t_monotonic,
                     is_final=True,
+                    tentative_end=self._silence_run > 0,
+                    vad_probs=np.array([prob], dtype=np.float32),
                 )
+                trace = TRACE.record_monotonic
+                trace("endpoint", self._utterance_id, t_monotonic, cause="max_utterance")
                 self._start_continuation(device_id)
+                trace("speech", self._utterance_id, t_monotonic, continuation=True)
                 return chunk
 
+        # From the first below-threshold frame on, every chunk says the
+        # utterance may be over (`tentative_end`), so the STT worker can run
+        # the final decode during the endpoint wait instead of after it.
         return AudioChunk(
             utterance_id=self._utterance_id,  # type: ignore[arg-type]
             device_id=device_id,
             pcm=pcm,
             t_monotonic=t_monotonic,
             is_final=False,
+            tentative_end=self._silence_run > 0,
+            vad_probs=np.array([prob], dtype=np.float32),
+        )
+
+    def force_endpoint(self, t_monotonic: float) -> AudioChunk | None:
+        """Ends the in-flight utterance now, as if `endpoint_silence_ms` had
+        just elapsed (push-to-talk release, `Detector.force_endpoint`).
+
+        A confirmed utterance gets its `is_final` chunk as a pure-finalize
+        marker (`pcm=None`: every frame so far was already emitted); an
+        unconfirmed candidate is discarded exactly like one that hits the
+        VAD endpoint before `min_speech_ms`. Idle: nothing to do, None.
+        """
+        if not self._triggered:
+            self._pretrig_frame = None
+            return None
+        was_confirmed = self._confirmed
+        utterance_id = self._utterance_id
+        device_id = self._device_id
+        in_silence = self._silence_run > 0
+        self._reset_idle()
+        if not was_confirmed:
+            return None
+        TRACE.record_monotonic("endpoint", utterance_id, t_monotonic, cause="forced")
+        return AudioChunk(
+            utterance_id=utterance_id,  # type: ignore[arg-type]
+            device_id=device_id,  # type: ignore[arg-type]
+            pcm=None,
+            t_monotonic=t_monotonic,
+            is_final=True,
+            tentative_end=in_silence,
         )
 
     def _confirm(self, device_id: str, t_monotonic: float) -> AudioChunk:
         utterance_id = self._mint_utterance_id()
-        preroll = self._preroll if self._preroll is not None else np.zeros(0, dtype=np.int16)
-        pcm = np.concatenate([preroll, *(f.pcm for f in self._pending)])
+        assert self._pending is not None
+        pcm = self._pending.take()
         self._utterance_id = utterance_id
         self._confirmed = True
-        self._pending = []
-        self._preroll = None
+        self._pending = None
+        TRACE.record_monotonic(
+            "speech", utterance_id, self._speech_start_t, t_monotonic, device=device_id
+        )
         return AudioChunk(
             utterance_id=utterance_id,
             device_id=device_id,
             pcm=pcm,
             t_monotonic=t_monotonic,
             is_final=False,
+            vad_probs=np.array(self._pending_probs, dtype=np.float32),
         )
 
     def _start_continuation(self, device_id: str) -> None:
@@ -298,23 +556,65 @@ class UtteranceSegmenter:
         self._silence_run = 0
         self._confirmed = True
         self._triggered = True
-        self._pending = []
-        self._preroll = None
+        self._pending = None
 
 
 class Detector:
     """The `detector` thread (DESIGN.md §5): mic arbiter + VAD + segmentation.
 
     Consumes `AudioFrame` from `frame_queue` (one PortAudio callback thread
-    feeds each enabled device, per `scriba/audio/capture.py`), runs each
-    device's own `SileroVad` independently, feeds the `MicArbiter`, drives a
+    feeds each enabled device, per `scriba/audio/capture.py`), scores every
+    device's frames with its own VAD state, feeds the `MicArbiter`, drives a
     single shared `UtteranceSegmenter` on whichever device the arbiter has
     picked as the winner, and pushes resulting `AudioChunk`s onto
     `chunk_queue` for the STT worker.
 
-    `SileroVad` instances are created lazily per `device_id` the first time a
-    frame from that device is seen, so this class needs no static device
-    list and adapts automatically to hot-plugged devices (DESIGN §7.1).
+    Scoring goes through one `VadBackend` (detect/base.py) for all
+    devices, by default `SileroVadEngine`: `run()` drains whatever frames
+    are queued and scores one frame per device per batched ONNX call (see
+    `SileroVadEngine`). Per-device state is created the first time a
+    device's frame is seen, so this class needs no static device list and
+    adapts automatically to hot-plugged devices (DESIGN §7.1). `vad`
+    replaces the backend `vad.backend` names; only tests and the replay
+    bench (`scriba.bench`) pass one, usually a `PerDeviceVad` over a
+    stand-in. If the configured Silero engine can't be loaded (its model
+    download failed, say), the detector falls back to `SpectralFluxVad`
+    rather than having no VAD at all (user request).
+
+    The engine's one-off costs (ONNX session creation, ~190 ms; the first
+    run at each batch width) are paid off-thread: `prewarm()` at startup and
+    `on_device_opened()` from `AudioCapture` when a device is (hot-)plugged,
+    so a new device's first frames score at steady-state speed instead of
+    backing up `frame_queue` (user request).
+
+    `force_endpoint()` (push-to-talk release) travels through `frame_queue`
+    itself as an `_EndpointRequest`, so every frame captured before key-up
+    is scored and segmented first and the final chunk follows the last of
+    them -- no lock shared with the caller, and no waiting out
+    `endpoint_silence_ms` (user request; DESIGN §6 budgets 0 ms for it).
+
+    With `stt.denoise`, every scored frame also runs through its device's
+    `NoiseGate` (audio/denoise.py), which learns that device's noise from
+    the frames scored below threshold; the segmenter -- and so the STT
+    thread -- only ever sees the cleaned frames, and its pre-roll comes
+    from a ring of cleaned audio kept alongside (user request). VAD and
+    arbitration keep scoring the raw audio.
+
+    While the arbiter's winner is locked, only the winner's frames are
+    scored (`vad.skip_losing_devices`, user request): the others' scores
+    would be thrown away unread, and with N mics that was (N-1)/N of the
+    detector's ONNX work for the length of every utterance. A skipped
+    device's recurrent state goes stale, so when the lock is released each
+    one is reset and re-run over its capture pre-roll ring -- the last
+    `vad.pre_roll_ms` of its audio, batched across devices -- before it
+    competes again (`_release_winner`).
+
+    While nothing is in progress -- arbiter idle, segmenter idle -- each
+    device's frames also pass an `EnergyPreGate` (detect/pregate.py,
+    `vad.energy_gate_db`; user request) first: frames sitting at the
+    device's noise floor skip the VAD and count as probability 0, which is
+    most frames of an idle day. The engine's `skip()` keeps each skipped
+    device's context current for the next scored frame.
     """
 
     def __init__(
@@ -322,46 +622,294 @@ class Detector:
         config: Config,
         frame_queue: "queue.Queue[AudioFrame]",
         chunk_queue: "queue.Queue[AudioChunk]",
-        get_preroll: Callable[[str], np.ndarray | None],
+        get_preroll: Callable[[str], np.ndarray | Sequence[np.ndarray] | None],
+        vad: VadBackend | None = None,
     ):
         self._config = config
         self._frame_queue = frame_queue
         self._chunk_queue = chunk_queue
-        self._vads: dict[str, SileroVad] = {}
+        self._vad = vad if vad is not None else vad_backend(config.vad)
+        self._vad_loaded = False
+        self._vad_fallback = vad is None and config.vad.backend == "silero"
         self._arbiter = MicArbiter(config.audio)
-        self._segmenter = UtteranceSegmenter(config.vad, get_preroll)
+        self._endpoint = endpoint_predicate(config.vad)
+        self._get_preroll = get_preroll
+        self._gates: dict[str, tuple[NoiseGate, RingBuffer]] = {}
+        self._segmenter = UtteranceSegmenter(
+            config.vad,
+            self._cleaned_preroll if config.stt.denoise else get_preroll,
+            self._endpoint,
+        )
+        self._devices_lock = threading.Lock()
+        self._opened_devices: set[str] = set()
+        self._stale_devices: set[str] = set()  # VAD skipped while another device won
+        self._pregates: dict[str, EnergyPreGate] = {}
+        self.skipped_frames = 0
+        self.gated_frames = 0
+
+    def prewarm(self, n_devices: int = 1) -> None:
+        """Builds the VAD session and warms it for `n_devices`-wide batches.
+        Blocking (may download the model on first run); call it from a
+        worker thread before frames start flowing -- `ScribaApp` does so on
+        its provisioning thread."""
+        self._load_vad()
+        self._vad.prewarm(max(1, n_devices))
+
+    def on_device_opened(self, device_id: str) -> None:
+        """`AudioCapture`'s device-open hook (runs on whichever thread opened
+        the stream): widens the prewarmed batch to cover every device opened
+        so far, before the new device's first frame reaches `run()`."""
+        with self._devices_lock:
+            self._opened_devices.add(device_id)
+            n_devices = len(self._opened_devices)
+        self._load_vad()
+        self._vad.prewarm(n_devices)
+
+    @property
+    def vad(self) -> VadBackend:
+        """The backend frames are scored with (after any fallback)."""
+        return self._vad
+
+    def _load_vad(self) -> None:
+        """Loads the VAD backend once. A Silero engine that fails to load is
+        replaced by `SpectralFluxVad` for the rest of the session; any other
+        backend's failure propagates (and is retried on the next call)."""
+        if self._vad_loaded:
+            return
+        self._vad = load_vad_backend(self._vad, self._vad_fallback)
+        self._vad_loaded = True
+
+    def observe_text(self, utterance_id: int, text: str) -> None:
+        """`StreamingSession`'s pass-text hook (STT thread): hands the
+        utterance's latest partial text to the endpoint predicate."""
+        self._endpoint.observe(utterance_id, text)
 
     def run(self, stop_event: threading.Event) -> None:
         """Blocking loop: drains `frame_queue` until `stop_event` is set."""
         while not stop_event.is_set():
             try:
-                frame = self._frame_queue.get(timeout=0.1)
+                items = [self._frame_queue.get(timeout=0.1)]
             except queue.Empty:
                 continue
+            while True:
+                try:
+                    items.append(self._frame_queue.get_nowait())
+                except queue.Empty:
+                    break
+            frames: list[AudioFrame] = []
+            for item in items:
+                if isinstance(item, _EndpointRequest):
+                    self._process_drained(frames)  # the tail captured before key-up
+                    frames = []
+                    self.endpoint_now(item.t_monotonic)
+                else:
+                    frames.append(item)
+            self._process_drained(frames)
+
+    def force_endpoint(self) -> None:
+        """Finalizes the in-flight utterance as soon as the frames already
+        queued have been processed. Thread-safe (one `Queue.put`); returns
+        immediately -- the `is_final` chunk is produced on the detector thread."""
+        self._frame_queue.put(_EndpointRequest(time.monotonic()))  # type: ignore[arg-type]
+
+    def shed_frame(self, items: "deque[AudioFrame]") -> bool:
+        """`frame_queue`'s overflow policy (scriba/queues.py), called on the
+        capturing thread with the queued entries: drops the oldest frame of
+        a device other than the locked winner -- its VAD result would be
+        ignored anyway -- else, with no winner or only its frames queued,
+        the oldest frame. Endpoint requests are never dropped."""
+        winner = self._arbiter.winner
+        oldest = None
+        for i, item in enumerate(items):
+            if isinstance(item, _EndpointRequest):
+                continue
+            if winner is not None and item.device_id != winner:
+                del items[i]
+                return True
+            if oldest is None:
+                oldest = i
+        if oldest is None:
+            return False
+        del items[oldest]
+        return True
+
+    def endpoint_now(self, t_monotonic: float) -> None:
+        """Synchronous form of `force_endpoint`, on the calling thread: emits
+        the in-flight utterance's final chunk (if any) and re-opens
+        arbitration. The replay bench calls it directly."""
+        chunk = self._segmenter.force_endpoint(t_monotonic)
+        if chunk is not None:
+            self._chunk_queue.put(chunk)
+        self._release_winner()
+
+    def _process_drained(self, frames: Sequence[AudioFrame]) -> None:
+        for batch in _one_frame_per_device(frames):
             try:
-                self._handle_frame(frame)
+                self.process_frames(batch)
             except Exception:
-                logger.exception("detector: error handling frame from %s", frame.device_id)
-
-    def _handle_frame(self, frame: AudioFrame) -> None:
-        # Not dict.setdefault(id, SileroVad()): its default arg is evaluated
-        # eagerly, which would rebuild the ~190 ms ONNX session on EVERY
-        # frame (frames arrive every ~16 ms with two mics) -- the detector
-        # falls 12x behind and dictation appears dead.
-        vad = self._vads.get(frame.device_id)
-        if vad is None:
-            vad = self._vads[frame.device_id] = SileroVad()
-        prob = vad.process_frame(frame.pcm)
-        rms = float(np.sqrt(np.mean(frame.pcm.astype(np.float64) ** 2)))
-
-        winner = self._arbiter.offer(
-            frame.device_id, prob, rms, frame.t_monotonic, self._config.vad.threshold
-        )
+                logger.exception(
+                    "detector: error handling frames from %s",
+                    ", ".join(sorted({f.device_id for f in batch})),
+                )
+
+    def process_frame(self, frame: AudioFrame) -> None:
+        """One synchronous detector step for `frame`. The replay bench
+        (`scriba.bench`) calls this directly so it can drive the detector on a
+        simulated clock instead of a thread."""
+        self.process_frames([frame])
+
+    def process_frames(self, frames: Sequence[AudioFrame]) -> None:
+        """Scores `frames` (at most one per device) in one VAD batch, then runs
+        arbitration/segmentation on each in arrival order. While a winner is
+        locked, the other devices' frames skip the VAD (class docstring)."""
+        self._load_vad()
+        winner = self._arbiter.winner if self._config.vad.skip_losing_devices else None
+        idle = self._arbiter.idle and self._segmenter.is_idle
+        losing = set()
+        gated = []
+        scored = []
+        for frame in frames:
+            if winner is not None and frame.device_id != winner:
+                losing.add(frame.device_id)
+            elif self._energy_gated(frame) and idle:
+                gated.append(frame)
+            else:
+                scored.append(frame)
+        if gated:
+            self._vad.skip(gated)
+            self.gated_frames += len(gated)
+        probs: dict[str, float] = {}
+        if scored:
+            probs = dict(zip([f.device_id for f in scored], self._vad.process(scored), strict=True))
+        for frame in frames:
+            if frame.device_id in losing:
+                self._skip_locked(frame)
+            else:
+                self._handle_scored(frame, probs.get(frame.device_id, 0.0))
+
+    def _handle_scored(self, frame: AudioFrame, prob: float) -> None:
+        threshold = self._config.vad.threshold
+        pcm = self._denoise(frame, prob < threshold) if self._config.stt.denoise else frame.pcm
+        winner = self._arbiter.offer(frame.device_id, prob, frame.rms, frame.t_monotonic, threshold)
         if winner != frame.device_id:
             return
 
-        chunk = self._segmenter.process_frame(frame.device_id, frame.pcm, prob, frame.t_monotonic)
+        chunk = self._segmenter.process_frame(frame.device_id, pcm, prob, frame.t_monotonic)
         if chunk is not None:
             self._chunk_queue.put(chunk)
         if self._segmenter.is_idle:
-            self._arbiter.reset()
+            self._release_winner()
+
+    def _energy_gated(self, frame: AudioFrame) -> bool:
+        """Feeds `frame`'s level to its device's `EnergyPreGate`; True if it
+        sits at the noise floor (off with `vad.energy_gate_db` = 0)."""
+        margin_db = self._config.vad.energy_gate_db
+        if margin_db <= 0:
+            return False
+        gate = self._pregates.get(frame.device_id)
+        if gate is None:
+            gate = self._pregates[frame.device_id] = EnergyPreGate(margin_db)
+        return gate.observe(frame.rms)
+
+    def _skip_locked(self, frame: AudioFrame) -> None:
+        """A losing device's frame while the winner is locked: no VAD, no
+        arbitration. With `stt.denoise` it still goes through its gate --
+        keeping the cleaned pre-roll continuous -- but teaches it nothing:
+        the winner is mid-utterance, so this mic is hearing speech too."""
+        self._stale_devices.add(frame.device_id)
+        self.skipped_frames += 1
+        if self._config.stt.denoise:
+            self._denoise(frame, is_noise=False)
+
+    def _release_winner(self) -> None:
+        """`MicArbiter.reset()`, after resyncing every device whose VAD was
+        skipped during the lock: its state is reset and re-run over its
+        pre-roll ring, so it competes for the next utterance with state
+        built from its latest audio rather than from before the lock."""
+        self._arbiter.reset()
+        if not self._stale_devices:
+            return
+        replays = []
+        for device_id in sorted(self._stale_devices):
+            self._vad.reset(device_id)
+            pcm = _concat(_preroll_pieces(self._get_preroll(device_id)))
+            usable = pcm.size - pcm.size % _FRAME_SAMPLES
+            replays.append(
+                [
+                    AudioFrame(device_id, pcm[i : i + _FRAME_SAMPLES], 0.0)
+                    for i in range(pcm.size - usable, pcm.size, _FRAME_SAMPLES)
+                ]
+            )
+        self._stale_devices.clear()
+        # Right-aligned, so every device's replay ends on its latest frame.
+        longest = max(len(frames) for frames in replays)
+        for step in range(longest):
+            batch = [
+                frames[step - longest + len(frames)]
+                for frames in replays
+                if step >= longest - len(frames)
+            ]
+            self._vad.process(batch)
+
+    def _denoise(self, frame: AudioFrame, is_noise: bool) -> np.ndarray:
+        """`frame` through its device's `NoiseGate`, recorded for the pre-roll.
+        Every device's frames go through, winning or not, so each one's
+        noise profile is current when it next wins."""
+        entry = self._gates.get(frame.device_id)
+        if entry is None:
+            capacity = round(self._config.vad.pre_roll_ms * _SAMPLE_RATE / 1000)
+            entry = NoiseGate(self._config.stt.denoise_strength), RingBuffer(capacity)
+            self._gates[frame.device_id] = entry
+        gate, history = entry
+        pcm = gate.process(frame.samples, is_noise)
+        history.push(pcm)
+        return pcm
+
+    def _cleaned_preroll(self, device_id: str) -> tuple[np.ndarray, ...]:
+        """The segmenter's pre-roll with `stt.denoise`: as much cleaned audio
+        as the capture ring would have handed over, ending at the frame
+        being processed."""
+        pieces = _preroll_pieces(self._get_preroll(device_id))
+        wanted = sum(piece.size for piece in pieces)
+        entry = self._gates.get(device_id)
+        if entry is None or wanted == 0:
+            return ()
+        cleaned = entry[1].read()
+        return (cleaned[max(0, cleaned.size - wanted) :],)
+
+
+@dataclass
+class _EndpointRequest:
+    """`Detector.force_endpoint()`'s marker in `frame_queue` (key-up time)."""
+
+    t_monotonic: float
+
+
+def _preroll_pieces(raw: np.ndarray | Sequence[np.ndarray] | None) -> Sequence[np.ndarray]:
+    """A `get_preroll` result as a sequence of int16 pieces, oldest first."""
+    return () if raw is None else (raw,) if isinstance(raw, np.ndarray) else raw
+
+
+def _concat(pieces: Sequence[np.ndarray]) -> np.ndarray:
+    if len(pieces) == 1:
+        return pieces[0]
+    if not pieces:
+        return np.empty(0, dtype=np.int16)
+    return np.concatenate(pieces)
+
+
+def _one_frame_per_device(frames: Sequence[AudioFrame]) -> list[list[AudioFrame]]:
+    """Splits drained frames into batches holding at most one frame per device.
+
+    Keeps arrival order: a batch closes as soon as a device repeats (its
+    next frame needs the state its previous one produces).
+    """
+    batches: list[list[AudioFrame]] = []
+    seen: set[str] = set()
+    for frame in frames:
+        if not batches or frame.device_id in seen:
+            batches.append([])
+            seen = set()
+        batches[-1].append(frame)
+        seen.add(frame.device_id)
+    return batches
@@ -3,7 +3,9 @@
 Deliberately self-contained: queries sounddevice/ctranslate2/onnxruntime and
 `scriba.config` directly rather than importing scriba.audio/detect/stt, none
 of which this module depends on. A future `scriba/app.py --diagnose` flag
-calls `run_diagnostics()`.
+calls `run_diagnostics()`. The one exception is the idle-tier section, which
+imports `scriba.stt` only when it runs (it loads models). The queue section
+reads what the last session saved through `scriba.queues` (stdlib only).
 """
 
 from dataclasses import dataclass, field
@@ -13,7 +15,8 @@ import ctranslate2
 import onnxruntime as ort
 import sounddevice as sd
 
-from .config import models_dir
+from .config import Config, config_path, load_config, models_dir
+from .queues import load_queue_stats, queue_stats_path
 
 
 @dataclass
@@ -156,15 +159,75 @@ def _print_model_cache(info: ModelCacheInfo) -> None:
         print(f"  {entry}")
 
 
-def run_diagnostics() -> None:
+def _mib(n_bytes: int | None) -> str:
+    return "n/a" if n_bytes is None else f"{n_bytes / 2**20:.0f} MB"
+
+
+def _seconds(value: float | None) -> str:
+    return "n/a" if value is None else f"{value:.1f} s"
+
+
+def _print_idle_tiers(config: Config, cuda_available: bool) -> None:
+    """Footprint and wake latency of each `stt.idle_tier` (DESIGN.md §9)."""
+    print("-- Idle tiers (stt.idle_tier) --")
+    from .stt.language import model_for_language
+    from .stt.residency import measure_idle_tiers
+
+    config.stt.model = model_for_language(config.general.language)  # as ScribaApp does
+    try:
+        reports = measure_idle_tiers(config, cuda_available)
+    except FileNotFoundError as exc:
+        print(f"  skipped: {exc} (--diagnose never downloads)")
+        return
+    except Exception as exc:
+        print(f"  measurement failed: {exc!r}")
+        return
+    for r in reports:
+        print(
+            f"  {r.tier:9s} RAM {_mib(r.ram_bytes):>8s}  VRAM {_mib(r.vram_bytes):>8s}  "
+            f"wake {_seconds(r.wake_s):>7s}  full model {_seconds(r.full_s):>7s}  {r.note}"
+        )
+    print(f"  configured: stt.idle_tier = {config.stt.idle_tier!r}")
+
+
+def _print_queue_stats(config: Config) -> None:
+    """The pipeline queues' bounds, and their telemetry as the last session
+    saved it (scriba/queues.py)."""
+    print("-- Pipeline queues --")
+    print(
+        f"  bounds: frames {config.audio.frame_queue_max}, "
+        f"chunks {config.streaming.chunk_queue_max}, inject {config.inject.queue_max}"
+    )
+    path = queue_stats_path()
+    stats = load_queue_stats(path)
+    if not stats:
+        print(f"  no saved telemetry ({path})")
+        return
+    print(f"  last session ({path}):")
+    for s in stats:
+        print(
+            f"  {s.name:7s} high-water {s.high_water:>5d}/{s.maxsize:<5d} depth {s.depth:>5d}  "
+            f"coalesced {s.coalesced:>6d}  dropped {s.dropped:>6d}  overflowed {s.overflowed:>6d}"
+        )
+
+
+def run_diagnostics(config: Config | None = None) -> None:
     """Print the `--diagnose` report (DESIGN.md §7.11) to stdout."""
+    if config is None:
+        # never writes a first-run config.toml, unlike a bare load_config()
+        config = load_config() if config_path().exists() else Config()
     print("=== Scriba diagnostics ===")
     print()
     _print_devices(list_input_devices())
     print()
-    _print_cuda(check_cuda())
+    cuda = check_cuda()
+    _print_cuda(cuda)
     print()
     _print_model_cache(model_cache_state())
     print()
+    _print_idle_tiers(config, cuda.cuda_available)
+    print()
+    _print_queue_stats(config)
+    print()
     print("-- STT benchmark --")
     print("  run STT benchmark: not yet wired (needs scriba.stt, added during integration)")
@@ -6,6 +6,7 @@ itself stays a plain, OS-neutral Protocol so `scriba/text/` and callers can
 depend on the shape without importing Windows-only code.
 """
 
+from collections import deque
 from typing import Protocol
 
 from ..messages import ForegroundWindow, InjectJob
@@ -24,3 +25,35 @@ class Injector(Protocol):
         `job.text` to the clipboard as a consolation before raising.
         """
         ...
+
+
+def merge_jobs(first: InjectJob, second: InjectJob) -> InjectJob:
+    """One job with the effect of typing `first`, then `second`: `second`'s
+    backspaces eat into `first`'s text before reaching what was typed earlier."""
+    if second.erase <= len(first.text):
+        text = first.text[: len(first.text) - second.erase] + second.text
+        erase = first.erase
+    else:
+        text = second.text
+        erase = first.erase + second.erase - len(first.text)
+    return InjectJob(
+        text=text, erase=erase, utterance_id=second.utterance_id, is_final=second.is_final
+    )
+
+
+def coalesce_queued_jobs(items: "deque[InjectJob]") -> int:
+    """`inject_queue`'s overflow policy (scriba/queues.py): folds each queued
+    partial (non-final) job into the job after it, if that one belongs to
+    the same utterance -- a revision that's already superseded needn't be
+    typed and backspaced. In place; returns how many jobs it folded away."""
+    merged: list[InjectJob] = []
+    for job in items:
+        last = merged[-1] if merged else None
+        if last is not None and not last.is_final and last.utterance_id == job.utterance_id:
+            merged[-1] = merge_jobs(last, job)
+        else:
+            merged.append(job)
+    folded = len(items) - len(merged)
+    items.clear()
+    items.extend(merged)
+    return folded
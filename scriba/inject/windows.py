@@ -33,6 +33,7 @@ import win32process
 
 from ..config import InjectConfig
 from ..messages import ForegroundWindow, InjectJob
+from ..trace import TRACE
 
 logger = logging.getLogger(__name__)
 
@@ -199,6 +200,10 @@ class WindowsInjector:
 
     def __init__(self, config: InjectConfig) -> None:
         self._config = config
+        # perf_counter of the current job's first/last accepted SendInput
+        # batch, for the "keystrokes" trace span (scriba/trace.py)
+        self._first_key_t: float | None = None
+        self._last_key_t = 0.0
 
     def foreground_window(self) -> ForegroundWindow | None:
         hwnd = win32gui.GetForegroundWindow()
@@ -239,11 +244,23 @@ class WindowsInjector:
         method = resolve_inject_method(self._config, foreground.exe_name)
         delay_s = self._config.per_char_delay_ms / 1000
 
+        self._first_key_t = None
         self._send_backspaces(job.erase, job.text, foreground, delay_s)
         if method == "paste":
             self._inject_paste(job.text, foreground)
         else:
             self._inject_type(job.text, foreground, delay_s)
+        if self._first_key_t is not None:
+            TRACE.record(
+                "keystrokes",
+                job.utterance_id,
+                self._first_key_t,
+                self._last_key_t,
+                erase=job.erase,
+                chars=len(job.text),
+                method=method,
+                final=job.is_final,
+            )
 
     def _send_backspaces(
         self, erase: int, text: str, foreground: ForegroundWindow, delay_s: float
@@ -271,6 +288,10 @@ class WindowsInjector:
 
     def _send_or_raise(self, events: list[_Input], text: str, foreground: ForegroundWindow) -> None:
         sent = _send_inputs(events)
+        now = time.perf_counter()
+        if self._first_key_t is None:
+            self._first_key_t = now
+        self._last_key_t = now
         if sent < len(events):
             self._consolation_copy(text)
             raise InjectionBlockedError(
@@ -14,7 +14,7 @@ so the injector can tell "new utterance, reset my typed-string tracker" from
 """
 
 import hashlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 
@@ -30,11 +30,32 @@ def device_id_for_name(name: str) -> str:
     return hashlib.sha1(name.strip().encode("utf-8")).hexdigest()[:12]
 
 
+_INT16_FULL_SCALE = 32768.0
+
+
 @dataclass
 class AudioFrame:
+    """One 32 ms capture frame, plus the per-frame features every consumer needs.
+
+    `samples`/`rms`/`peak` are derived from `pcm` once, when the frame is
+    built -- i.e. on the device's PortAudio callback thread, not the
+    detector's -- so the VAD (which wants float32 in [-1, 1)), the arbiter
+    (RMS tie-break) and anything displaying levels share one conversion
+    instead of each re-deriving it from int16 (user request).
+    """
+
     device_id: str
     pcm: np.ndarray  # int16 mono, 512 samples @ 16 kHz (32 ms)
     t_monotonic: float
+    samples: np.ndarray = field(init=False, repr=False)  # float32 pcm / 32768
+    rms: float = field(init=False)  # of `samples`, i.e. relative to full scale
+    peak: float = field(init=False)  # max |sample|, relative to full scale
+
+    def __post_init__(self) -> None:
+        self.samples = np.multiply(self.pcm, 1 / _INT16_FULL_SCALE, dtype=np.float32)
+        n = self.samples.size
+        self.rms = float(np.sqrt(np.dot(self.samples, self.samples) / n)) if n else 0.0
+        self.peak = max(-int(self.pcm.min()), int(self.pcm.max())) / _INT16_FULL_SCALE if n else 0.0
 
 
 @dataclass
@@ -45,6 +66,20 @@ class AudioChunk:
     t_monotonic: float
     is_final: bool = False  # True on the chunk carrying (or following) the VAD endpoint
     language: str | None = None  # language-policy resolution, set on the utterance's first chunk
+    # True while the detector is counting endpoint silence (from the first
+    # below-threshold frame on); a later chunk without it means speech resumed.
+    tentative_end: bool = False
+    # The segmenter's VAD probability for each 512-sample frame at the *end*
+    # of `pcm`; samples before the first scored frame (the pre-roll) were
+    # never scored. None: nothing known, e.g. a finalize marker.
+    vad_probs: np.ndarray | None = None
+
+
+@dataclass
+class WordTiming:
+    word: str  # one whitespace-delimited token of `Transcript.text`
+    start: float  # seconds from the start of the decoded buffer
+    end: float
 
 
 @dataclass
@@ -56,6 +91,14 @@ class Transcript:
     language: str
     utterance_id: int = 0
     is_partial: bool = False
+    # Only filled when transcribe() was asked for word_timestamps; then one
+    # entry per `text.split()` token, in order (streaming.py's committed-audio
+    # trimming, §7.4a, relies on that 1:1 alignment).
+    words: list[WordTiming] = field(default_factory=list)
+    # Set on a final pass the backend re-decoded with beam search
+    # (stt.escalate_beam_size): why, and the extra decode's wall time.
+    escalation: str = ""
+    escalation_ms: float = 0.0
 
 
 @dataclass
@@ -0,0 +1,98 @@
+"""Bounded pipeline queues with explicit overflow policies (DESIGN.md §7.2).
+
+The three queues between ScribaApp's threads -- capture -> detector
+(frames), detector -> STT (chunks), STT -> injector (jobs) -- used to be
+unbounded: a stall on any consumer (a slow VAD batch, a model reload, an
+injector stuck behind a UAC prompt) let the backlog, and the latency of
+everything behind it, grow without limit. `BoundedQueue` (user request)
+caps each one, and what happens at the cap is the queue's policy rather
+than a blocked producer -- the PortAudio callback can't block at all:
+
+1. `coalesce(items)` folds queued entries together without losing
+   anything (chunks of one utterance; a partial job into the next job of
+   its utterance) and returns how many entries that freed.
+2. `shed(items)` drops one entry it can afford to lose (frames: the
+   oldest from a device that isn't the arbiter's winner, else the oldest
+   frame) and returns whether it did.
+3. If neither made room, the entry is queued anyway and counted as an
+   overflow: chunks and jobs carry words, which no policy drops.
+
+`stats()` reports the depth, high-water mark and each counter; ScribaApp
+logs them when they change and writes them to `queue_stats_path()`, where
+`--diagnose` reads the last session's. Stdlib only, so diagnose.py can
+import it.
+"""
+
+import json
+import queue
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .config import logs_dir
+
+
+@dataclass
+class QueueStats:
+    name: str
+    maxsize: int
+    depth: int = 0
+    high_water: int = 0  # deepest the queue has been
+    coalesced: int = 0  # entries folded into others (nothing lost)
+    dropped: int = 0  # entries shed
+    overflowed: int = 0  # entries queued past maxsize (no policy could make room)
+
+
+class BoundedQueue(queue.Queue):
+    """A `queue.Queue` capped at `maxsize` by policy (module docstring):
+    `put()` never blocks and never raises `queue.Full`. `coalesce` and
+    `shed` run under the queue's lock with its deque of entries, oldest
+    first, and may edit it in place."""
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        coalesce: Callable[[deque], int] | None = None,
+        shed: Callable[[deque], bool] | None = None,
+    ) -> None:
+        super().__init__()  # unbounded underneath: put() must not wait for room
+        self._stats = QueueStats(name, maxsize)
+        self._coalesce = coalesce
+        self._shed = shed
+
+    def stats(self) -> QueueStats:
+        with self.mutex:
+            self._stats.depth = len(self.queue)
+            return QueueStats(**asdict(self._stats))
+
+    def _put(self, item) -> None:
+        stats = self._stats
+        if len(self.queue) >= stats.maxsize and self._coalesce is not None:
+            stats.coalesced += self._coalesce(self.queue)
+        if len(self.queue) >= stats.maxsize and self._shed is not None and self._shed(self.queue):
+            stats.dropped += 1
+        if len(self.queue) >= stats.maxsize:
+            stats.overflowed += 1
+        self.queue.append(item)
+        stats.high_water = max(stats.high_water, len(self.queue))
+
+
+def queue_stats_path() -> Path:
+    return logs_dir() / "queue_stats.json"
+
+
+def save_queue_stats(stats: list[QueueStats], path: Path | None = None) -> None:
+    path = path or queue_stats_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([asdict(s) for s in stats], indent=1), encoding="utf-8")
+
+
+def load_queue_stats(path: Path | None = None) -> list[QueueStats]:
+    """The last `save_queue_stats()` snapshot; empty if there is none."""
+    path = path or queue_stats_path()
+    try:
+        return [QueueStats(**entry) for entry in json.loads(path.read_text(encoding="utf-8"))]
+    except (OSError, ValueError, TypeError):
+        return []
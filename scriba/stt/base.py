@@ -11,6 +11,24 @@ buffer plus the resolved language directly, instead of a message object.
 (decoder priming; also used by `streaming.py`'s window management, §7.4a, to
 carry already-committed text forward once older audio is dropped from the
 re-decode window) are both optional.
+
+`word_timestamps=True` asks for `Transcript.words` (per-token audio
+alignment). Only `streaming.py` requests it, and only when
+`streaming.trim_committed` is on, so it's passed as a keyword solely in that
+case -- backends that can't align words may omit the parameter and simply
+never be used with that setting.
+
+`final=True` marks the utterance's final pass (speculative or not), which
+the result is committed from; partial passes are `final=False`. A backend
+may spend more on it -- `WhisperLocalBackend` re-decodes a low-confidence
+final pass with beam search (`stt.escalate_*`) and reports that in
+`Transcript.escalation`.
+
+Optional: a backend that can decode precomputed log-mel features exposes
+`feature_cache() -> MelFeatureCache | None` (features.py). `streaming.py`
+then passes `features=` -- that cache's output for exactly `pcm` -- to
+that backend's passes; like `word_timestamps`, only to backends that
+offered a cache, so the others need neither.
 """
 
 from collections.abc import Callable
@@ -30,6 +48,8 @@ class SttBackend(Protocol):
         language: str | None,
         hotwords: str | None = None,
         initial_prompt: str | None = None,
+        word_timestamps: bool = False,
+        final: bool = False,
     ) -> Transcript: ...
 
     def unload(self) -> None: ...
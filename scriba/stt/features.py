@@ -0,0 +1,155 @@
+"""Incremental log-mel features for streaming re-decode passes (DESIGN.md §7.4a).
+
+faster-whisper's `FeatureExtractor` turns the whole decode buffer into a
+log-mel spectrogram inside every `transcribe()` call, so each partial pass
+recomputes the features of all the audio the previous pass already saw --
+a measurable slice of every pass on the CPU rungs, growing with the
+utterance. `MelFeatureCache` (user request) reproduces that extractor's
+output for one streaming utterance incrementally: `StreamingSession` hands
+it the buffer on every pass, and only newly appended audio is transformed.
+
+The extractor zero-pads the waveform by one hop, reflect-pads it by half
+an FFT window at both ends, and frames it every `_HOP` samples, so frame
+`k` is centred on sample `k * _HOP` and depends on samples
+`[k * _HOP - 200, k * _HOP + 200)`. A frame whose window lies entirely in
+audio already seen can't change any more: those are computed once and
+kept. The last few frames, whose windows still reach into the padding,
+are recomputed on every pass (at most two). The extractor's final
+normalization -- clamp to 8 below the maximum, then scale -- depends on
+every frame, so only the un-normalized log10 mel is cached and the
+normalization runs per pass, over just the frames that pass decodes.
+
+Front drops (`drop_front`, in lockstep with the session's window and
+committed-audio trimming) must be whole hops to keep frames aligned; the
+session rounds them up. Frames right after a drop keep the real audio
+that preceded them, where a fresh extraction of the trimmed buffer would
+reflect-pad -- a difference confined to its first two frames (20 ms),
+which the decode's own edge effects already dominate. Likewise, decoding a
+sub-range (silence trimming) selects the cached frames of that range,
+computed with its real neighbours rather than reflect padding.
+"""
+
+import time
+from collections.abc import Sequence
+
+import numpy as np
+
+_N_FFT = 400
+_HOP = 160
+_HALF = _N_FFT // 2
+
+
+class MelFeatureCache:
+    """Log-mel features of one streaming utterance's buffer (module docstring).
+
+    `mel_filters` is the model's `FeatureExtractor.mel_filters` (80 or 128
+    bands, depending on the model). `extract_s`/`passes` sum the time spent
+    in `features()` and count its calls, for `scriba bench --micro`.
+    """
+
+    def __init__(self, mel_filters: np.ndarray) -> None:
+        self._filters = mel_filters.astype(np.float32)
+        self._window = np.hanning(_N_FFT + 1)[:-1].astype(np.float32)
+        # Stable frames of the current buffer in columns [_start, _end).
+        self._log_mel = np.empty((self.n_mels, 0), dtype=np.float32)
+        self._start = 0
+        self._end = 0
+        self.extract_s = 0.0
+        self.passes = 0
+
+    @property
+    def n_mels(self) -> int:
+        return self._filters.shape[0]
+
+    @property
+    def stable_frames(self) -> int:
+        return self._end - self._start
+
+    def reset(self) -> None:
+        self._start = self._end = 0
+
+    @staticmethod
+    def align(n_samples: int) -> int:
+        """`n_samples` rounded up to a whole hop: a front drop the cache can follow."""
+        return -(-n_samples // _HOP) * _HOP
+
+    def drop_front(self, n_samples: int) -> None:
+        """The buffer lost its first `n_samples` (a multiple of `_HOP`; anything
+        else clears the cache)."""
+        if n_samples % _HOP:
+            self.reset()
+            return
+        self._start = min(self._start + n_samples // _HOP, self._end)
+
+    def features(
+        self, pcm: np.ndarray, ranges: Sequence[tuple[int, int]] | None = None
+    ) -> np.ndarray:
+        """Normalized log-mel features of int16 `pcm` -- the whole buffer, as
+        `FeatureExtractor(pcm)` would return them -- or of the `ranges` of it
+        spliced together."""
+        t0 = time.perf_counter()
+        size = pcm.size
+        stable = (size - _HALF) // _HOP + 1 if size >= _HALF else 0
+        if stable > self.stable_frames:
+            self._append(self._frames(pcm, self.stable_frames, stable))
+        n_frames = size // _HOP + 1
+        log_mel = np.concatenate(
+            [self._log_mel[:, self._start : self._end], self._frames(pcm, stable, n_frames)],
+            axis=1,
+        )
+        if ranges is not None and list(ranges) != [(0, size)]:
+            log_mel = log_mel[:, _range_columns(ranges, n_frames)]
+        log_mel = np.maximum(log_mel, log_mel.max() - 8.0)
+        result = (log_mel + 4.0) / 4.0
+        self.extract_s += time.perf_counter() - t0
+        self.passes += 1
+        return result
+
+    def _frames(self, pcm: np.ndarray, first: int, last: int) -> np.ndarray:
+        """Un-normalized log10 mel of frames `[first, last)` of `pcm`."""
+        if last <= first:
+            return np.empty((self.n_mels, 0), dtype=np.float32)
+        source = _padded(pcm, first * _HOP - _HALF, (last - 1) * _HOP + _HALF)
+        windows = np.lib.stride_tricks.sliding_window_view(source, _N_FFT)[::_HOP]
+        spectrum = np.fft.rfft(windows * self._window, axis=-1).astype(np.complex64)
+        mel = self._filters @ (np.abs(spectrum) ** 2).T
+        return np.log10(np.clip(mel, 1e-10, None))
+
+    def _append(self, frames: np.ndarray) -> None:
+        n = frames.shape[1]
+        if self._end + n > self._log_mel.shape[1]:
+            live = self._log_mel[:, self._start : self._end]
+            capacity = max(2 * (live.shape[1] + n), 256)
+            grown = np.empty((self.n_mels, capacity), dtype=np.float32)
+            grown[:, : live.shape[1]] = live
+            self._log_mel = grown
+            self._end -= self._start
+            self._start = 0
+        self._log_mel[:, self._end : self._end + n] = frames
+        self._end += n
+
+
+def _padded(pcm: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    """Samples `[lo, hi)` of `pcm` as float32, as the extractor pads it: one
+    hop of zeros appended, then reflected by `_HALF` at both ends."""
+    if lo >= 0 and hi <= pcm.size:
+        return pcm[lo:hi].astype(np.float32) / 32768.0
+    padded_end = pcm.size + _HOP
+    index = np.arange(lo, hi)
+    index = np.where(index < 0, -index, index)
+    index = np.where(index >= padded_end, 2 * (padded_end - 1) - index, index)
+    samples = np.zeros(index.size, dtype=np.float32)
+    inside = index < pcm.size
+    samples[inside] = pcm[index[inside]].astype(np.float32) / 32768.0
+    return samples
+
+
+def _range_columns(ranges: Sequence[tuple[int, int]], n_frames: int) -> np.ndarray:
+    """Frame columns for the spliced `ranges`: as many as the extractor would
+    make for audio that long, from the frames nearest each range's start."""
+    columns = [
+        np.arange(round(start / _HOP), round(start / _HOP) + (end - start) // _HOP)
+        for start, end in ranges
+    ]
+    columns.append(np.array([round(ranges[-1][1] / _HOP)]))
+    return np.clip(np.concatenate(columns), 0, n_frames - 1)
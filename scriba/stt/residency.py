@@ -0,0 +1,279 @@
+"""Idle residency tiers for the STT model (DESIGN.md §9).
+
+Idle-unload used to be all or nothing: after `stt.idle_unload_minutes` with
+dictation off the whole model went, and the next activation waited on a
+full reload -- disk read, CTranslate2 conversion to the compute type,
+warmup -- before the first word. `stt.idle_tier` (user request) picks what
+idle-unload keeps instead:
+
+- "small": a `small` int8 CPU model (`WAKE_MODEL`, ~200 MB host RAM) stays
+  loaded. Activating enables dictation on it at once while the configured
+  model reloads in the background; `ScribaApp` hot-swaps back at the next
+  utterance boundary.
+- "cache": nothing stays loaded, but `PageCacheWarmer` re-reads the
+  model's files every `CACHE_WARM_INTERVAL_S` so the OS page cache still
+  holds them: the reload skips the disk, not the conversion or warmup.
+- "unload" (default): the old behavior. The other two are opt-in: they
+  hold RAM or re-read the disk while dictation is off.
+
+`measure_idle_tiers()` loads the models the way each tier would and times
+it, for `--diagnose`.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from ..config import Config, models_dir
+
+logger = logging.getLogger(__name__)
+
+IDLE_TIERS = ("small", "cache", "unload")
+WAKE_MODEL = "small"
+WAKE_DEVICE = "cpu"
+
+# A pass re-reads the whole model (~1.5 GB), so not every idle-timer tick:
+# often enough to beat standby-list eviction on an otherwise idle machine.
+CACHE_WARM_INTERVAL_S = 300.0
+
+_READ_CHUNK = 4 << 20
+
+
+def model_files(model_name: str) -> list[Path]:
+    """The cached files of `model_name` in `models_dir()` (none if not downloaded)."""
+    directory = models_dir() / model_name
+    if not directory.is_dir():
+        return []
+    return sorted(p for p in directory.iterdir() if p.is_file())
+
+
+class PageCacheWarmer:
+    """Keeps `paths` in the OS page cache by reading them through, on every
+    `warm()` -- the "cache" tier. Reading files the cache still holds is a
+    memory copy (a fraction of a second for a 1.5 GB model); files it has
+    evicted come back from disk, which is the point. `due()` paces the
+    passes: at most one running, one per `interval_s`."""
+
+    def __init__(self, paths: list[Path], interval_s: float = CACHE_WARM_INTERVAL_S) -> None:
+        self._paths = paths
+        self._interval_s = interval_s
+        self._lock = threading.Lock()  # one pass at a time; later calls skip
+        self._started: float | None = None  # time.monotonic() of the last pass
+        self.last_s = 0.0
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self._paths if p.exists())
+
+    def due(self) -> bool:
+        """True if no pass is running and none started in the last `interval_s`."""
+        if self._lock.locked():
+            return False
+        return self._started is None or time.monotonic() - self._started >= self._interval_s
+
+    def warm(self) -> int:
+        """Reads every file once; returns the bytes read (0 if a pass is
+        already running on another thread)."""
+        if not self._lock.acquire(blocking=False):
+            return 0
+        try:
+            self._started = time.monotonic()
+            t0 = time.perf_counter()
+            total = 0
+            buffer = bytearray(_READ_CHUNK)
+            for path in self._paths:
+                try:
+                    with path.open("rb", buffering=0) as f:
+                        while n := f.readinto(buffer):
+                            total += n
+                except OSError as exc:
+                    logger.warning("page-cache warm of %s failed: %s", path, exc)
+            self.last_s = time.perf_counter() - t0
+            return total
+        finally:
+            self._lock.release()
+
+
+def process_rss_bytes() -> int | None:
+    """This process's resident set (working set on Windows); None if unknown."""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _Counters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(
+            process, ctypes.byref(counters), counters.cb
+        ):
+            return None
+        return int(counters.WorkingSetSize)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def gpu_memory_used_bytes() -> int | None:
+    """VRAM in use on GPU 0 per `nvidia-smi` (all processes); None without one."""
+    executable = shutil.which("nvidia-smi")
+    if executable is None:
+        return None
+    try:
+        out = subprocess.run(
+            [executable, "--query-gpu=memory.used", "--format=csv,noheader,nounits"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        ).stdout
+        return int(out.splitlines()[0].strip()) << 20
+    except (OSError, subprocess.SubprocessError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class TierReport:
+    """One `stt.idle_tier` as measured by `measure_idle_tiers()`.
+
+    `ram_bytes`/`vram_bytes` are what the tier keeps resident while idle
+    (None: couldn't be measured). `wake_s` is activation to dictation
+    usable; `full_s` activation to the configured model back in service.
+    """
+
+    tier: str
+    ram_bytes: int | None
+    vram_bytes: int | None
+    wake_s: float | None
+    full_s: float | None
+    note: str = ""
+
+
+def _delta(after: int | None, before: int | None) -> int | None:
+    if after is None or before is None:
+        return None
+    return max(0, after - before)
+
+
+def _load_timed(model_name: str, device: str, compute_type: str) -> tuple[object, float]:
+    from faster_whisper import WhisperModel
+
+    t0 = time.perf_counter()
+    model = WhisperModel(str(models_dir() / model_name), device=device, compute_type=compute_type)
+    segments, _info = model.transcribe(
+        np.zeros(16000, dtype=np.float32),
+        language="en",
+        beam_size=1,
+        condition_on_previous_text=False,
+        vad_filter=False,
+        without_timestamps=True,
+    )
+    list(segments)
+    return model, time.perf_counter() - t0
+
+
+def measure_idle_tiers(config: Config, cuda_available: bool) -> list[TierReport]:
+    """Footprint and wake latency of each idle tier on this machine.
+
+    Loads the configured model (rung 1, or the CPU rung without CUDA) and
+    `WAKE_MODEL` from the local cache -- never downloads; a model that
+    isn't cached yet raises `FileNotFoundError`. The resident model's
+    footprint is what every tier frees. "cache" and "unload" wake by
+    reloading it; here the page cache is warm either way (nothing portable
+    can evict it), so "unload" adds the time to read the model's files
+    cold, measured as their size at the first warming pass's throughput.
+    """
+    model_name = config.stt.model
+    files = model_files(model_name)
+    if not any(p.name == "model.bin" for p in files):
+        raise FileNotFoundError(f"{model_name} is not downloaded yet")
+    if not (models_dir() / WAKE_MODEL / "model.bin").exists():
+        raise FileNotFoundError(f"{WAKE_MODEL} is not downloaded yet")
+    use_cuda = cuda_available and config.stt.device != "cpu"
+    device, compute_type = ("cuda", "int8_float16") if use_cuda else ("cpu", "int8")
+
+    warmer = PageCacheWarmer(files)
+    size = warmer.warm()
+    first_read_s = warmer.last_s
+    warmer.warm()
+
+    ram0, vram0 = process_rss_bytes(), gpu_memory_used_bytes()
+    model, reload_s = _load_timed(model_name, device, compute_type)
+    resident = TierReport(
+        "resident",
+        _delta(process_rss_bytes(), ram0),
+        _delta(gpu_memory_used_bytes(), vram0),
+        0.0,
+        0.0,
+        f"{model_name}/{compute_type}/{device}",
+    )
+    del model
+
+    ram0 = process_rss_bytes()
+    wake_model, wake_load_s = _load_timed(WAKE_MODEL, WAKE_DEVICE, "int8")
+    small_ram = _delta(process_rss_bytes(), ram0)
+    t0 = time.perf_counter()
+    segments, _info = wake_model.transcribe(  # type: ignore[attr-defined]
+        np.zeros(16000, dtype=np.float32), language="en", beam_size=1, vad_filter=False
+    )
+    list(segments)
+    first_decode_s = time.perf_counter() - t0
+    del wake_model
+
+    cold_read_s = first_read_s if first_read_s > warmer.last_s * 2 else None
+    return [
+        resident,
+        TierReport(
+            "small",
+            small_ram,
+            0,
+            0.0,
+            reload_s,
+            f"{WAKE_MODEL}/int8/{WAKE_DEVICE} kept loaded ({wake_load_s:.1f} s to load it; "
+            f"1 s of audio decodes in {first_decode_s:.2f} s on it)",
+        ),
+        TierReport(
+            "cache",
+            0,
+            0,
+            reload_s,
+            reload_s,
+            f"{size / 2**20:.0f} MB kept in the page cache, re-read every "
+            f"{CACHE_WARM_INTERVAL_S / 60:.0f} min idle "
+            f"({warmer.last_s:.2f} s per pass)",
+        ),
+        TierReport(
+            "unload",
+            0,
+            0,
+            reload_s + cold_read_s if cold_read_s is not None else None,
+            reload_s + cold_read_s if cold_read_s is not None else None,
+            "reload + cold read"
+            if cold_read_s is not None
+            else f"reload ({reload_s:.1f} s) + a cold read of {size / 2**20:.0f} MB "
+            "(files were already cached; not measurable here)",
+        ),
+    ]
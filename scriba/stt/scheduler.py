@@ -0,0 +1,105 @@
+"""Adaptive partial re-decode pacing for `StreamingSession` (DESIGN.md §7.4a, user request).
+
+A fixed `streaming.interval_ms` cadence assumes a decode pass always fits
+inside one interval. On a slow rung (or a busy GPU) it doesn't: the STT
+worker falls behind, `AudioChunk`s pile up in `chunk_queue`, and every
+stale partial it does produce is typed only to be backspaced again, while
+the final pass waits behind all of them.
+
+`RtfTracker` keeps an exponential moving average of decode wall time /
+decoded audio time per backend `descriptor` (so a rung change starts a fresh
+estimate); `ScribaApp` owns one for the whole run, so later utterances start
+from what earlier ones measured. `DecodeScheduler` (one per session) turns
+that into the next partial decode point:
+
+- the gap between partial passes is stretched to `_HEADROOM` x the predicted
+  cost of decoding the current buffer, never below `interval_ms` -- so
+  decoding takes at most ~2/3 of the worker's time and it keeps up;
+- a partial is skipped outright when the chunk being fed is already more
+  than one interval old (the worker is behind; catching up matters more
+  than a partial nobody will see for long);
+- the final pass is never scheduled here -- `StreamingSession` always runs
+  it immediately.
+"""
+
+from dataclasses import dataclass, field
+
+_EMA_ALPHA = 0.3  # weight of the newest decode in the RTF moving average
+_HEADROOM = 1.5  # partial gap >= 1.5x predicted decode time (<= ~67% duty cycle)
+
+
+class RtfTracker:
+    """Per-backend-descriptor moving average of decode real-time factor (wall / audio)."""
+
+    def __init__(self) -> None:
+        self._rtf: dict[str, float] = {}
+
+    def record(self, descriptor: str, wall_s: float, audio_s: float) -> None:
+        if audio_s <= 0:
+            return
+        rtf = wall_s / audio_s
+        previous = self._rtf.get(descriptor)
+        self._rtf[descriptor] = (
+            rtf if previous is None else _EMA_ALPHA * rtf + (1 - _EMA_ALPHA) * previous
+        )
+
+    def rtf(self, descriptor: str) -> float | None:
+        return self._rtf.get(descriptor)
+
+
+@dataclass
+class CadenceStats:
+    """What one utterance's partial passes actually did; logged with the final pass."""
+
+    partials: int = 0
+    skipped_behind: int = 0
+    partial_times: list[float] = field(default_factory=list)  # chunk time of each partial
+
+    @property
+    def effective_cadence_ms(self) -> float | None:
+        if len(self.partial_times) < 2:
+            return None
+        span = self.partial_times[-1] - self.partial_times[0]
+        return span / (len(self.partial_times) - 1) * 1000
+
+
+class DecodeScheduler:
+    """Decides, per fed chunk, whether a partial decode pass is due (see module docstring)."""
+
+    def __init__(self, interval_s: float, tracker: RtfTracker, adaptive: bool = True) -> None:
+        self._interval_s = interval_s
+        self._tracker = tracker
+        self._adaptive = adaptive
+        self._last_t = 0.0
+        self.stats = CadenceStats()
+
+    def start(self, t: float) -> None:
+        """Starts the cadence clock at the utterance's first chunk."""
+        self._last_t = t
+        self.stats = CadenceStats()
+
+    def interval_s(self, descriptor: str, buffer_s: float) -> float:
+        """The current gap between partial passes for a `buffer_s`-second decode."""
+        rtf = self._tracker.rtf(descriptor) if self._adaptive else None
+        if rtf is None:
+            return self._interval_s
+        return max(self._interval_s, _HEADROOM * rtf * buffer_s)
+
+    def partial_due(
+        self, descriptor: str, buffer_s: float, chunk_t: float, now: float | None
+    ) -> bool:
+        """True if a partial pass should run for the chunk stamped `chunk_t`.
+
+        `now` is the caller's current time on the same clock as `chunk_t`
+        (None: lag unknown, never skip). A slot skipped because the worker is
+        behind still counts as taken, so the next one is a full interval on.
+        """
+        if chunk_t - self._last_t < self.interval_s(descriptor, buffer_s):
+            return False
+        self._last_t = chunk_t
+        if self._adaptive and now is not None and now - chunk_t > self._interval_s:
+            self.stats.skipped_behind += 1
+            return False
+        self.stats.partials += 1
+        self.stats.partial_times.append(chunk_t)
+        return True
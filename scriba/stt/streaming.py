@@ -12,23 +12,33 @@ and reads `Transcript`s from wherever `emit` delivered them.
 
 `interval_ms`-paced re-decoding is gated on `AudioChunk.t_monotonic` (the
 caller's clock), not a real timer/sleep, so this class makes no threads, does
-no I/O, and is deterministic to unit test.
+no I/O, and is deterministic to unit test. When `streaming.adaptive` is on,
+scheduler.py stretches that cadence to what the backend's measured speed can
+sustain and skips partials while the worker is behind; the optional `clock`
+(same timebase as `t_monotonic`) is what "behind" is measured against.
 """
 
 import logging
 import queue
 import time
+from collections import deque
 from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 
 import numpy as np
 
+from ..audio.buffer import PcmBuffer
 from ..config import Config
-from ..messages import AudioChunk, Transcript
+from ..messages import AudioChunk, Transcript, WordTiming
+from ..trace import TRACE
 from .base import SttBackend
+from .features import MelFeatureCache
+from .scheduler import CadenceStats, DecodeScheduler, RtfTracker
 
 logger = logging.getLogger(__name__)
 
 _SAMPLE_RATE = 16000
+_VAD_FRAME = 512  # samples per `AudioChunk.vad_probs` entry
 
 
 def local_agreement_prefix(
@@ -61,6 +71,105 @@ def partial_text(policy: str, committed_words: Sequence[str], current_words: Seq
     raise ValueError(f"unknown streaming policy: {policy!r}")
 
 
+def coalesce_chunks(chunks: Sequence[AudioChunk]) -> list[AudioChunk]:
+    """Merges each run of consecutive same-utterance chunks into one chunk.
+
+    The STT worker drains everything queued while it was busy decoding and
+    feeds the result through this, so a backlog costs one buffer append and
+    at most one partial pass per utterance instead of one interval check
+    (and possibly one stale partial) per 32 ms chunk. A merged chunk keeps
+    the run's first `device_id`/`language`, the *last* `t_monotonic`, and is
+    `is_final` if any chunk in the run was -- the session then goes straight
+    to the final pass -- and `tentative_end` only if every chunk was (speech
+    that resumed inside the run still invalidates a speculative final).
+    `vad_probs` are concatenated while they still line up with the merged
+    audio (every chunk scored, only the first with an unscored head);
+    otherwise the merged chunk is unscored. Order across utterances is
+    preserved.
+    """
+    merged: list[AudioChunk] = []
+    run: list[AudioChunk] = []
+
+    def flush() -> None:
+        if not run:
+            return
+        if len(run) == 1:
+            merged.append(run[0])
+        else:
+            pcms = [c.pcm for c in run if c.pcm is not None and c.pcm.size]
+            merged.append(
+                AudioChunk(
+                    utterance_id=run[0].utterance_id,
+                    device_id=run[0].device_id,
+                    pcm=np.concatenate(pcms) if pcms else None,
+                    t_monotonic=run[-1].t_monotonic,
+                    is_final=any(c.is_final for c in run),
+                    language=run[0].language,
+                    tentative_end=all(c.tentative_end for c in run),
+                    vad_probs=_merged_probs(run),
+                )
+            )
+        run.clear()
+
+    for chunk in chunks:
+        if run and chunk.utterance_id != run[0].utterance_id:
+            flush()
+        run.append(chunk)
+    flush()
+    return merged
+
+
+def coalesce_queued_chunks(items: "deque[AudioChunk]") -> int:
+    """`chunk_queue`'s overflow policy (scriba/queues.py): `coalesce_chunks`
+    over everything still queued, in place -- what the STT worker would do
+    on its next drain anyway. Returns how many entries it folded away."""
+    before = len(items)
+    merged = coalesce_chunks(list(items))
+    items.clear()
+    items.extend(merged)
+    return before - len(merged)
+
+
+def _merged_probs(run: Sequence[AudioChunk]) -> np.ndarray | None:
+    probs: list[np.ndarray] = []
+    for chunk in run:
+        if chunk.pcm is None or not chunk.pcm.size:
+            continue
+        if chunk.vad_probs is None:
+            return None
+        if probs and chunk.vad_probs.size * _VAD_FRAME != chunk.pcm.size:
+            return None  # an unscored head past the first chunk: no longer lines up
+        probs.append(chunk.vad_probs)
+    return np.concatenate(probs) if probs else None
+
+
+def _buffer_sample(t_s: float, ranges: Sequence[tuple[int, int]]) -> int:
+    """Maps a time in the decoded audio (the `ranges` of the buffer, spliced
+    together) back to a sample offset in the buffer."""
+    remaining = round(t_s * _SAMPLE_RATE)
+    for start, end in ranges:
+        if remaining <= end - start:
+            return start + max(remaining, 0)
+        remaining -= end - start
+    return ranges[-1][1]
+
+
+@dataclass
+class SpeculationStats:
+    """One utterance's speculative final passes (see `StreamingSession`)."""
+
+    hits: int = 0  # endpoint confirmed: the speculative result was emitted
+    misses: int = 0  # speech resumed: the speculative result was dropped
+
+
+@dataclass
+class TrimStats:
+    """One utterance's decode input, summed over its passes (`stt.trim_silence`)."""
+
+    buffered_s: float = 0.0  # audio the passes would have decoded untrimmed
+    decoded_s: float = 0.0  # audio they actually decoded
+
+
 class StreamingSession:
     """Feeds `AudioChunk`s for one `utterance_id` through re-decode + LocalAgreement-2 (§7.4a).
 
@@ -79,6 +188,66 @@ class StreamingSession:
     `window_s` default 15s >> `interval_ms` default 800ms) but can lose a
     sliver of leading audio if a window overflow happens before any decode
     pass has completed.
+
+    `streaming.trim_committed` (user request) replaces that approximation
+    with exact alignment: partial passes ask the backend for word
+    timestamps, and as soon as LocalAgreement-2 commits words, the audio
+    they span is cut from the front of the buffer and their text moves into
+    `initial_prompt`. Each pass then only re-decodes the uncommitted tail,
+    so per-pass cost stays roughly constant instead of growing with the
+    utterance (total work linear, not quadratic, in utterance length). The
+    last word of a pass is never trimmed -- there's no following word yet
+    to prove the speaker finished it -- and the cut lands midway between
+    the last trimmed word's end and the next word's start, since Whisper's
+    word boundaries are only accurate to a frame or two. `_enforce_window`
+    stays as the hard cap for stretches where nothing commits.
+
+    `stt.speculative_final` (user request): the detector marks chunks
+    `tentative_end` from the first below-threshold frame on, ~600 ms before
+    the endpoint can confirm. Once `stt.speculative_after_ms` of that
+    silence has passed (rides out inter-word pauses, which otherwise make
+    most speculations misses) the session runs the final pass on what it
+    has -- the rest of the wait is silence by definition -- and holds the
+    result; partial passes stop, there's nothing new to show. If
+    the endpoint confirms, the held result is emitted as-is (a hit: the
+    final decode overlapped the silence wait instead of following it); a
+    chunk without `tentative_end` means speech resumed and the held result
+    is dropped (a miss: one wasted decode). This applies with streaming
+    partials off too, where the final pass is the only one. `speculation`
+    counts both.
+
+    `partial_backend` (`streaming.partial_model`, user request): a smaller,
+    faster model for the partial passes only; the final pass -- speculative
+    or not -- always uses `backend`. Partials then arrive sooner and leave
+    the big model free for the final, at the cost of the final revising
+    more of what the partials typed. Cadence pacing tracks the partial
+    model's RTF. Committed-audio trimming is skipped while a partial model
+    is in use (see `_decode`); the `window_s` cap still carries partial text
+    as prefix, but only on utterances longer than the window.
+
+    `on_text(utterance_id, text)`, if given, gets the full text of every
+    partial and speculative pass as it lands -- the detector's adaptive
+    endpoint (`Detector.observe_text`) reads how it ends.
+
+    `stt.trim_silence` (user request): the buffer holds the 400 ms pre-roll
+    and, by the final pass, the whole endpoint silence -- over a second
+    Whisper decodes for nothing and likes to hallucinate into. The session
+    keeps the spans the detector scored as speech (`AudioChunk.vad_probs`
+    at or above `vad.threshold`; audio that arrives unscored counts as
+    speech, pre-roll as not) and decodes only from `stt.trim_guard_ms`
+    before the first to `trim_guard_ms` after the last. `stt.max_pause_ms`
+    > 0 also shortens longer pauses between speech spans to that length.
+    Nothing is trimmed if nothing in the buffer scored as speech. Word
+    timestamps are mapped back through the cut (`_buffer_sample`), so
+    committed-audio trimming still cuts the right buffer audio. `trim`
+    sums what each utterance's passes decoded against what they'd have
+    decoded untrimmed.
+
+    `streaming.feature_cache` (user request): if the partial backend offers
+    a `feature_cache()` (features.py), the session keeps one per utterance
+    and passes each of that backend's passes its log-mel `features`, so
+    only newly appended audio is transformed. Front drops are then rounded
+    up to whole feature hops (10 ms) so the cache can follow them.
     """
 
     def __init__(
@@ -87,25 +256,52 @@ class StreamingSession:
         config: Config,
         emit: "Callable[[Transcript], None] | queue.Queue",
         hotwords: str | None = None,
+        rtf_tracker: RtfTracker | None = None,
+        clock: Callable[[], float] | None = None,
+        on_text: Callable[[int, str], None] | None = None,
+        partial_backend: SttBackend | None = None,
     ) -> None:
         self._backend = backend
+        self._partial_backend = partial_backend if partial_backend is not None else backend
+        self._on_text = on_text
         self._config = config
         self._emit: Callable[[Transcript], None] = (
             emit.put if isinstance(emit, queue.Queue) else emit
         )
         self._hotwords = hotwords
+        self._clock = clock
+        self._rtf = rtf_tracker if rtf_tracker is not None else RtfTracker()
+        self._scheduler = DecodeScheduler(
+            config.streaming.interval_ms / 1000.0, self._rtf, config.streaming.adaptive
+        )
         self._utterance_id: int | None = None
         self._language: str | None = None
-        self._buffer = np.zeros(0, dtype=np.int16)
+        # Sized for the re-decode window so streaming never regrows it; a
+        # longer non-streaming utterance just doubles it (audio/buffer.py).
+        self._buffer = PcmBuffer((config.streaming.window_s + 1) * _SAMPLE_RATE)
         self._prefix_text = ""
         self._prev_pass_words: list[str] = []
-        self._last_decode_t = 0.0
+        self._speculative: Transcript | None = None  # final pass run at the tentative end
+        self._silence_since: float | None = None  # start of the current endpoint-silence run
+        # Speech spans, [start, end) in samples since the utterance began;
+        # `_dropped` of those samples have been cut from the buffer's front.
+        self._speech: list[list[int]] = []
+        self._fed = 0
+        self._dropped = 0
+        self._features: MelFeatureCache | None = None
+        self.speculation = SpeculationStats()
+        self.trim = TrimStats()
 
     def feed(self, chunk: AudioChunk) -> None:
         if self._utterance_id is None:
             self._utterance_id = chunk.utterance_id
             self._language = chunk.language
-            self._last_decode_t = chunk.t_monotonic
+            self._scheduler.start(chunk.t_monotonic)
+            self.speculation = SpeculationStats()
+            self.trim = TrimStats()
+            cache_factory = getattr(self._partial_backend, "feature_cache", None)
+            if cache_factory is not None and self._config.streaming.feature_cache:
+                self._features = cache_factory()
         elif chunk.utterance_id != self._utterance_id:
             raise ValueError(
                 f"StreamingSession is bound to utterance_id={self._utterance_id}, "
@@ -113,30 +309,137 @@ class StreamingSession:
             )
 
         if chunk.pcm is not None and chunk.pcm.size:
-            self._buffer = np.concatenate([self._buffer, chunk.pcm])
+            self._buffer.append(chunk.pcm)
+            self._note_speech(chunk.pcm.size, chunk.vad_probs)
+
+        if self._speculative is not None and not chunk.tentative_end:
+            logger.debug(
+                "utterance %d: speech resumed, dropping speculative final", self._utterance_id
+            )
+            self._speculative = None
+            self.speculation.misses += 1
 
         if chunk.is_final:
-            self._decode(is_final=True)
+            if self._speculative is not None:
+                self.speculation.hits += 1
+                logger.info(
+                    "utterance %d: endpoint confirmed, using speculative final", self._utterance_id
+                )
+                self._emit(self._speculative)
+            else:
+                self._decode(is_final=True)
+            self._log_cadence()
             self._reset()
             return
 
+        if not chunk.tentative_end:
+            self._silence_since = None
+        elif self._silence_since is None:
+            # The chunk's timestamp is its last sample's; the run started at its first.
+            n = chunk.pcm.size if chunk.pcm is not None else 0
+            self._silence_since = chunk.t_monotonic - n / _SAMPLE_RATE
+        if self._speculative is None and self._speculation_due(chunk.t_monotonic):
+            self._speculative = self._decode(is_final=True, speculative=True)
+        if self._speculative is not None:
+            return  # endpoint silence: no partials, the final is already in hand
+
         if not self._config.streaming.enabled:
             return
 
         self._enforce_window()
 
-        interval_s = self._config.streaming.interval_ms / 1000.0
-        if chunk.t_monotonic - self._last_decode_t >= interval_s:
-            self._last_decode_t = chunk.t_monotonic
+        if self._scheduler.partial_due(
+            self._partial_backend.descriptor,
+            self._buffer.size / _SAMPLE_RATE,
+            chunk.t_monotonic,
+            self._clock() if self._clock is not None else None,
+        ):
             self._decode(is_final=False)
 
+    def _note_speech(self, n_samples: int, probs: np.ndarray | None) -> None:
+        start = self._fed
+        self._fed += n_samples
+        if probs is None:
+            self._add_speech(start, self._fed)  # unscored: never trim it
+            return
+        first_frame = self._fed - probs.size * _VAD_FRAME
+        for i in np.flatnonzero(probs >= self._config.vad.threshold):
+            frame = first_frame + int(i) * _VAD_FRAME
+            self._add_speech(max(frame, start), frame + _VAD_FRAME)
+
+    def _add_speech(self, start: int, end: int) -> None:
+        if self._speech and start <= self._speech[-1][1]:
+            self._speech[-1][1] = max(self._speech[-1][1], end)
+        else:
+            self._speech.append([start, end])
+
+    def _drop_front(self, n_samples: int) -> None:
+        if self._features is not None:
+            n_samples = min(self._features.align(n_samples), self._buffer.size)
+            self._features.drop_front(n_samples)
+        self._buffer.trim_front(n_samples)
+        self._dropped += n_samples
+        while self._speech and self._speech[0][1] <= self._dropped:
+            self._speech.pop(0)
+
+    def _decode_ranges(self) -> list[tuple[int, int]]:
+        """The [start, end) buffer ranges a pass decodes (class docstring)."""
+        size = self._buffer.size
+        stt = self._config.stt
+        base = self._dropped
+        spans = [(max(s, base) - base, e - base) for s, e in self._speech if e > base]
+        if not stt.trim_silence or not spans:
+            return [(0, size)]
+        guard = stt.trim_guard_ms * _SAMPLE_RATE // 1000
+        max_pause = stt.max_pause_ms * _SAMPLE_RATE // 1000
+        ranges: list[tuple[int, int]] = []
+        start = max(spans[0][0] - guard, 0)
+        for (_, prev_end), (next_start, _) in zip(spans, spans[1:], strict=False):
+            if max_pause and next_start - prev_end > max_pause:
+                ranges.append((start, prev_end + max_pause // 2))
+                start = next_start - (max_pause - max_pause // 2)
+        ranges.append((start, min(spans[-1][1] + guard, size)))
+        return ranges
+
+    def _speculation_due(self, t_monotonic: float) -> bool:
+        stt = self._config.stt
+        if not stt.speculative_final or self._silence_since is None:
+            return False
+        return t_monotonic - self._silence_since >= stt.speculative_after_ms / 1000 - 1e-6
+
+    @property
+    def cadence(self) -> CadenceStats:
+        """Partial-pass statistics for the current (or just-finished) utterance."""
+        return self._scheduler.stats
+
+    def _log_cadence(self) -> None:
+        stats = self._scheduler.stats
+        if not self._config.streaming.enabled or not (stats.partials or stats.skipped_behind):
+            return
+        cadence = stats.effective_cadence_ms
+        rtf = self._rtf.rtf(self._partial_backend.descriptor)
+        logger.info(
+            "utterance %d: %d partial pass(es), effective cadence %s, %d skipped (behind), "
+            "RTF %s",
+            self._utterance_id,
+            stats.partials,
+            f"{cadence:.0f} ms" if cadence is not None else "n/a",
+            stats.skipped_behind,
+            f"{rtf:.2f}" if rtf is not None else "n/a",
+        )
+
     def _reset(self) -> None:
         self._utterance_id = None
         self._language = None
-        self._buffer = np.zeros(0, dtype=np.int16)
+        self._buffer.clear()
         self._prefix_text = ""
         self._prev_pass_words = []
-        self._last_decode_t = 0.0
+        self._speculative = None
+        self._silence_since = None
+        self._speech = []
+        self._fed = 0
+        self._dropped = 0
+        self._features = None
 
     def _enforce_window(self) -> None:
         window_samples = self._config.streaming.window_s * _SAMPLE_RATE
@@ -144,28 +447,98 @@ class StreamingSession:
             return
         drop = self._buffer.size - window_samples
         if self._prev_pass_words:
-            self._prefix_text = " ".join([self._prefix_text, *self._prev_pass_words]).strip()
-        self._buffer = self._buffer[drop:]
+            # `_prev_pass_words` is the whole pass text, prefix included.
+            self._prefix_text = " ".join(self._prev_pass_words)
+        self._drop_front(drop)
         self._prev_pass_words = []
 
-    def _decode(self, is_final: bool) -> None:
+    def _trim_committed(
+        self,
+        words: list[WordTiming],
+        pass_words: list[str],
+        n_committed: int,
+        ranges: Sequence[tuple[int, int]],
+    ) -> None:
+        """Cuts the audio under this pass's first `n_committed` words (class docstring)."""
+        if len(words) != len(pass_words):
+            logger.debug(
+                "utterance %d: %d word timestamps for %d words; not trimming",
+                self._utterance_id,
+                len(words),
+                len(pass_words),
+            )
+            return
+        n_trim = min(n_committed, len(words) - 1)
+        if n_trim <= 0:
+            return
+        cut_s = (words[n_trim - 1].end + words[n_trim].start) / 2
+        cut = min(_buffer_sample(cut_s, ranges), self._buffer.size)
+        if cut <= 0:
+            return
+        self._prefix_text = " ".join([self._prefix_text, *pass_words[:n_trim]]).strip()
+        self._drop_front(cut)
+        logger.debug(
+            "utterance %d: trimmed %d committed word(s), %.0f ms of audio",
+            self._utterance_id,
+            n_trim,
+            cut / _SAMPLE_RATE * 1000,
+        )
+
+    def _decode(self, is_final: bool, speculative: bool = False) -> Transcript | None:
+        """Runs one pass; emits it, or for a `speculative` final pass returns it unemitted."""
         assert self._utterance_id is not None
-        t0 = time.perf_counter()
-        transcript = self._backend.transcribe(
-            self._buffer,
-            self._language,
-            hotwords=self._hotwords,
-            initial_prompt=self._prefix_text or None,
+        backend = self._backend if is_final else self._partial_backend
+        # Committed-audio trimming hands partial-pass text to the final pass
+        # as its prefix; from a cheaper partial model that text would end up
+        # in the final transcript, so the cascade decodes the whole buffer.
+        trim = (
+            self._config.streaming.trim_committed
+            and not is_final
+            and self._partial_backend is self._backend
         )
-        wall_ms = (time.perf_counter() - t0) * 1000
+        # Passed only when wanted: see base.py on backends without alignment.
+        extra: dict[str, object] = {"word_timestamps": True} if trim else {}
+        ranges = self._decode_ranges()
+        view = self._buffer.view()
+        if len(ranges) == 1:
+            pcm = view[ranges[0][0] : ranges[0][1]]
+        else:
+            pcm = np.concatenate([view[start:end] for start, end in ranges])
+        if self._features is not None and backend is self._partial_backend:
+            extra["features"] = self._features.features(view, ranges)
+        self.trim.buffered_s += view.size / _SAMPLE_RATE
+        self.trim.decoded_s += pcm.size / _SAMPLE_RATE
+        kind = ("speculative final" if speculative else "final") if is_final else "partial"
+        now = self._clock or time.perf_counter
+        t0 = now()
+        with TRACE.span(
+            "decode", self._utterance_id, kind=kind, audio_ms=round(pcm.size / _SAMPLE_RATE * 1000)
+        ):
+            transcript = backend.transcribe(
+                pcm,
+                self._language,
+                hotwords=self._hotwords,
+                initial_prompt=self._prefix_text or None,
+                final=is_final,
+                **extra,
+            )
+        wall_s = now() - t0
+        wall_ms = wall_s * 1000
+        self._rtf.record(backend.descriptor, wall_s, pcm.size / _SAMPLE_RATE)
         transcript.utterance_id = self._utterance_id
         log = logger.info if is_final else logger.debug
         log(
-            "utterance %d %s decode: %.0f ms audio in %.0f ms wall -> %r",
+            "utterance %d %s decode: %.0f ms audio (of %.0f ms buffered) in %.0f ms wall%s -> %r",
             self._utterance_id,
-            "final" if is_final else "partial",
-            self._buffer.size / _SAMPLE_RATE * 1000,
+            kind,
+            pcm.size / _SAMPLE_RATE * 1000,
+            view.size / _SAMPLE_RATE * 1000,
             wall_ms,
+            (
+                f" (beam escalation, {transcript.escalation}: +{transcript.escalation_ms:.0f} ms)"
+                if transcript.escalation
+                else ""
+            ),
             transcript.text,
         )
 
@@ -175,15 +548,26 @@ class StreamingSession:
             else transcript.text
         )
         current_words = pass_text.split()
+        if self._on_text is not None and (speculative or not is_final):
+            self._on_text(self._utterance_id, pass_text)
 
         if is_final:
             transcript.text = pass_text
             transcript.is_partial = False
+            if speculative:
+                return transcript
             self._emit(transcript)
-            return
+            return None
 
         committed = local_agreement_prefix(self._prev_pass_words, current_words)
+        pass_words = transcript.text.split()
         transcript.text = partial_text(self._config.streaming.policy, committed, current_words)
         transcript.is_partial = True
         self._prev_pass_words = current_words
+        if trim:
+            n_prefix = len(current_words) - len(pass_words)
+            self._trim_committed(
+                transcript.words, pass_words, len(committed) - n_prefix, ranges
+            )
         self._emit(transcript)
+        return None
@@ -9,18 +9,21 @@ drives `progress_cb`.
 """
 
 import logging
+import threading
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 import huggingface_hub
-import noisereduce as nr
 import numpy as np
 from faster_whisper import WhisperModel
 from faster_whisper.utils import _MODELS
 from tqdm.auto import tqdm as _tqdm_auto
 
-from ..config import Config, models_dir
-from ..messages import Transcript
+from ..config import Config, SttConfig, models_dir
+from ..messages import Transcript, WordTiming
+from .features import MelFeatureCache
 
 logger = logging.getLogger(__name__)
 
@@ -55,26 +58,81 @@ def _is_cuda_oom(exc: Exception) -> bool:
     return "out of memory" in str(exc).lower()
 
 
-_DENOISE_PROP_DECREASE = 0.3  # see _denoise's docstring -- full strength (1.0) gutted real speech
+def _escalation_reason(
+    avg_logprob: float, no_speech_prob: float, compression_ratio: float, stt: SttConfig
+) -> str:
+    """Why a greedy final pass should be re-decoded with beam search ("" = it shouldn't)."""
+    if avg_logprob < stt.escalate_logprob_below:
+        return f"avg_logprob {avg_logprob:.2f} < {stt.escalate_logprob_below}"
+    if no_speech_prob > stt.escalate_no_speech_above:
+        return f"no_speech_prob {no_speech_prob:.2f} > {stt.escalate_no_speech_above}"
+    if compression_ratio > stt.escalate_compression_above:
+        return f"compression ratio {compression_ratio:.2f} > {stt.escalate_compression_above}"
+    return ""
 
 
-def _denoise(audio: np.ndarray) -> np.ndarray:
-    """Spectral-gating background-noise suppression (DESIGN §7.4, user request:
-    background noise hurt accuracy noticeably more than it does for Windows'
-    own dictation). `stationary=False` adapts to fluctuating noise (traffic,
-    background chatter) rather than assuming a fixed noise floor.
+class _PrecomputedFeatures:
+    """Stands in for `WhisperModel.feature_extractor` during one decode:
+    returns `features` instead of extracting them from the audio; hop,
+    frame rate etc. come from the real extractor."""
 
-    `prop_decrease` is deliberately well below the library default of 1.0
-    (full-strength gating): a VAD-trimmed utterance buffer is almost all
-    speech with no long quiet stretch to calibrate against, so full-strength
-    gating over-fires and guts the speech itself -- confirmed live (default
-    1.0 made dictation produce nothing at all, even shouting) and reproduced
-    in a benchmark: on a realistic continuous-speech-shaped buffer, 1.0 cut
-    RMS energy to ~29% of the original, 0.3 keeps it at ~78%.
+    def __init__(self, extractor: object, features: np.ndarray) -> None:
+        self._extractor = extractor
+        self._features = features
+
+    def __call__(self, waveform: np.ndarray, padding: int = 160, chunk_length=None) -> np.ndarray:
+        return self._features
+
+    def __getattr__(self, name: str):
+        return getattr(self._extractor, name)
+
+
+@dataclass
+class EscalationStats:
+    """Final passes since load, and how many were re-decoded with beam search."""
+
+    finals: int = 0
+    escalated: int = 0
+    cost_ms: float = 0.0  # wall time of the beam re-decodes, summed
+
+
+@dataclass(frozen=True)
+class _LoadedRung:
+    """One loaded entry of `_FALLBACK_RUNGS`; swapped in and out whole."""
+
+    model: WhisperModel
+    rung: int
+    index: int  # into _FALLBACK_RUNGS
+    model_name: str
+    device: str
+    compute_type: str
+
+    @property
+    def descriptor(self) -> str:
+        return f"{self.model_name}/{self.compute_type}/{self.device}"
+
+
+def _whitespace_words(segments: list) -> list[WordTiming]:
+    """faster-whisper `Word`s regrouped into `Transcript.text.split()` tokens.
+
+    faster-whisper's words follow Whisper's tokenizer, not whitespace: a
+    piece without a leading space (e.g. the "-known" of "well-known", or
+    digits split across tokens) continues the previous word. Merging those
+    keeps `Transcript.words` 1:1 with the whitespace-split text, which is
+    what streaming.py counts committed words in.
     """
-    return nr.reduce_noise(
-        y=audio, sr=_SAMPLE_RATE, stationary=False, prop_decrease=_DENOISE_PROP_DECREASE
-    ).astype(np.float32)
+    words: list[WordTiming] = []
+    for segment in segments:
+        for piece in segment.words or ():
+            text = piece.word.strip()
+            if not text:
+                continue
+            if words and not piece.word[:1].isspace():
+                words[-1].word += text
+                words[-1].end = piece.end
+            else:
+                words.append(WordTiming(text, piece.start, piece.end))
+    return words
 
 
 def _progress_tqdm_class(progress_cb: Callable[[float, str], None], label: str) -> type:
@@ -136,29 +194,84 @@ class WhisperLocalBackend:
     currently loaded; `rung > 1` means the caller should show the tray
     DEGRADED state. `descriptor` reflects the active rung, e.g.
     "large-v3-turbo/int8_float16/cuda", or "small/int8/cpu" after a fallback.
+
+    `model`/`device` override `stt.model`/`stt.device` for a second
+    instance -- the `streaming.partial_model` backend; the ladder is walked
+    the same way from there.
+
+    Confidence-gated beam search (user request): partial passes always
+    decode greedily. A `final` pass decodes with `stt.beam_size` and, if
+    the result's mean `avg_logprob`, mean `no_speech_prob` or worst segment
+    compression ratio crosses its `stt.escalate_*` threshold, is decoded
+    again with `stt.escalate_beam_size` and the beam result returned --
+    beam-level accuracy on the hard utterances, greedy latency on the rest.
+    `Transcript.escalation`/`escalation_ms` record why and what it cost;
+    `escalation` keeps the running tally, which every escalation logs.
+
+    `feature_cache()` (user request) hands `StreamingSession` a
+    `MelFeatureCache` for the loaded model; `transcribe(features=...)` then
+    decodes those log-mel features instead of extracting them from `pcm`
+    again (`pcm` still sets the duration). Features for another model's
+    mel layout -- a rung change mid-utterance -- are ignored.
+
+    Hot-standby fallback (user request): a CUDA OOM mid-transcription used
+    to drop a rung inline -- download, load and warm up the next model on
+    the STT thread while the utterance waited, for seconds. Now, whenever a
+    CUDA rung is installed, a background `stt-standby` thread provisions
+    the next rung: with `stt.standby = "warm"` it loads and warms it and
+    keeps it resident, with `"download"` it only makes sure its files are
+    on disk. On OOM the STT thread swaps a ready standby in (one attribute,
+    under `_lock`, which no load ever holds) and retries on it; if a warm
+    standby is still loading, it waits for that load rather than starting
+    a second one. The STT thread never loads a model itself: with no
+    standby coming -- the `"download"` default -- the loader takes over
+    the next rung, loads it and installs it as active, and the OOM
+    surfaces as a `RuntimeError` that loses this one utterance (retrying
+    on the model that just ran out of memory would lose it anyway); the
+    next utterance runs on the new rung. On the last rung there is
+    nothing to fall back to and the OOM surfaces the same way.
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, model: str | None = None, device: str | None = None) -> None:
         self._config = config
-        self._model: WhisperModel | None = None
-        self._model_name = ""
-        self._device = ""
-        self._compute_type = ""
-        self.rung = 0
+        self._model_override = model
+        self._device_override = device
+        self._lock = threading.Lock()
+        self._active: _LoadedRung | None = None
+        self._standby: _LoadedRung | None = None  # the next rung, loaded and warm
+        self._loader: threading.Thread | None = None  # provisioning `_standby`
+        self._failover = False  # `_loader` installs its rung as active (OOM, no standby)
+        self._generation = 0  # bumped on every install/unload; stale loaders discard
+        self.escalation = EscalationStats()
+
+    @property
+    def rung(self) -> int:
+        active = self._active
+        return active.rung if active is not None else 0
 
     @property
     def descriptor(self) -> str:
-        return f"{self._model_name}/{self._compute_type}/{self._device}"
+        active = self._active
+        return active.descriptor if active is not None else "//"
+
+    @property
+    def _model(self) -> WhisperModel | None:
+        active = self._active
+        return active.model if active is not None else None
 
     def load(self, progress_cb: Callable[[float, str], None]) -> None:
-        self._load_from(0, progress_cb)
+        loaded = self._load_from(0, progress_cb)
+        with self._lock:
+            self._install(loaded)
 
     def unload(self) -> None:
-        self._model = None
-        self._model_name = ""
-        self._device = ""
-        self._compute_type = ""
-        self.rung = 0
+        with self._lock:
+            self._active = None
+            self._standby = None
+            self._loader = None
+            self._failover = False
+            self._generation += 1
+        self.escalation = EscalationStats()
 
     def transcribe(
         self,
@@ -166,21 +279,46 @@ class WhisperLocalBackend:
         language: str | None,
         hotwords: str | None = None,
         initial_prompt: str | None = None,
+        word_timestamps: bool = False,
+        final: bool = False,
+        features: np.ndarray | None = None,
     ) -> Transcript:
-        if self._model is None:
+        active = self._active
+        if active is None:
             raise RuntimeError("WhisperLocalBackend.transcribe() called before load()")
         try:
-            return self._decode(pcm, language, hotwords, initial_prompt)
+            return self._decode(
+                active.model,
+                pcm,
+                language,
+                hotwords,
+                initial_prompt,
+                word_timestamps,
+                final,
+                features,
+            )
         except Exception as exc:
-            if self._device != "cuda" or not _is_cuda_oom(exc):
+            if active.device != "cuda" or not _is_cuda_oom(exc):
                 raise
-            logger.warning(
-                "CUDA OOM during transcription at rung %d; dropping a rung and retrying: %s",
-                self.rung,
-                exc,
+            logger.warning("CUDA OOM during transcription at rung %d: %s", active.rung, exc)
+            fallback = self._fall_back(active, exc)
+            logger.warning("retrying the decode on rung %d", fallback.rung)
+            return self._decode(
+                fallback.model,
+                pcm,
+                language,
+                hotwords,
+                initial_prompt,
+                word_timestamps,
+                final,
+                features,
             )
-            self._drop_rung()
-            return self._decode(pcm, language, hotwords, initial_prompt)
+
+    def feature_cache(self) -> MelFeatureCache | None:
+        """A log-mel cache for this model's features; None while unloaded."""
+        if self._model is None:
+            return None
+        return MelFeatureCache(self._model.feature_extractor.mel_filters)
 
     def detect_language_probs(self, pcm: np.ndarray) -> dict[str, float]:
         """Runs faster-whisper's language detection; feeds `language.resolve_language()` (§7.10)."""
@@ -192,57 +330,208 @@ class WhisperLocalBackend:
 
     def _decode(
         self,
+        model: WhisperModel,
         pcm: np.ndarray,
         language: str | None,
         hotwords: str | None,
         initial_prompt: str | None,
+        word_timestamps: bool = False,
+        final: bool = False,
+        features: np.ndarray | None = None,
     ) -> Transcript:
-        assert self._model is not None
+        stt = self._config.stt
         audio = _to_float32(pcm)
-        if self._config.stt.denoise:
-            audio = _denoise(audio)
-        combined_prompt = (
-            " ".join(p for p in (self._config.stt.initial_prompt, initial_prompt) if p) or None
+        extractor = model.feature_extractor if features is not None else None
+        if extractor is not None and features.shape[0] != extractor.mel_filters.shape[0]:
+            extractor = None  # another model's mel layout: a rung change mid-utterance
+        combined_prompt = " ".join(p for p in (stt.initial_prompt, initial_prompt) if p) or None
+
+        def run(beam_size: int) -> tuple[Transcript, float]:
+            if extractor is not None and features is not None:
+                model.feature_extractor = _PrecomputedFeatures(extractor, features)
+            try:
+                segments, info = model.transcribe(
+                    audio,
+                    language=language,
+                    beam_size=beam_size,
+                    temperature=0.0,
+                    condition_on_previous_text=False,
+                    vad_filter=False,
+                    without_timestamps=True,
+                    word_timestamps=word_timestamps,
+                    hotwords=hotwords,
+                    initial_prompt=combined_prompt,
+                )
+                segment_list = list(segments)  # lazy: decode while the stand-in is installed
+            finally:
+                if extractor is not None:
+                    model.feature_extractor = extractor
+            text = "".join(segment.text for segment in segment_list).strip()
+            if segment_list:
+                avg_logprob = sum(s.avg_logprob for s in segment_list) / len(segment_list)
+                no_speech_prob = sum(s.no_speech_prob for s in segment_list) / len(segment_list)
+                compression_ratio = max(s.compression_ratio for s in segment_list)
+            else:
+                avg_logprob = 0.0
+                no_speech_prob = 1.0
+                compression_ratio = 0.0
+            transcript = Transcript(
+                text=text,
+                avg_logprob=avg_logprob,
+                no_speech_prob=no_speech_prob,
+                duration_s=info.duration,
+                language=info.language,
+                words=_whitespace_words(segment_list) if word_timestamps else [],
+            )
+            return transcript, compression_ratio
+
+        if not final:
+            return run(1)[0]
+        transcript, compression_ratio = run(stt.beam_size)
+        self.escalation.finals += 1
+        if stt.escalate_beam_size <= stt.beam_size or not transcript.text:
+            # An empty pass has no confidence to judge: nothing was decoded.
+            return transcript
+        reason = _escalation_reason(
+            transcript.avg_logprob, transcript.no_speech_prob, compression_ratio, stt
         )
-        segments, info = self._model.transcribe(
-            audio,
-            language=language,
-            beam_size=self._config.stt.beam_size,
-            temperature=0.0,
-            condition_on_previous_text=False,
-            vad_filter=False,
-            without_timestamps=True,
-            hotwords=hotwords,
-            initial_prompt=combined_prompt,
+        if not reason:
+            return transcript
+        t0 = time.perf_counter()
+        escalated, _ = run(stt.escalate_beam_size)
+        escalated.escalation = reason
+        escalated.escalation_ms = (time.perf_counter() - t0) * 1000
+        stats = self.escalation
+        stats.escalated += 1
+        stats.cost_ms += escalated.escalation_ms
+        logger.info(
+            "final pass re-decoded with beam %d (%s): +%.0f ms, %r -> %r; "
+            "%d of %d final passes escalated since load, %.0f ms total",
+            stt.escalate_beam_size,
+            reason,
+            escalated.escalation_ms,
+            transcript.text,
+            escalated.text,
+            stats.escalated,
+            stats.finals,
+            stats.cost_ms,
         )
-        segment_list = list(segments)
-        text = "".join(segment.text for segment in segment_list).strip()
-        if segment_list:
-            avg_logprob = sum(s.avg_logprob for s in segment_list) / len(segment_list)
-            no_speech_prob = sum(s.no_speech_prob for s in segment_list) / len(segment_list)
-        else:
-            avg_logprob = 0.0
-            no_speech_prob = 1.0
-        return Transcript(
-            text=text,
-            avg_logprob=avg_logprob,
-            no_speech_prob=no_speech_prob,
-            duration_s=info.duration,
-            language=info.language,
+        return escalated
+
+    def _fall_back(self, failed: _LoadedRung, exc: Exception) -> _LoadedRung:
+        """STT thread, after `failed` ran out of CUDA memory (`exc`): the
+        model to retry on (class docstring). Never loads one here: waits
+        for a warm standby already loading, else hands the next rung to the
+        loader and raises."""
+        with self._lock:
+            if self._next_index(failed.index) is None:
+                raise RuntimeError(
+                    f"CUDA out of memory on the last STT fallback rung ({failed.descriptor})"
+                ) from exc
+            loader = self._loader
+            warming = self._standby is None and self._config.stt.standby == "warm"
+            if loader is None or self._failover:
+                warming = False
+        if warming:
+            assert loader is not None
+            logger.warning("STT standby rung still loading; waiting for it")
+            loader.join()
+        with self._lock:
+            if self._active is not failed:
+                if self._active is None:
+                    raise RuntimeError("STT model unloaded during the OOM fallback") from exc
+                return self._active  # installed by another caller meanwhile
+            if self._standby is not None:
+                self._install(self._standby)
+                assert self._active is not None
+                logger.warning("STT swapped to standby rung %s", self._active.descriptor)
+                return self._active
+            if not self._failover:
+                # take over: the new loader waits out a running one (the same
+                # rung's download) rather than fetching the files twice
+                self._failover = True
+                self._generation += 1
+                self._start_loader(failed.index + 1, load=True, after=self._loader)
+        raise RuntimeError(
+            f"CUDA out of memory on STT rung {failed.rung} with no standby ready; the "
+            "next rung is loading in the background and this utterance is lost"
+        ) from exc
+
+    def _install(self, loaded: _LoadedRung) -> None:
+        """Makes `loaded` the active rung and starts provisioning the one after
+        it. Caller holds `_lock`."""
+        self._active = loaded
+        self._standby = None
+        self._failover = False
+        self._generation += 1
+        self._loader = None  # a loader still running for the old rung is now stale
+        if loaded.device == "cuda" and self._next_index(loaded.index) is not None:
+            self._start_loader(loaded.index + 1, load=self._config.stt.standby == "warm")
+
+    def _start_loader(
+        self, start_index: int, load: bool, after: threading.Thread | None = None
+    ) -> None:
+        """Caller holds `_lock`."""
+        self._loader = threading.Thread(
+            target=self._provision,
+            args=(self._generation, start_index, load, after),
+            name="stt-standby",
+            daemon=True,
         )
-
-    def _drop_rung(self) -> None:
-        index = next(i for i, r in enumerate(_FALLBACK_RUNGS) if r[0] == self.rung)
-        self._load_from(index + 1, lambda _frac, _label: None)
-
-    def _load_from(self, start_index: int, progress_cb: Callable[[float, str], None]) -> None:
+        self._loader.start()
+
+    def _provision(
+        self, generation: int, start_index: int, load: bool, after: threading.Thread | None
+    ) -> None:
+        """`stt-standby` thread: once `after` (a loader this one took over)
+        is done, downloads -- and with `load`, loads and warms -- the first
+        usable rung from `start_index`, then hands it over: as the active
+        rung after an OOM with no standby (`_failover`), else as standby."""
+        if after is not None:
+            after.join()
+        loaded: _LoadedRung | None = None
+        try:
+            index = self._next_index(start_index - 1)
+            assert index is not None
+            _ensure_downloaded(self._rung_model_name(index), lambda _frac, _label: None)
+            if load:
+                loaded = self._load_from(start_index, lambda _frac, _label: None)
+        except Exception:
+            logger.exception("STT standby rung failed to provision")
+        with self._lock:
+            if generation != self._generation:
+                return  # unloaded, reloaded or swapped meanwhile
+            self._loader = None
+            if loaded is not None and self._failover:
+                self._install(loaded)
+                logger.warning("STT swapped to fallback rung %s", loaded.descriptor)
+            elif loaded is not None:
+                self._standby = loaded
+                logger.info("STT standby rung %s ready", loaded.descriptor)
+            self._failover = False  # failed to load: the next OOM tries again
+
+    def _next_index(self, index: int) -> int | None:
+        """The first `_FALLBACK_RUNGS` index after `index` the device choice allows."""
+        wanted_device = self._device_override or self._config.stt.device
+        for i in range(index + 1, len(_FALLBACK_RUNGS)):
+            device = _FALLBACK_RUNGS[i][2]
+            if wanted_device in (device, "auto"):
+                return i
+        return None
+
+    def _rung_model_name(self, index: int) -> str:
+        configured = self._model_override or self._config.stt.model
+        return configured if _FALLBACK_RUNGS[index][1] == "configured" else "small"
+
+    def _load_from(
+        self, start_index: int, progress_cb: Callable[[float, str], None]
+    ) -> _LoadedRung:
+        """Loads and warms the first rung from `start_index` that works."""
         last_exc: Exception | None = None
-        for rung, which, device, compute_type in _FALLBACK_RUNGS[start_index:]:
-            if self._config.stt.device == "cpu" and device == "cuda":
-                continue
-            if self._config.stt.device == "cuda" and device == "cpu":
-                continue
-            model_name = self._config.stt.model if which == "configured" else "small"
+        index = self._next_index(start_index - 1)
+        while index is not None:
+            rung, _which, device, compute_type = _FALLBACK_RUNGS[index]
+            model_name = self._rung_model_name(index)
             try:
                 local_dir = _ensure_downloaded(model_name, progress_cb)
                 model = WhisperModel(str(local_dir), device=device, compute_type=compute_type)
@@ -257,14 +546,10 @@ class WhisperLocalBackend:
                     exc,
                 )
                 last_exc = exc
+                index = self._next_index(index)
                 continue
-            self._model = model
-            self.rung = rung
-            self._model_name = model_name
-            self._device = device
-            self._compute_type = compute_type
             progress_cb(1.0, "ready")
-            return
+            return _LoadedRung(model, rung, index, model_name, device, compute_type)
         raise RuntimeError(
             f"all STT model fallback rungs failed to load; last error: {last_exc!r}"
         ) from last_exc
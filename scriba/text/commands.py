@@ -60,28 +60,39 @@ def _normalize_whitespace(text: str) -> str:
     return _WHITESPACE_RE.sub(" ", text.strip())
 
 
-def apply_commands(text: str) -> str:
-    """Replaces a standalone or trailing spoken command with its output character(s)."""
+def _match_command(text: str) -> tuple[str, _Command] | None:
+    """The standalone/trailing command `text` ends with, and the text before it."""
     original = _normalize_whitespace(text)
-    if not original:
-        return text
-
     core = original.rstrip(".!?")
     orig_words = core.split(" ") if core else []
     lower_words = core.lower().split(" ") if core else []
     if not lower_words:
-        return text
+        return None
 
     normalized_full = " ".join(lower_words)
     for cmd in _COMMANDS_BY_LENGTH:
         if normalized_full == cmd.phrase:
-            return cmd.output
+            return "", cmd
 
     for cmd in _COMMANDS_BY_LENGTH:
         phrase_words = cmd.phrase.split(" ")
         n = len(phrase_words)
         if 0 < n < len(lower_words) and lower_words[-n:] == phrase_words:
-            remainder = " ".join(orig_words[:-n])
-            return remainder + cmd.output
+            return " ".join(orig_words[:-n]), cmd
+    return None
+
+
+def apply_commands(text: str) -> str:
+    """Replaces a standalone or trailing spoken command with its output character(s)."""
+    match = _match_command(text)
+    if match is None:
+        return text
+    remainder, cmd = match
+    return remainder + cmd.output
+
 
-    return text
+def trailing_command_output(text: str) -> str | None:
+    """The output of the standalone/trailing command `text` ends with, if any
+    (e.g. "." for "... period") -- what `apply_commands` would append."""
+    match = _match_command(text)
+    return match[1].output if match is not None else None
@@ -29,9 +29,9 @@ logger = logging.getLogger(__name__)
 # mid-sentence. Kept to the design doc's own examples (plus obvious
 # spelling variants) rather than broader lists like "like"/"you know"/"also",
 # which are real words far more often than they're fillers.
-_FILLER_WORDS = ("um", "umm", "uh", "uhh", "hm", "hmm", "ah", "er", "erm", "äh", "ähm", "ähh")
+FILLER_WORDS = ("um", "umm", "uh", "uhh", "hm", "hmm", "ah", "er", "erm", "äh", "ähm", "ähh")
 _FILLER_RE = re.compile(
-    r"\b(?:" + "|".join(re.escape(w) for w in _FILLER_WORDS) + r")\b,?", re.IGNORECASE
+    r"\b(?:" + "|".join(re.escape(w) for w in FILLER_WORDS) + r")\b,?", re.IGNORECASE
 )
 
 
@@ -0,0 +1,163 @@
+"""Per-utterance latency tracing, exported as Chrome trace JSON (DESIGN.md §7.11).
+
+`utterance_id` threads through `AudioChunk` -> `Transcript` -> `InjectJob`,
+but the only timing the log had was the decode line. `TRACE` (user
+request) is a process-wide ring of timestamped events, each tagged with
+its utterance:
+
+- "speech" (segmenter): from the frame that triggered speech start to the
+  one that confirmed it (`min_speech_ms`); "endpoint" when the utterance's
+  final chunk is cut, with its cause.
+- "language": language detection/resolution on the utterance's first chunk.
+- "decode": each decode pass, with its kind and audio length.
+- "pipeline": `run_pipeline` on the final transcript.
+- "keystrokes": one inject job, from its first keystroke to its last.
+
+Recording is a tuple appended to a bounded `deque` (thread-safe, no lock),
+so it stays on in normal use and the oldest events fall off. Nothing is
+written until `export_chrome_trace()` -- the tray's "Export latency trace"
+or `scriba --trace PATH` on exit -- writes JSON that chrome://tracing and
+ui.perfetto.dev open directly: each event on its thread's track, plus one
+async "utterance N" track spanning everything recorded for that utterance.
+
+Timebase: `time.perf_counter`. Events recorded from `AudioFrame`
+timestamps (`time.monotonic`, ~16 ms resolution on Windows under Python
+3.12) are shifted onto it by an offset sampled at import.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+_CAPACITY = 8192  # events; a dictated sentence records a few dozen
+_MONOTONIC_TO_PERF = time.perf_counter() - time.monotonic()
+
+
+class TraceRing:
+    """Bounded in-memory event ring (module docstring). Each event is
+    `(name, utterance_id, start, end, thread_id, args)` in perf_counter
+    seconds; `end` is None for an instant."""
+
+    def __init__(self, capacity: int = _CAPACITY) -> None:
+        self._events: deque[tuple] = deque(maxlen=capacity)
+        self._thread_names: dict[int, str] = {}
+
+    def _append(self, name: str, utterance_id: int | None, start: float, end, args) -> None:
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        self._events.append((name, utterance_id, start, end, thread_id, args or None))
+
+    @contextmanager
+    def span(self, name: str, utterance_id: int | None, **args: object) -> Iterator[dict]:
+        """Records the `with` block as one event. Yields `args`, so the block
+        can add what it only learns at the end (e.g. the text length)."""
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self._append(name, utterance_id, start, time.perf_counter(), args)
+
+    def record(
+        self,
+        name: str,
+        utterance_id: int | None,
+        start: float,
+        end: float | None = None,
+        **args: object,
+    ) -> None:
+        """An event at `time.perf_counter` timestamps: a span from `start` to
+        `end`, or an instant at `start`."""
+        self._append(name, utterance_id, start, end, args)
+
+    def record_monotonic(
+        self,
+        name: str,
+        utterance_id: int | None,
+        start: float,
+        end: float | None = None,
+        **args: object,
+    ) -> None:
+        """`record()` at `time.monotonic` timestamps (`AudioFrame.t_monotonic`)."""
+        self._append(
+            name,
+            utterance_id,
+            start + _MONOTONIC_TO_PERF,
+            None if end is None else end + _MONOTONIC_TO_PERF,
+            args,
+        )
+
+    def events(self) -> list[tuple]:
+        return list(self._events)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def chrome_trace(self, events: list[tuple] | None = None) -> dict:
+        """`events` (default: the ring's) as a Chrome trace-event JSON object
+        (microseconds, from the earliest event)."""
+        if events is None:
+            events = self.events()
+        if not events:
+            return {"traceEvents": [], "displayTimeUnit": "ms"}
+        origin = min(e[2] for e in events)
+        pid = 1
+        out: list[dict] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "Scriba"}}
+        ]
+        for thread_id in sorted({e[4] for e in events}):
+            out.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": thread_id,
+                    "args": {"name": self._thread_names.get(thread_id, str(thread_id))},
+                }
+            )
+        bounds: dict[int, list[float]] = {}
+        for name, utterance_id, start, end, thread_id, args in events:
+            ts = (start - origin) * 1e6
+            event = {
+                "name": name,
+                "cat": "scriba",
+                "pid": pid,
+                "tid": thread_id,
+                "ts": round(ts, 1),
+                "args": {"utterance": utterance_id, **(args or {})},
+            }
+            if end is None:
+                event.update(ph="i", s="t")
+            else:
+                event.update(ph="X", dur=round((end - start) * 1e6, 1))
+            out.append(event)
+            if utterance_id is not None:
+                last = start if end is None else end
+                first_last = bounds.setdefault(utterance_id, [start, last])
+                first_last[0] = min(first_last[0], start)
+                first_last[1] = max(first_last[1], last)
+        for utterance_id, (start, end) in sorted(bounds.items()):
+            common = {"name": f"utterance {utterance_id}", "cat": "utterance", "pid": pid}
+            out.append(
+                {**common, "ph": "b", "id": utterance_id, "ts": round((start - origin) * 1e6, 1)}
+            )
+            out.append(
+                {**common, "ph": "e", "id": utterance_id, "ts": round((end - origin) * 1e6, 1)}
+            )
+        return {"traceEvents": out, "displayTimeUnit": "ms"}
+
+
+TRACE = TraceRing()
+
+
+def export_chrome_trace(path: Path, ring: TraceRing = TRACE) -> int:
+    """Writes `ring` to `path` as Chrome trace JSON; returns the number of
+    events it held."""
+    events = ring.events()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(ring.chrome_trace(events)), encoding="utf-8")
+    return len(events)
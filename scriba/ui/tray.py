@@ -119,14 +119,15 @@ class ScribaTray(QSystemTrayIcon):
     User actions surface as Qt signals so a caller (the future `app.py`) can
     wire them up without this class knowing about the pipeline:
     `enabled_changed(bool)`, `mode_changed(str)`, `language_changed(str)`,
-    `quit_requested()`. Feed pipeline state back in via `set_state()` and
-    `update_status()`.
+    `trace_export_requested()`, `quit_requested()`. Feed pipeline state
+    back in via `set_state()` and `update_status()`.
     """
 
     enabled_changed = Signal(bool)
     mode_changed = Signal(str)
     language_changed = Signal(str)
     microphone_changed = Signal(str)
+    trace_export_requested = Signal()
     quit_requested = Signal()
 
     def __init__(
@@ -166,6 +167,9 @@ class ScribaTray(QSystemTrayIcon):
         open_log_action = QAction("Open log", self._menu)
         open_log_action.triggered.connect(self._open_log_dir)
         self._menu.addAction(open_log_action)
+        trace_action = QAction("Export latency trace", self._menu)
+        trace_action.triggered.connect(self.trace_export_requested.emit)
+        self._menu.addAction(trace_action)
         self._menu.addSeparator()
         quit_action = QAction("Quit", self._menu)
         quit_action.triggered.connect(self.quit_requested.emit)
@@ -10,6 +10,7 @@ from unittest.mock import patch
 import pytest
 
 from scriba.config import Config
+from scriba.ui.tray import TrayState
 
 
 class _SyncThread:
@@ -40,10 +41,10 @@ class _FakeGuard:
 
 
 class _FakeBackend:
-    def __init__(self, config):
+    def __init__(self, config, model=None, device=None):
         self._config = config
         self.rung = 1
-        self.descriptor = "fake/desc"
+        self.descriptor = f"{model or 'fake'}/{device or 'desc'}"
         self.load_calls = 0
         self.unload_calls = 0
         self.fail_next_load = False
@@ -206,6 +207,86 @@ def test_reload_failure_does_not_enable(app):
     assert app._model_loaded is False
 
 
+def _idle_unloaded(app, tier):
+    with patch.object(app, "_start_pipeline"):
+        app._on_provision_done(True, "fake/desc")
+    app._config.stt.idle_unload_minutes = 60
+    app._config.stt.idle_tier = tier
+    app._disabled_since = _time_ago(minutes=61)
+    app._check_idle_unload()
+
+
+def test_idle_tier_small_enables_at_once_and_reloads_quietly(app):
+    _idle_unloaded(app, "small")
+    assert app._model_loaded is False
+    wake = app._wake_backend
+    assert wake.descriptor == "small/cpu"
+    assert wake.load_calls == 1
+    assert app._session_backends() == (wake, None)
+
+    with patch.object(app, "_reload_backend") as reload:
+        app._set_enabled(True)
+
+    assert app.enabled is True  # on the wake model, without waiting for the reload
+    reload.assert_called_once_with(quiet=True)
+
+
+def test_idle_tier_small_swaps_back_after_the_quiet_reload(app):
+    _idle_unloaded(app, "small")
+    states = []
+    app._state_requested.connect(states.append)
+
+    app._set_enabled(True)  # the quiet reload runs synchronously here
+
+    assert app.enabled is True
+    assert app._model_loaded is True
+    assert app._wake_backend is None
+    assert app._session_backends() == (app._backend, app._partial_backend)
+    assert TrayState.PROVISIONING not in states
+
+
+def test_idle_tier_small_failed_reload_keeps_dictating_on_the_wake_model(app):
+    _idle_unloaded(app, "small")
+    app._backend.fail_next_load = True
+
+    app._set_enabled(True)
+
+    assert app.enabled is True
+    assert app._model_loaded is False
+    assert app._session_backends()[0] is app._wake_backend
+
+
+def test_idle_tier_small_wake_model_loaded_after_a_reload_is_dropped(app):
+    with patch.object(app, "_load_wake_backend"):  # still loading on its thread
+        _idle_unloaded(app, "small")
+    app._set_enabled(True)  # no wake model yet: an ordinary reload, then enable
+    late = _FakeBackend(app._config, "small", "cpu")
+
+    app._wake_loaded.emit(late)  # the wake load finishes only now
+
+    assert app._wake_backend is None
+    assert late.unload_calls == 1
+    assert app._session_backends() == (app._backend, app._partial_backend)
+
+
+def test_idle_tier_cache_keeps_a_page_cache_warmer(app):
+    with patch("scriba.app.PageCacheWarmer") as warmer:
+        _idle_unloaded(app, "cache")
+        assert app._wake_backend is None
+        assert warmer.return_value.warm.call_count == 1
+        warmer.return_value.due.return_value = False  # running, or warmed recently
+        app._check_idle_unload()
+        assert warmer.return_value.warm.call_count == 1
+        warmer.return_value.due.return_value = True
+        app._check_idle_unload()
+        assert warmer.return_value.warm.call_count == 2
+
+    app._set_enabled(True)  # an ordinary reload, then enable
+
+    assert app.enabled is True
+    assert app._cache_warmer is None
+
+
 def test_default_config_ties_model_to_language_at_construction(app):
     # default Config() has general.language == "en"
     assert app._config.stt.model == "distil-large-v3"
@@ -0,0 +1,192 @@
+"""scriba/audio/buffer.py: `PcmBuffer` append/view/trim/take semantics and
+amortized growth, `FrameChunker` views, and the lock-free `RingBuffer`."""
+
+import threading
+import time
+
+import numpy as np
+
+from scriba.audio import buffer
+from scriba.audio.buffer import FrameChunker, PcmBuffer, RingBuffer
+
+
+def _ramp(start: int, n: int) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.int16)
+
+
+def test_append_and_view_preserve_order():
+    buf = PcmBuffer(capacity=4)
+    buf.append(_ramp(0, 3))
+    buf.append(_ramp(3, 5))
+    buf.append(np.zeros(0, dtype=np.int16))
+
+    assert len(buf) == buf.size == 8
+    assert buf.view().tolist() == list(range(8))
+
+
+def test_view_is_zero_copy():
+    buf = PcmBuffer(capacity=16)
+    buf.append(_ramp(0, 8))
+    view = buf.view()
+    assert np.shares_memory(view, buf.view())
+    assert view.base is not None
+
+
+def test_growth_doubles_instead_of_reallocating_per_append():
+    buf = PcmBuffer(capacity=512)
+    for i in range(30 * 16000 // 512):  # a 30 s utterance in 32 ms frames
+        buf.append(_ramp(i, 512))
+
+    assert buf.size == 30 * 16000 // 512 * 512
+    assert buf.reallocations <= 10
+    assert buf.capacity >= buf.size
+
+
+def test_trim_front_drops_oldest_samples():
+    buf = PcmBuffer(capacity=16)
+    buf.append(_ramp(0, 10))
+    buf.trim_front(4)
+    assert buf.view().tolist() == list(range(4, 10))
+
+    buf.trim_front(100)
+    assert len(buf) == 0
+    assert buf.view().size == 0
+
+
+def test_trimmed_head_is_reclaimed_before_growing():
+    buf = PcmBuffer(capacity=16)
+    buf.append(_ramp(0, 14))
+    buf.trim_front(12)
+    buf.append(_ramp(14, 4))  # doesn't fit behind the data, fits after compaction
+
+    assert buf.view().tolist() == [12, 13, 14, 15, 16, 17]
+    assert buf.reallocations == 0
+    assert buf.capacity == 16
+
+
+def test_take_hands_over_contents_and_empties_buffer():
+    buf = PcmBuffer(capacity=8)
+    buf.append(_ramp(0, 6))
+    out = buf.take()
+    buf.append(_ramp(100, 3))
+
+    assert out.tolist() == list(range(6))  # unaffected by later appends
+    assert buf.view().tolist() == [100, 101, 102]
+
+
+def test_take_after_trim_copies_only_held_samples():
+    buf = PcmBuffer(capacity=8)
+    buf.append(_ramp(0, 6))
+    buf.trim_front(2)
+    out = buf.take()
+    buf.append(_ramp(50, 8))
+
+    assert out.tolist() == [2, 3, 4, 5]
+    assert len(buf) == 8
+
+
+def test_frame_chunker_frames_inside_one_push_are_views():
+    chunker = FrameChunker(frame_samples=4)
+    samples = _ramp(0, 9)
+    frames = chunker.push(samples)
+
+    assert [f.tolist() for f in frames] == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert all(np.shares_memory(f, samples) for f in frames)
+
+
+def test_frame_chunker_carried_remainder_does_not_alias_later_input():
+    chunker = FrameChunker(frame_samples=4)
+    first = _ramp(0, 3)
+    assert chunker.push(first) == []
+    first[:] = -1  # the caller reusing its array must not corrupt the carry
+    assert chunker.push(_ramp(3, 0)) == []
+    (frame,) = chunker.push(_ramp(3, 2))
+
+    assert frame.tolist() == [0, 1, 2, 3]
+    assert chunker.push(_ramp(5, 1)) == []
+    assert chunker.push(_ramp(6, 6))[0].tolist() == [4, 5, 6, 7]
+
+
+# --- RingBuffer: lock-free SPSC pre-roll ring --------------------------------
+
+
+def test_ring_views_are_zero_copy_and_split_on_wrap():
+    ring = RingBuffer(4, slack=2)  # backing array of 6
+    ring.push(_ramp(0, 5))
+    older, newer = ring.views()
+    assert (older.tolist(), newer.tolist()) == ([1, 2, 3, 4], [])
+
+    ring.push(_ramp(5, 3))  # writes wrap past the end of the backing array
+    older, newer = ring.views()
+    assert np.concatenate([older, newer]).tolist() == [4, 5, 6, 7]
+    assert newer.size and np.shares_memory(older, ring._buf)
+    assert ring.write_index == 8
+
+
+def test_ring_push_larger_than_backing_array_keeps_newest():
+    ring = RingBuffer(3, slack=2)
+    ring.push(_ramp(0, 2))
+    ring.push(_ramp(2, 11))
+
+    assert ring.read().tolist() == [10, 11, 12]
+    assert ring.write_index == 13
+
+
+def test_ring_read_drops_samples_the_producer_lapped_during_the_copy(monkeypatch):
+    ring = RingBuffer(4, slack=1)
+    ring.push(_ramp(0, 4))
+    real_concatenate = np.concatenate
+
+    def concatenate_while_producer_writes(arrays):
+        out = real_concatenate(arrays)
+        ring.push(_ramp(4, 3))  # 3 more samples, slack 1: the oldest 2 copied are stale
+        return out
+
+    monkeypatch.setattr(buffer.np, "concatenate", concatenate_while_producer_writes)
+    assert ring.read().tolist() == [2, 3]
+
+
+def _ramp_producer(ring, stop, period_s: float):
+    """Pushes a continuing int16 ramp, 512 samples every `period_s` (0: flat out)."""
+    written = 0
+    while not stop.is_set():
+        ring.push(np.arange(written, written + 512, dtype=np.int64).astype(np.int16))
+        written += 512
+        if period_s:
+            time.sleep(period_s)
+
+
+def _is_ramp(pcm: np.ndarray) -> bool:
+    # consecutive (mod 2**16): any overwritten or out-of-order sample breaks it
+    return bool(np.all(np.diff(pcm).astype(np.uint16) == 1))
+
+
+def test_ring_read_is_never_torn_even_against_a_flat_out_producer():
+    ring = RingBuffer(4800)  # 300 ms pre-roll
+    stop = threading.Event()
+    thread = threading.Thread(target=_ramp_producer, args=(ring, stop, 0.0))
+    thread.start()
+    try:
+        reads = [ring.read() for _ in range(2000)]
+    finally:
+        stop.set()
+        thread.join()
+
+    assert all(_is_ramp(pcm) for pcm in reads)
+
+
+def test_ring_views_copied_by_the_reader_are_intact_at_real_time_rates():
+    ring = RingBuffer(4800)
+    stop = threading.Event()
+    thread = threading.Thread(target=_ramp_producer, args=(ring, stop, 0.032))
+    thread.start()
+    try:
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            dest = PcmBuffer(4800)
+            for piece in ring.views():  # the segmenter's pattern
+                dest.append(piece)
+            assert _is_ramp(dest.view())
+    finally:
+        stop.set()
+        thread.join()
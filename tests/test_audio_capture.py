@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from scriba.audio import capture
+from scriba.audio.buffer import PcmBuffer
 from scriba.audio.capture import (
     AudioCapture,
     DeviceInfo,
@@ -385,3 +386,83 @@ def test_refresh_devices_calls_open_drop_and_close(monkeypatch):
     cap.refresh_devices()
 
     assert calls == ["open", "drop", "close"]
+
+
+# --- on_device_opened: the detector's VAD-prewarm hook --------------------
+
+
+def test_open_matching_devices_reports_each_opened_device(monkeypatch, fake_sounddevice):
+    opened = []
+
+    def hook(device_id):
+        opened.append(device_id)
+        raise RuntimeError("a failing hook must not stop capture")
+
+    cap = AudioCapture(Config(), queue.Queue(), on_device_opened=hook)
+
+    def fake_open(device_id, entry):
+        if entry["name"] == "Laptop Mic":  # the headset fails to open
+            cap._streams[device_id] = "STREAM"
+
+    monkeypatch.setattr(cap, "_open_device", fake_open)
+
+    cap._open_matching_devices()
+    cap._open_matching_devices()  # already open: not reported again
+
+    assert opened == [_device_id("Laptop Mic")]
+
+
+# --- callback stress: lock-free pre-roll under concurrent reads -----------
+
+
+def test_four_48k_devices_with_concurrent_preroll_reads_never_overrun():
+    """Four 48 kHz devices' real callbacks (resample + re-frame + pre-roll +
+    enqueue) at real-time pacing while the detector side hammers
+    `get_preroll`: no callback may take longer than its 32 ms block, and
+    every frame must arrive."""
+    import threading
+    import time
+
+    frame_queue: queue.Queue = queue.Queue()
+    cap = AudioCapture(Config(), frame_queue)
+    period_s, native_block, n_blocks = 0.032, 1536, 30
+    devices = [f"dev{i}" for i in range(4)]
+    callbacks = {}
+    for device_id in devices:
+        ring = RingBuffer(round(cap._config.vad.pre_roll_ms * 16))
+        cap._prerolls[device_id] = ring
+        callbacks[device_id] = cap._make_callback(device_id, ring, 48000)
+
+    durations: list[float] = []
+    stop = threading.Event()
+
+    def device(device_id):
+        rng = np.random.default_rng(len(durations))
+        start = time.perf_counter()
+        for i in range(n_blocks):
+            indata = (rng.standard_normal((native_block, 1)) * 3000).astype(np.int16)
+            t0 = time.perf_counter()
+            callbacks[device_id](indata, native_block, None, None)
+            durations.append(time.perf_counter() - t0)
+            time.sleep(max(0.0, start + (i + 1) * period_s - time.perf_counter()))
+
+    def detector_side():
+        while not stop.is_set():
+            for device_id in devices:
+                dest = PcmBuffer(8000)
+                for piece in cap.get_preroll(device_id):
+                    dest.append(piece)
+
+    reader = threading.Thread(target=detector_side)
+    reader.start()
+    threads = [threading.Thread(target=device, args=(d,)) for d in devices]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop.set()
+    reader.join()
+
+    assert len(durations) == 4 * n_blocks
+    assert max(durations) < period_s
+    assert frame_queue.qsize() == 4 * n_blocks
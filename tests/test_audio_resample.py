@@ -0,0 +1,70 @@
+"""`StreamingResampler` (scriba/audio/resample.py): block-by-block output must
+match resampling the whole signal at once -- no block-edge artifacts, no
+per-block length rounding."""
+
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+from scriba.audio.resample import StreamingResampler
+
+
+def _tone(rate: int, seconds: float) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    rng = np.random.default_rng(0)
+    return (np.sin(2 * np.pi * 440 * t) * 8000 + rng.standard_normal(t.size) * 300).astype(np.int16)
+
+
+def _stream(resampler: StreamingResampler, signal: np.ndarray, block: int) -> np.ndarray:
+    return np.concatenate(
+        [resampler.push(signal[i : i + block]) for i in range(0, signal.size, block)]
+    )
+
+
+@pytest.mark.parametrize(
+    ("rate", "up", "down", "block"),
+    [(48000, 1, 3, 1536), (44100, 160, 441, 1411), (22050, 320, 441, 706), (8000, 2, 1, 256)],
+)
+def test_streamed_blocks_match_whole_signal_resample(rate, up, down, block):
+    signal = _tone(rate, 2.0)
+
+    out = _stream(StreamingResampler(rate), signal, block)
+
+    reference = resample_poly(signal.astype(np.float32), up, down)
+    delay = 10 * max(up, down) // down  # the causal filter's group delay
+    assert out.size == signal.size * up // down
+    n = out.size - delay
+    assert np.abs(out[delay:].astype(np.float64) - reference[:n]).max() <= 1.0
+
+
+def test_48k_blocks_come_out_exactly_one_frame_each():
+    resampler = StreamingResampler(48000)
+    signal = _tone(48000, 1.0)
+
+    sizes = {resampler.push(signal[i : i + 1536]).size for i in range(0, 30 * 1536, 1536)}
+
+    assert sizes == {512}
+
+
+def test_output_does_not_depend_on_block_boundaries():
+    signal = _tone(44100, 0.5)
+
+    a = _stream(StreamingResampler(44100), signal, 1411)
+    b = _stream(StreamingResampler(44100), signal, 97)
+
+    assert np.array_equal(a, b)
+
+
+def test_same_rate_passes_through():
+    samples = _tone(16000, 0.1)
+    assert StreamingResampler(16000).push(samples) is samples
+
+
+def test_reset_starts_a_new_stream():
+    signal = _tone(48000, 0.2)
+    resampler = StreamingResampler(48000)
+    first = _stream(resampler, signal, 1536)
+
+    resampler.reset()
+
+    assert np.array_equal(_stream(resampler, signal, 1536), first)
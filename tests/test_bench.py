@@ -0,0 +1,266 @@
+"""Replay bench harness tests (scriba/bench/): synthetic speech through the
+real `Detector`/`StreamingSession`/`run_pipeline` on a simulated clock. An
+energy-threshold stand-in replaces the Silero ONNX model (no download) and
+`FakeSttBackend` replaces Whisper, so this runs headless anywhere.
+"""
+
+import json
+
+import numpy as np
+
+from scriba.bench.cli import _parse_override, main
+from scriba.bench.replay import FakeSttBackend, replay_signal, run_bench
+from scriba.bench.signals import synthetic_speech
+from scriba.config import Config
+
+
+class _EnergyVad:
+    """RMS-driven stand-in for Silero. The decay mimics Silero's recurrent
+    state holding the probability up across short inter-syllable gaps."""
+
+    def __init__(self) -> None:
+        self._prob = 0.0
+
+    def reset(self) -> None:
+        self._prob = 0.0
+
+    def process_frame(self, pcm: np.ndarray) -> float:
+        rms = float(np.sqrt(np.mean(pcm.astype(np.float64) ** 2))) / 32768.0
+        self._prob = max(min(1.0, rms * 20.0), self._prob * 0.85)
+        return self._prob
+
+
+def test_hesitation_stays_inside_the_utterance_span():
+    signal = synthetic_speech(n_utterances=1, utterance_s=2.0, seed=1, hesitation_s=0.8)
+    assert len(signal.speech_spans) == 1
+    start, end = signal.speech_spans[0]
+    span = np.abs(signal.pcm[int(start * 16000) : int(end * 16000)]) > 300
+    loud = np.flatnonzero(span)
+    assert np.diff(loud).max() >= 0.8 * 16000  # the pause, with speech on both sides
+
+
+def test_adaptive_endpoint_counts_cuts_inside_a_hesitation():
+    signal = synthetic_speech(n_utterances=1, utterance_s=3.0, seed=2, hesitation_s=0.8)
+    fixed = replay_signal(signal, Config(), FakeSttBackend(), vad_factory=_EnergyVad)
+    # 800 ms of silence outlasts the fixed 600 ms endpoint: one cut, two utterances.
+    assert fixed["premature_cuts"] == 1
+    assert len(fixed["utterances"]) == 2
+
+
+def test_synthetic_signal_has_ground_truth_spans():
+    signal = synthetic_speech(n_utterances=2, utterance_s=2.0, seed=1)
+    assert signal.pcm.dtype == np.int16
+    assert len(signal.speech_spans) == 2
+    (s0, e0), (s1, e1) = signal.speech_spans
+    assert 0.9 < s0 < e0 < s1 < e1 < signal.duration_s
+
+
+def test_replay_detects_each_utterance_and_measures_latency():
+    signal = synthetic_speech(n_utterances=3, utterance_s=3.0, seed=0)
+    result = replay_signal(signal, Config(), FakeSttBackend(), vad_factory=_EnergyVad)
+
+    assert len(result["utterances"]) == 3
+    for utterance in result["utterances"]:
+        # the final can't land before the endpoint, and the endpoint can't
+        # land before the speech it closes
+        assert utterance["speech_end_s"] < utterance["endpoint_s"]
+        assert utterance["final_latency_ms"] > 0
+        assert utterance["first_partial_latency_ms"] is not None
+        assert utterance["partials"] >= 1
+        assert utterance["final_text"]
+
+
+def test_replay_falls_back_to_the_spectral_vad_when_silero_cannot_load(monkeypatch):
+    from scriba.detect import vad as vad_module
+
+    def no_network(_path):
+        raise ConnectionError("no route to github")
+
+    monkeypatch.setattr(vad_module, "_open_session", no_network)
+    signal = synthetic_speech(n_utterances=2, utterance_s=3.0, seed=0)
+
+    result = replay_signal(signal, Config(), FakeSttBackend())  # vad.backend = "silero"
+
+    assert len(result["utterances"]) == 2
+
+
+def test_slower_backend_means_later_finals():
+    signal = synthetic_speech(n_utterances=1, utterance_s=3.0, seed=2)
+    fast = replay_signal(signal, Config(), FakeSttBackend(rtf=0.05), vad_factory=_EnergyVad)
+    slow = replay_signal(signal, Config(), FakeSttBackend(rtf=0.5), vad_factory=_EnergyVad)
+    assert slow["utterances"][0]["final_latency_ms"] > fast["utterances"][0]["final_latency_ms"]
+
+
+def test_report_is_json_serializable():
+    signals = [synthetic_speech(n_utterances=1, utterance_s=2.0, seed=s) for s in range(2)]
+    report = run_bench(signals, Config(), FakeSttBackend(), vad_factory=_EnergyVad)
+    decoded = json.loads(json.dumps(report))
+    assert decoded["summary"]["utterances"] == 2
+    assert set(decoded["summary"]["speculative_final"]) == {"hits", "misses", "hit_rate"}
+    assert decoded["summary"]["endpoint"]["premature_cuts"] == 0
+    assert decoded["summary"]["endpoint"]["wait_ms"]["mean"] > 0
+    assert decoded["backend"].startswith("fake-rtf")
+
+
+def test_fake_word_errors_are_stable_across_passes():
+    small = FakeSttBackend(word_error_rate=0.3)
+    short = small.transcribe(np.ones(16000 * 2, dtype=np.int16) * 3000, "en").text.split()
+    long = small.transcribe(np.ones(16000 * 4, dtype=np.int16) * 3000, "en").text.split()
+    exact = FakeSttBackend().transcribe(np.ones(16000 * 4, dtype=np.int16) * 3000, "en")
+    assert long[: len(short)] == short
+    assert long != exact.text.split()
+
+
+def test_partial_model_cascade_reports_churn():
+    signal = synthetic_speech(n_utterances=2, utterance_s=4.0, seed=3)
+    report = run_bench(
+        [signal],
+        Config(),
+        FakeSttBackend(rtf=0.3),
+        vad_factory=_EnergyVad,
+        partial_backend=FakeSttBackend(rtf=0.03, word_error_rate=0.3),
+    )
+    assert report["partial_backend"].startswith("fake-rtf0.03-wer0.3")
+    assert report["signals"][0]["partial_model_decodes"] > 0
+    assert report["summary"]["backspaces"]["final"] > 0
+
+
+def test_silence_trimming_saves_decode_audio():
+    signal = synthetic_speech(n_utterances=2, utterance_s=2.0, seed=5)
+    untrimmed = Config()
+    untrimmed.stt.trim_silence = False
+    full = run_bench([signal], untrimmed, FakeSttBackend(), vad_factory=_EnergyVad)
+    trimmed = run_bench([signal], Config(), FakeSttBackend(), vad_factory=_EnergyVad)
+
+    assert full["summary"]["silence_trim"]["saved_s"] == 0
+    assert trimmed["summary"]["silence_trim"]["saved_s"] > 0
+    for utterance in trimmed["signals"][0]["utterances"]:
+        # at least the endpoint silence beyond the guard, on the final pass
+        assert utterance["trimmed_audio_s"] >= 0.3
+
+
+class _EscalatingBackend(FakeSttBackend):
+    """Reports every final pass as re-decoded with beam search, at a fixed cost."""
+
+    def transcribe(self, pcm, language, hotwords=None, initial_prompt=None, final=False, **extra):
+        transcript = super().transcribe(pcm, language, hotwords, initial_prompt, **extra)
+        if final:
+            transcript.escalation = "avg_logprob -0.90 < -0.5"
+            transcript.escalation_ms = 120.0
+        return transcript
+
+
+def test_beam_escalations_are_reported_per_utterance_and_summarized():
+    signal = synthetic_speech(n_utterances=2, utterance_s=2.0, seed=4)
+    plain = run_bench([signal], Config(), FakeSttBackend(), vad_factory=_EnergyVad)
+    report = run_bench([signal], Config(), _EscalatingBackend(), vad_factory=_EnergyVad)
+
+    assert plain["summary"]["beam_escalation"]["escalated"] == 0
+    utterance = report["signals"][0]["utterances"][0]
+    assert utterance["beam_escalation"].startswith("avg_logprob")
+    assert utterance["beam_escalation_ms"] == 120.0
+    summary = report["summary"]["beam_escalation"]
+    assert summary["escalated"] == 2
+    assert summary["rate"] == 1.0
+    assert summary["mean_cost_per_final_ms"] == 120.0
+
+
+def test_parse_override_uses_toml_values():
+    assert _parse_override("vad.endpoint_silence_ms=400") == ("vad", "endpoint_silence_ms", 400)
+    assert _parse_override("streaming.enabled=false") == ("streaming", "enabled", False)
+    assert _parse_override("general.language=de") == ("general", "language", "de")
+
+
+def test_cli_without_inputs_exits_nonzero():
+    assert main([]) == 2
+
+
+def test_micro_accumulate_counts_fewer_allocations_than_concatenate():
+    from scriba.bench.micro import accumulate
+
+    report = accumulate(utterance_s=5.0)
+    session = report["session"]
+    assert session["pcm_buffer"]["allocations"] < session["concatenate"]["allocations"]
+    assert session["pcm_buffer"]["bytes_copied"] < session["concatenate"]["bytes_copied"]
+    aligned = report["frame_chunker_48k"]
+    assert aligned["frame_chunker"]["bytes_copied"] == 0
+
+
+def test_micro_frame_features_leaves_no_allocations_on_the_detector_thread():
+    from scriba.bench.micro import frame_features
+
+    report = frame_features(n_frames=50)
+    assert report["after"]["detector_thread"]["allocations"] == 0
+    assert report["before"]["allocations"] == 5 * 50
+
+
+def test_micro_resample_streaming_has_no_block_edge_error():
+    from scriba.bench.micro import resample
+
+    report = resample(audio_s=1.0)
+    for rate in ("44100", "48000"):
+        case = report[rate]
+        assert case["streaming"]["max_abs_error"] <= 1.0
+        assert case["streaming"]["samples_out"] == case["samples_expected"]
+        assert case["per_block"]["max_abs_error"] > case["streaming"]["max_abs_error"]
+
+
+def test_micro_mel_features_cache_matches_the_full_extraction():
+    from scriba.bench.micro import mel_features
+
+    report = mel_features(utterance_s=3.2)
+    assert [p["audio_s"] for p in report["passes"]] == [0.8, 1.6, 2.4, 3.2]
+    assert report["max_abs_error"] < 1e-5
+
+
+def test_micro_denoise_gate_keeps_the_speech_level_and_beats_the_old_pass():
+    from scriba.bench.micro import denoise
+
+    report = denoise()
+    gate, old = report["noise_gate"], report["per_pass_noisereduce"]
+    assert abs(gate["speech_rms"] - 1.0) < 0.05
+    assert gate["snr_db"] > old["snr_db"] > report["input"]["snr_db"]
+    assert gate["gap_rms"] < 0.6
+
+
+def test_micro_locked_vad_scores_fewer_rows_with_more_devices():
+    from scriba.bench.micro import locked_vad
+
+    report = locked_vad(audio_s=15.0, max_devices=3)
+    one, three = report["devices"]["1_devices"], report["devices"]["3_devices"]
+    assert one["skip_losers"]["vad_rows_per_audio_s"] == one["score_all"]["vad_rows_per_audio_s"]
+    assert (
+        three["skip_losers"]["vad_rows_per_audio_s"]
+        < 0.6 * three["score_all"]["vad_rows_per_audio_s"]
+    )
+
+
+def test_energy_gate_keeps_utterance_boundaries_with_fewer_vad_runs():
+    signals = [synthetic_speech(n_utterances=3, gap_s=3.0, seed=seed) for seed in range(2)]
+
+    def boundaries(energy_gate_db: float) -> tuple[list, dict]:
+        config = Config()
+        config.vad.energy_gate_db = energy_gate_db
+        report = run_bench(signals, config, FakeSttBackend(rtf=0.1), vad_factory=_EnergyVad)
+        spans = [
+            (u["speech_onset_s"], u["endpoint_s"])
+            for s in report["signals"]
+            for u in s["utterances"]
+        ]
+        return spans, report["summary"]["vad_gate"]
+
+    scored, scored_counts = boundaries(0.0)
+    gated, gated_counts = boundaries(3.0)
+
+    assert gated == scored and len(scored) == 6
+    assert scored_counts["gated"] == 0
+    assert gated_counts["inferences"] < 0.75 * scored_counts["inferences"]
+
+
+def test_micro_vad_backends_reports_the_spectral_vad_against_ground_truth():
+    from scriba.bench.micro import vad_backends
+
+    report = vad_backends(noise_dbfs=(-50.0,), seeds=1)
+    spectral = report["noise"]["-50_dbfs"]["spectral"]
+    assert spectral["accuracy"] > 0.9
+    assert spectral["ms_per_audio_s"] > 0
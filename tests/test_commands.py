@@ -1,4 +1,4 @@
-from scriba.text.commands import apply_commands
+from scriba.text.commands import apply_commands, trailing_command_output
 
 
 def test_standalone_period_en():
@@ -98,3 +98,11 @@ def test_empty_text_returns_unchanged():
 def test_longest_phrase_preferred_over_shorter_suffix():
     # trailing "and period" must consume "and" too, not leave it dangling
     assert apply_commands("call me and period") == "call me."
+
+
+def test_trailing_command_output_reports_what_would_be_appended():
+    assert trailing_command_output("let's meet tomorrow period") == "."
+    assert trailing_command_output("eggs milk comma") == ","
+    assert trailing_command_output("hit enter") == "\n"
+    assert trailing_command_output("the trial period is 30 days") is None
+    assert trailing_command_output("") is None
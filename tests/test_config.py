@@ -70,3 +70,92 @@ def test_invalid_vad_threshold_rejected():
         pass
     else:
         raise AssertionError("expected ConfigError")
+
+
+def test_negative_trim_guard_rejected():
+    try:
+        config_from_dict({"stt": {"trim_guard_ms": -1}})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("expected ConfigError")
+
+
+def test_escalate_beam_size_below_one_rejected():
+    try:
+        config_from_dict({"stt": {"escalate_beam_size": 0}})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("expected ConfigError")
+
+
+def test_invalid_partial_device_rejected():
+    try:
+        config_from_dict({"streaming": {"partial_model": "base", "partial_device": "tpu"}})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("expected ConfigError")
+
+
+def test_denoise_strength_outside_unit_range_rejected():
+    try:
+        config_from_dict({"stt": {"denoise_strength": 1.5}})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("expected ConfigError")
+
+
+def test_unknown_stt_standby_rejected():
+    assert config_from_dict({}).stt.standby == "download"  # "warm" is opt-in
+    try:
+        config_from_dict({"stt": {"standby": "hot"}})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("expected ConfigError")
+
+
+def test_unknown_stt_idle_tier_rejected():
+    assert config_from_dict({}).stt.idle_tier == "unload"  # "small"/"cache" are opt-in
+    try:
+        config_from_dict({"stt": {"idle_tier": "swap"}})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("expected ConfigError")
+
+
+def test_negative_vad_energy_gate_rejected():
+    try:
+        config_from_dict({"vad": {"energy_gate_db": -1.0}})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("expected ConfigError")
+
+
+def test_unknown_vad_backend_rejected():
+    assert config_from_dict({"vad": {"backend": "spectral"}}).vad.backend == "spectral"
+    try:
+        config_from_dict({"vad": {"backend": "webrtc"}})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("expected ConfigError")
+
+
+def test_non_positive_queue_bounds_rejected():
+    for raw in (
+        {"audio": {"frame_queue_max": 0}},
+        {"streaming": {"chunk_queue_max": 0}},
+        {"inject": {"queue_max": -1}},
+    ):
+        try:
+            config_from_dict(raw)
+        except ConfigError:
+            pass
+        else:
+            raise AssertionError(f"expected ConfigError for {raw}")
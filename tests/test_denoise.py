@@ -0,0 +1,62 @@
+"""`NoiseGate`: the streaming spectral gate the detector runs with `stt.denoise`."""
+
+import numpy as np
+
+from scriba.audio.denoise import DELAY_SAMPLES, NoiseGate
+
+_SAMPLE_RATE = 16000
+_SECOND = 31 * 512  # ~1 s of whole frames
+_FRAME = 512
+
+
+def _noise(n_samples: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0, 0.02, n_samples).astype(np.float32)
+
+
+def _tone(n_samples: int, freq_hz: float = 300.0, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(n_samples) / _SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * freq_hz * t)).astype(np.float32)
+
+
+def _run(gate: NoiseGate, samples: np.ndarray, is_noise: bool) -> np.ndarray:
+    frames = [
+        gate.process(samples[i : i + _FRAME], is_noise) for i in range(0, samples.size, _FRAME)
+    ]
+    return np.concatenate(frames).astype(np.float32) / 32768.0
+
+
+def _rms(samples: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(samples**2)))
+
+
+def test_passes_audio_through_delayed_until_noise_is_learned():
+    gate = NoiseGate()
+    audio = _tone(_FRAME * 10) + _noise(_FRAME * 10)
+
+    out = _run(gate, audio, is_noise=False)
+
+    assert not gate.ready
+    np.testing.assert_allclose(out[DELAY_SAMPLES:], audio[:-DELAY_SAMPLES], atol=1e-4)
+
+
+def test_learned_noise_is_attenuated_and_speech_over_it_is_kept():
+    gate = NoiseGate(strength=0.8)
+    _run(gate, _noise(_SECOND, seed=1), is_noise=True)
+    assert gate.ready
+
+    gap = _run(gate, _noise(_SECOND, seed=2), is_noise=False)
+    clean = _tone(_SECOND)
+    speech = _run(gate, clean + _noise(_SECOND, seed=3), is_noise=False)
+
+    assert _rms(gap[_FRAME:]) < 0.6 * 0.02
+    assert abs(_rms(speech[_FRAME:]) / _rms(clean) - 1.0) < 0.05
+
+
+def test_only_non_speech_frames_update_the_profile():
+    gate = NoiseGate()
+    _run(gate, _noise(_SECOND), is_noise=True)
+    profile = gate.noise_profile.copy()
+
+    _run(gate, _tone(_SECOND), is_noise=False)
+
+    np.testing.assert_array_equal(gate.noise_profile, profile)
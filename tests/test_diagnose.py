@@ -55,3 +55,39 @@ def test_run_diagnostics_prints_report(capsys):
     assert "CUDA" in out
     assert "Model cache" in out
     assert "STT benchmark" in out
+
+
+def test_run_diagnostics_prints_idle_tiers(capsys, monkeypatch):
+    from scriba.config import Config
+    from scriba.stt import residency
+
+    reports = [
+        residency.TierReport("resident", 1500 << 20, 900 << 20, 0.0, 0.0, "m"),
+        residency.TierReport("small", 300 << 20, 0, 0.0, 4.2, "small/int8/cpu"),
+        residency.TierReport("unload", 0, 0, None, None, "not measurable here"),
+    ]
+    monkeypatch.setattr(residency, "measure_idle_tiers", lambda config, cuda: reports)
+
+    run_diagnostics(Config())
+
+    out = capsys.readouterr().out
+    assert "Idle tiers" in out
+    assert "1500 MB" in out and "4.2 s" in out and "n/a" in out
+    assert "stt.idle_tier = 'unload'" in out
+
+
+def test_run_diagnostics_prints_last_session_queue_stats(capsys, monkeypatch, tmp_path):
+    from scriba import diagnose
+    from scriba.config import Config
+    from scriba.queues import QueueStats, save_queue_stats
+
+    path = tmp_path / "queue_stats.json"
+    save_queue_stats([QueueStats("frames", 128, 0, 128, 0, 412, 0)], path)
+    monkeypatch.setattr(diagnose, "queue_stats_path", lambda: path)
+
+    run_diagnostics(Config())
+
+    out = capsys.readouterr().out
+    assert "Pipeline queues" in out
+    assert "bounds: frames 128, chunks 64, inject 32" in out
+    assert "dropped    412" in out
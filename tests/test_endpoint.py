@@ -0,0 +1,105 @@
+"""Endpoint predicate tests (scriba/detect/endpoint.py): how a partial's text
+ending maps to the silence `UtteranceSegmenter` waits for."""
+
+import numpy as np
+import pytest
+
+from scriba.config import VadConfig
+from scriba.detect.endpoint import (
+    FixedEndpoint,
+    TranscriptEndpoint,
+    classify_ending,
+    endpoint_predicate,
+)
+from scriba.detect.vad import UtteranceSegmenter
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "See you tomorrow.",
+        "Are you coming?",
+        'He said "stop!"',
+        "see you tomorrow period",
+        "insert the code new line",
+        "wir sehen uns morgen punkt",
+    ],
+)
+def test_complete_endings(text):
+    assert classify_ending(text) == "complete"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "I went to the store and",
+        "I went to the store and.",  # a dangling word outranks Whisper's period
+        "so we need, um",
+        "the list is,",
+        "well...",
+        "eggs milk bread comma",
+        "wir brauchen noch die",
+    ],
+)
+def test_incomplete_endings(text):
+    assert classify_ending(text) == "incomplete"
+
+
+@pytest.mark.parametrize("text", ["", "   ", "see you tomorrow", "the trial period is 30 days"])
+def test_neutral_endings(text):
+    assert classify_ending(text) is None
+
+
+def _config(**overrides):
+    values = dict(endpoint_silence_ms=608, endpoint_complete_ms=288, endpoint_incomplete_ms=992)
+    values.update(overrides)
+    return VadConfig(**values)
+
+
+def test_fixed_endpoint_ignores_text():
+    endpoint = FixedEndpoint(_config())
+    endpoint.observe(1, "done.")
+    assert not endpoint.endpoint_reached(1, 18)
+    assert endpoint.endpoint_reached(1, 19)
+
+
+def test_transcript_endpoint_uses_latest_text_of_the_same_utterance():
+    endpoint = TranscriptEndpoint(_config())
+    assert endpoint.required_frames(1) == 19  # no text yet: the fixed default
+
+    endpoint.observe(1, "done.")
+    assert endpoint.required_frames(1) == 9
+    assert endpoint.required_frames(2) == 19  # text from another utterance doesn't count
+    assert endpoint.required_frames(None) == 19  # unconfirmed candidate
+
+    endpoint.observe(1, "done. and")
+    assert endpoint.required_frames(1) == 31
+    endpoint.observe(1, "done. and then")
+    assert endpoint.required_frames(1) == 19
+
+
+def test_endpoint_predicate_follows_config():
+    assert isinstance(endpoint_predicate(_config()), FixedEndpoint)
+    assert isinstance(endpoint_predicate(_config(endpoint_adaptive=True)), TranscriptEndpoint)
+
+
+def test_segmenter_ends_early_once_partial_text_is_complete():
+    config = _config(threshold=0.5, min_speech_ms=96, pre_roll_ms=0)
+    endpoint = TranscriptEndpoint(config)
+    segmenter = UtteranceSegmenter(config, lambda _device: None, endpoint)
+    frame = np.zeros(512, dtype=np.int16)
+    probs = [0.9] * 6 + [0.1] * 35
+
+    def final_frames(t0, text_at=None, text=""):
+        finals = []
+        for i, prob in enumerate(probs):
+            if i == text_at:
+                endpoint.observe(segmenter._utterance_id, text)
+            chunk = segmenter.process_frame("mic1", frame, prob, t0 + i * 0.032)
+            if chunk is not None and chunk.is_final:
+                finals.append(i)
+        return finals
+
+    assert final_frames(0.0) == [24]  # no text: the fixed 19 silent frames
+    assert final_frames(10.0, text_at=8, text="see you tomorrow.") == [14]  # 9 silent frames
+    assert final_frames(20.0, text_at=8, text="see you and") == [36]  # 31 silent frames
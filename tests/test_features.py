@@ -0,0 +1,75 @@
+"""`MelFeatureCache` against faster-whisper's own `FeatureExtractor`: the
+incremental features must be what a full extraction of the buffer returns."""
+
+import numpy as np
+from faster_whisper.feature_extractor import FeatureExtractor
+
+from scriba.stt.features import MelFeatureCache
+
+_EXTRACTOR = FeatureExtractor(feature_size=128)
+
+
+def _speechlike(n_samples: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    envelope = 0.5 + 0.5 * np.sin(np.arange(n_samples) / 1600)
+    return (rng.standard_normal(n_samples) * 4000 * envelope).astype(np.int16)
+
+
+def _full(pcm: np.ndarray) -> np.ndarray:
+    return _EXTRACTOR(pcm.astype(np.float32) / 32768.0)
+
+
+def test_growing_buffer_matches_full_extraction():
+    pcm = _speechlike(16000 * 3)
+    cache = MelFeatureCache(_EXTRACTOR.mel_filters)
+
+    for size in (150, 512, 1600, 1601, 8000, 12800 + 77, pcm.size):
+        features = cache.features(pcm[:size])
+        np.testing.assert_allclose(features, _full(pcm[:size]), atol=1e-5)
+
+    assert cache.passes == 7
+    # everything but the frames still reaching into the end padding is kept
+    assert pcm.size // 160 + 1 - cache.stable_frames <= 2
+
+
+def test_front_drop_only_changes_the_first_two_frames():
+    pcm = _speechlike(16000 * 2, seed=1)
+    cache = MelFeatureCache(_EXTRACTOR.mel_filters)
+    cache.features(pcm)
+
+    drop = cache.align(1000)
+    cache.drop_front(drop)
+    features = cache.features(pcm[drop:])
+    expected = _full(pcm[drop:])
+
+    assert drop == 1120
+    assert features.shape == expected.shape
+    np.testing.assert_allclose(features[:, 2:], expected[:, 2:], atol=1e-5)
+
+
+def test_unaligned_drop_clears_the_cache():
+    pcm = _speechlike(16000)
+    cache = MelFeatureCache(_EXTRACTOR.mel_filters)
+    cache.features(pcm)
+
+    cache.drop_front(100)
+
+    assert cache.stable_frames == 0
+    np.testing.assert_allclose(cache.features(pcm[100:]), _full(pcm[100:]), atol=1e-5)
+
+
+def test_ranges_select_and_renormalize_their_own_frames():
+    pcm = _speechlike(16000 * 2, seed=2)
+    cache = MelFeatureCache(_EXTRACTOR.mel_filters)
+
+    features = cache.features(pcm, [(3200, 16000)])
+    expected = _full(pcm[3200:16000])
+
+    assert features.shape == expected.shape
+    # interior frames match -- only the two edge frames see real neighbours
+    # instead of padding -- except where both are clamped to the floor 8
+    # below each one's own maximum
+    unclamped = expected[:, 2:-2] > expected.min() + 1e-3
+    np.testing.assert_allclose(
+        features[:, 2:-2][unclamped], expected[:, 2:-2][unclamped], atol=1e-5
+    )
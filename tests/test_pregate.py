@@ -0,0 +1,51 @@
+"""`EnergyPreGate` (detect/pregate.py): the adaptive noise floor and when it
+lets a frame skip the VAD."""
+
+import numpy as np
+
+from scriba.detect.pregate import EnergyPreGate
+
+
+def _rms(dbfs: float) -> float:
+    return 10 ** (dbfs / 20)
+
+
+def test_gates_the_noise_floor_only_after_calibrating():
+    gate = EnergyPreGate(margin_db=3.0)
+    rng = np.random.default_rng(0)
+    decisions = [gate.observe(_rms(-60 + rng.normal(0, 0.5))) for _ in range(100)]
+
+    assert not any(decisions[:31])
+    assert all(decisions[40:])
+    assert -62 < gate.floor_dbfs < -59
+
+
+def test_onset_above_the_margin_holds_the_gate_open():
+    gate = EnergyPreGate(margin_db=3.0)
+    for _ in range(50):
+        gate.observe(_rms(-60))
+
+    assert gate.observe(_rms(-50)) is False  # a soft onset, 10 dB above the floor
+    # back at the floor for ~0.5 s, still scored
+    assert [gate.observe(_rms(-60)) for _ in range(16)] == [False] * 16
+    assert gate.observe(_rms(-60)) is True
+
+
+def test_floor_rises_slowly_and_falls_fast():
+    gate = EnergyPreGate(margin_db=3.0)
+    for _ in range(50):
+        gate.observe(_rms(-60))
+    for _ in range(31):  # a fan turns on: one second of it barely moves the floor
+        assert gate.observe(_rms(-40)) is False
+    assert gate.floor_dbfs < -59
+    for _ in range(10):  # and the floor drops straight back when it stops
+        gate.observe(_rms(-70))
+    assert gate.floor_dbfs < -68
+
+
+def test_never_gates_loud_frames_or_digital_silence_breaks_it():
+    gate = EnergyPreGate(margin_db=3.0)
+    for _ in range(50):
+        assert gate.observe(_rms(-30)) is False  # above the absolute ceiling
+    silent = EnergyPreGate()
+    assert [silent.observe(0.0) for _ in range(40)][-1] is True
@@ -0,0 +1,195 @@
+"""Bounded pipeline queues (scriba/queues.py) and the overflow policies each
+pipeline stage gives its queue: frame shedding (`Detector.shed_frame`),
+chunk merging (`coalesce_queued_chunks`), partial-job folding
+(`coalesce_queued_jobs`) -- plus a detector stall under live capture.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from scriba.config import Config
+from scriba.detect.vad import Detector, _EndpointRequest
+from scriba.inject.base import coalesce_queued_jobs, merge_jobs
+from scriba.messages import AudioChunk, AudioFrame, InjectJob
+from scriba.queues import BoundedQueue, QueueStats, load_queue_stats, save_queue_stats
+from scriba.stt.streaming import coalesce_queued_chunks
+
+
+def _frame(device_id: str, t: float = 0.0, level: float = 0.1) -> AudioFrame:
+    return AudioFrame(device_id, np.full(512, int(level * 32767), dtype=np.int16), t)
+
+
+class _ScriptedVad:
+    """`VadBackend` stand-in: speech on the devices in `speaking`, silence
+    elsewhere; sleeps `stall_s` inside one `process()` call once armed."""
+
+    def __init__(self, speaking: set[str]) -> None:
+        self.speaking = speaking
+        self.stall_s = 0.0
+        self.stalled = threading.Event()
+        self.resumed = threading.Event()
+        self.queued_after_stall: list[str] = []
+        self.frame_queue: queue.Queue | None = None
+
+    def load(self) -> None:
+        pass
+
+    def prewarm(self, batch_size: int = 1) -> None:
+        pass
+
+    def reset(self, device_id: str | None = None) -> None:
+        pass
+
+    def skip(self, frames) -> None:
+        pass
+
+    def process(self, frames) -> list[float]:
+        if self.stall_s:
+            stall, self.stall_s = self.stall_s, 0.0
+            self.stalled.set()
+            time.sleep(stall)
+            with self.frame_queue.mutex:
+                self.queued_after_stall = [f.device_id for f in self.frame_queue.queue]
+            self.resumed.set()
+        return [0.9 if f.device_id in self.speaking else 0.05 for f in frames]
+
+
+def test_bounded_queue_sheds_at_capacity_and_tracks_high_water():
+    q = BoundedQueue("t", 3, shed=lambda items: bool(items.popleft()) or True)
+    for i in range(5):
+        q.put_nowait(i)  # never raises queue.Full
+    assert list(q.queue) == [2, 3, 4]
+    stats = q.stats()
+    assert (stats.depth, stats.high_water, stats.dropped, stats.overflowed) == (3, 3, 2, 0)
+
+
+def test_bounded_queue_overflows_rather_than_losing_what_no_policy_can_drop():
+    q = BoundedQueue("t", 2, coalesce=lambda items: 0)
+    for i in range(4):
+        q.put(i)
+    assert list(q.queue) == [0, 1, 2, 3]
+    stats = q.stats()
+    assert (stats.high_water, stats.coalesced, stats.dropped, stats.overflowed) == (4, 0, 0, 2)
+
+
+def test_queue_stats_round_trip(tmp_path):
+    path = tmp_path / "queue_stats.json"
+    stats = [QueueStats("frames", 128, 3, 128, 0, 40, 0), QueueStats("inject", 32)]
+    save_queue_stats(stats, path)
+    assert load_queue_stats(path) == stats
+    assert load_queue_stats(tmp_path / "missing.json") == []
+
+
+def test_shed_frame_drops_losing_devices_first_and_never_endpoint_requests():
+    detector = Detector(
+        Config(), queue.Queue(), queue.Queue(), lambda _d: None, vad=_ScriptedVad(set())
+    )
+    endpoint = _EndpointRequest(0.0)
+    items = deque(
+        [endpoint, _frame("a", 0.0), _frame("b", 0.0), _frame("a", 0.032), _frame("b", 0.032)]
+    )
+    assert detector.shed_frame(items)  # no winner: the oldest frame
+    assert [getattr(i, "device_id", None) for i in items] == [None, "b", "a", "b"]
+
+    detector._arbiter._winner = "a"
+    assert detector.shed_frame(items) and detector.shed_frame(items)
+    assert [getattr(i, "device_id", None) for i in items] == [None, "a"]
+    assert detector.shed_frame(items)  # only the winner's left
+    assert list(items) == [endpoint]
+    assert not detector.shed_frame(items)
+
+
+def test_coalesce_queued_chunks_merges_per_utterance_in_place():
+    pcm = np.ones(512, dtype=np.int16)
+    items = deque(
+        [AudioChunk(1, "a", pcm, 0.0), AudioChunk(1, "a", pcm, 0.1), AudioChunk(2, "a", pcm, 0.2)]
+    )
+    assert coalesce_queued_chunks(items) == 1
+    assert [(c.utterance_id, c.pcm.size) for c in items] == [(1, 1024), (2, 512)]
+
+
+def test_merge_jobs_replays_backspaces_into_the_earlier_text():
+    typed = "hello "
+
+    def apply(text: str, job: InjectJob) -> str:
+        return text[: len(text) - job.erase] + job.text
+
+    first = InjectJob("wor", erase=1, utterance_id=1)
+    for second in (
+        InjectJob("ld", erase=0, utterance_id=1),
+        InjectJob("there", erase=5, utterance_id=1),
+    ):
+        merged = merge_jobs(first, second)
+        assert apply(typed, merged) == apply(apply(typed, first), second)
+
+
+def test_coalesce_queued_jobs_folds_partials_but_keeps_finals_and_utterances_apart():
+    items = deque(
+        [
+            InjectJob("a", utterance_id=1),
+            InjectJob("b", utterance_id=1),
+            InjectJob("c", utterance_id=1, is_final=True),
+            InjectJob("d", utterance_id=2),
+            InjectJob("e", utterance_id=3, is_final=True),
+        ]
+    )
+    assert coalesce_queued_jobs(items) == 2
+    assert [(j.text, j.utterance_id, j.is_final) for j in items] == [
+        ("abc", 1, True),
+        ("d", 2, False),
+        ("e", 3, True),
+    ]
+
+
+def test_detector_stall_stays_bounded_and_recovers_quickly():
+    """Two mics at 8x real time; "a" talks and wins, "b" doesn't. A 2 s
+    stall inside the VAD backs capture up against the 64-frame bound: the
+    queue sheds "b" first, and once the detector resumes it is drained
+    within a bounded time instead of working through 2 s of backlog."""
+    config = Config()
+    config.vad.energy_gate_db = 0
+    vad = _ScriptedVad({"a"})
+    chunk_queue: queue.Queue[AudioChunk] = queue.Queue()
+    detector: Detector
+    frame_queue = BoundedQueue("frames", 64, shed=lambda items: detector.shed_frame(items))
+    vad.frame_queue = frame_queue
+    detector = Detector(config, frame_queue, chunk_queue, lambda _d: None, vad=vad)
+    stop = threading.Event()
+    threading.Thread(target=detector.run, args=(stop,), daemon=True).start()
+
+    def capture() -> None:
+        tick = 0
+        while not stop.is_set():
+            for device_id in ("a", "b"):
+                frame_queue.put_nowait(_frame(device_id, tick * 0.032))
+            tick += 1
+            time.sleep(0.004)
+
+    threading.Thread(target=capture, daemon=True).start()
+    try:
+        deadline = time.monotonic() + 5.0
+        while detector._arbiter.winner != "a":  # arbitration settled on "a"
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        vad.stall_s = 2.0
+        assert vad.stalled.wait(5.0)
+        assert vad.resumed.wait(5.0)
+        t_resume = time.monotonic()
+        # every loser frame but the newest was shed before any of the winner's
+        assert vad.queued_after_stall.count("b") <= 1
+        assert len(vad.queued_after_stall) <= 64
+
+        while frame_queue.qsize() > 4:
+            assert time.monotonic() - t_resume < 0.5, "backlog not drained"
+            time.sleep(0.001)
+    finally:
+        stop.set()
+
+    stats = frame_queue.stats()
+    assert stats.high_water <= 64
+    assert stats.dropped > 300  # ~2 s x 250 ticks/s x 2 devices, minus the bound
+    assert stats.overflowed == 0
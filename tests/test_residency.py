@@ -0,0 +1,46 @@
+"""Idle-tier helpers (scriba/stt/residency.py) that don't need a model."""
+
+from scriba.stt import residency
+from scriba.stt.residency import PageCacheWarmer, model_files, process_rss_bytes
+
+
+def test_model_files_lists_a_cached_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(residency, "models_dir", lambda: tmp_path)
+    (tmp_path / "small").mkdir()
+    (tmp_path / "small" / "model.bin").write_bytes(b"x")
+    (tmp_path / "small" / "config.json").write_text("{}", encoding="utf-8")
+
+    assert [p.name for p in model_files("small")] == ["config.json", "model.bin"]
+    assert model_files("large-v3-turbo") == []
+
+
+def test_page_cache_warmer_reads_every_byte(tmp_path):
+    files = [tmp_path / "a.bin", tmp_path / "b.bin"]
+    files[0].write_bytes(b"\1" * (5 << 20))
+    files[1].write_bytes(b"\2" * 1000)
+    warmer = PageCacheWarmer([*files, tmp_path / "gone.bin"])
+
+    assert warmer.size_bytes == (5 << 20) + 1000
+    assert warmer.warm() == (5 << 20) + 1000
+    assert warmer.last_s > 0
+
+
+def test_page_cache_warmer_is_due_once_per_interval_and_never_mid_pass(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"\1" * 1000)
+    warmer = PageCacheWarmer([path], interval_s=60)
+    assert warmer.due()
+
+    warmer.warm()
+    assert not warmer.due()  # warmed just now
+
+    warmer = PageCacheWarmer([path], interval_s=0)
+    with warmer._lock:  # a pass in progress on another thread
+        assert not warmer.due()
+        assert warmer.warm() == 0
+    assert warmer.due()
+
+
+def test_process_rss_is_known_here():
+    rss = process_rss_bytes()
+    assert rss is not None and rss > 1 << 20
@@ -0,0 +1,71 @@
+"""Adaptive partial re-decode pacing (scriba/stt/scheduler.py): the RTF
+moving average, the stretched cadence, and skipping partials while behind.
+"""
+
+import pytest
+
+from scriba.stt.scheduler import DecodeScheduler, RtfTracker
+
+
+def test_rtf_tracker_is_per_descriptor_moving_average():
+    tracker = RtfTracker()
+    assert tracker.rtf("gpu") is None
+
+    tracker.record("gpu", wall_s=0.5, audio_s=5.0)
+    assert tracker.rtf("gpu") == pytest.approx(0.1)
+
+    tracker.record("gpu", wall_s=2.5, audio_s=5.0)  # one slow pass moves it, doesn't replace it
+    assert 0.1 < tracker.rtf("gpu") < 0.5
+    assert tracker.rtf("cpu") is None
+
+
+def test_rtf_tracker_ignores_empty_audio():
+    tracker = RtfTracker()
+    tracker.record("gpu", wall_s=0.1, audio_s=0.0)
+    assert tracker.rtf("gpu") is None
+
+
+def test_interval_is_configured_cadence_until_decodes_get_slow():
+    tracker = RtfTracker()
+    scheduler = DecodeScheduler(0.8, tracker)
+    assert scheduler.interval_s("cpu", buffer_s=10.0) == 0.8  # nothing measured yet
+
+    tracker.record("cpu", wall_s=0.5, audio_s=10.0)  # RTF 0.05 -> 0.5 s predicted, < 0.8
+    assert scheduler.interval_s("cpu", buffer_s=10.0) == 0.8
+
+    tracker.record("cpu", wall_s=10.0, audio_s=10.0)
+    rtf = tracker.rtf("cpu")
+    assert scheduler.interval_s("cpu", buffer_s=10.0) == pytest.approx(1.5 * rtf * 10.0)
+
+
+def test_non_adaptive_scheduler_keeps_fixed_cadence():
+    tracker = RtfTracker()
+    tracker.record("cpu", wall_s=10.0, audio_s=1.0)
+    scheduler = DecodeScheduler(0.8, tracker, adaptive=False)
+    scheduler.start(0.0)
+
+    assert scheduler.interval_s("cpu", buffer_s=10.0) == 0.8
+    assert scheduler.partial_due("cpu", 10.0, chunk_t=0.8, now=60.0)  # lag ignored too
+
+
+def test_partial_skipped_while_behind_and_slot_consumed():
+    scheduler = DecodeScheduler(0.8, RtfTracker())
+    scheduler.start(0.0)
+
+    assert not scheduler.partial_due("gpu", 1.0, chunk_t=0.5, now=0.5)  # not due yet
+    assert not scheduler.partial_due("gpu", 1.0, chunk_t=0.9, now=2.5)  # due, but 1.6 s stale
+    assert not scheduler.partial_due("gpu", 1.0, chunk_t=1.0, now=1.0)  # slot was taken at 0.9
+    assert scheduler.partial_due("gpu", 1.0, chunk_t=1.8, now=1.8)
+
+    assert scheduler.stats.skipped_behind == 1
+    assert scheduler.stats.partials == 1
+
+
+def test_effective_cadence_from_partial_times():
+    scheduler = DecodeScheduler(0.5, RtfTracker())
+    scheduler.start(0.0)
+    for t in (0.5, 1.0, 1.6, 2.0, 2.6):
+        scheduler.partial_due("gpu", 1.0, chunk_t=t, now=None)
+
+    assert scheduler.stats.partial_times == [0.5, 1.0, 1.6, 2.6]
+    assert scheduler.stats.effective_cadence_ms == pytest.approx(700.0)
@@ -0,0 +1,146 @@
+"""`SpectralFluxVad` (detect/spectral.py), and the detector's fallback to
+it when Silero can't load.
+
+Its weights were fitted on `scriba.bench.signals.synthetic_speech` in
+white noise, so accuracy is checked on held-out signals built differently
+instead: source-filter vowels (glottal pulses through formant resonators),
+fricative onsets, pink noise and mains hum."""
+
+import queue
+
+import numpy as np
+from scipy.signal import lfilter
+
+from scriba.bench.signals import synthetic_speech
+from scriba.config import Config
+from scriba.detect import vad as vad_module
+from scriba.detect.spectral import SpectralFluxVad
+from scriba.detect.vad import Detector, SileroVadEngine, vad_backend
+from scriba.messages import AudioFrame
+
+
+def _frames(pcm: np.ndarray, device_id: str = "mic") -> list[AudioFrame]:
+    return [
+        AudioFrame(device_id, pcm[i : i + 512], i / 16000) for i in range(0, pcm.size - 511, 512)
+    ]
+
+
+def _speech_mask(n_samples: int, spans: list[tuple[float, float]]) -> np.ndarray:
+    centres = (np.arange(n_samples // 512) + 0.5) * 512 / 16000
+    mask = np.zeros(centres.size, dtype=bool)
+    for start, end in spans:
+        mask |= (centres >= start) & (centres < end)
+    return mask
+
+
+def _speech_decisions(pcm: np.ndarray) -> np.ndarray:
+    vad = SpectralFluxVad()
+    return np.array([vad.process([frame])[0] for frame in _frames(pcm)]) >= 0.5
+
+
+# (F1, F2, F3) Hz of /a/ /i/ /u/ /e/
+_FORMANTS = ((730, 1090, 2440), (270, 2290, 3010), (300, 870, 2240), (530, 1840, 2480))
+
+
+def _resonator(x: np.ndarray, freq: float, bandwidth: float) -> np.ndarray:
+    r = np.exp(-np.pi * bandwidth / 16000)
+    return lfilter([1 - r], [1, -2 * r * np.cos(2 * np.pi * freq / 16000), r * r], x)
+
+
+def _pink_noise(rng: np.random.Generator, n: int) -> np.ndarray:
+    spectrum = np.fft.rfft(rng.standard_normal(n))
+    spectrum /= np.sqrt(np.maximum(np.arange(spectrum.size), 1))
+    noise = np.fft.irfft(spectrum, n)
+    return noise / np.std(noise)
+
+
+def _hum(n: int, amplitude: float) -> np.ndarray:
+    t = np.arange(n) / 16000
+    return sum(amplitude / k * np.sin(2 * np.pi * 50 * k * t) for k in range(1, 6))
+
+
+def _held_out_speech(
+    seed: int, noise_dbfs: float, hum: float = 0.0
+) -> tuple[np.ndarray, list[tuple[float, float]]]:
+    """Three ~3 s utterances of source-filter "speech" in pink noise (plus
+    `hum` amplitude of 50 Hz mains hum), and their spans in seconds."""
+    rng = np.random.default_rng(1000 + seed)
+    pieces = [np.zeros(12800)]
+    spans = []
+    cursor = pieces[0].size
+    for _ in range(3):
+        start = cursor
+        f0 = rng.uniform(90.0, 260.0)
+        while cursor - start < 3 * 16000:
+            n = int(rng.uniform(0.08, 0.35) * 16000)
+            pulses = np.zeros(n)
+            period = 16000 / (f0 * rng.uniform(0.9, 1.1))
+            pulses[np.arange(0.0, n - 1, period).round().astype(int)] = 1.0
+            formants = _FORMANTS[rng.integers(len(_FORMANTS))]
+            voiced = sum(_resonator(pulses, f, 80 + 40 * k) for k, f in enumerate(formants))
+            syllable = voiced * np.sin(np.pi * np.arange(n) / n) ** 0.5
+            if rng.random() < 0.3:  # fricative onset
+                hiss = _resonator(rng.standard_normal(960), 4500, 1500)
+                syllable = np.concatenate([hiss * 0.3 * np.max(np.abs(syllable)), syllable])
+            pause = np.zeros(int(rng.uniform(0.02, 0.15) * 16000))
+            pieces += [syllable, pause]
+            cursor += syllable.size + pause.size
+        spans.append((start / 16000, (cursor - pause.size) / 16000))
+        gap = np.zeros(int(rng.uniform(1.0, 2.0) * 16000))
+        pieces.append(gap)
+        cursor += gap.size
+    signal = np.concatenate(pieces)
+    signal *= 0.3 / np.max(np.abs(signal))
+    signal += _pink_noise(rng, signal.size) * 10 ** (noise_dbfs / 20) + _hum(signal.size, hum)
+    return np.clip(np.round(signal * 32767), -32768, 32767).astype(np.int16), spans
+
+
+def test_finds_held_out_speech_in_pink_noise_and_hum():
+    for seed, noise_dbfs, hum in [(0, -60.0, 0.0), (1, -40.0, 0.0), (2, -45.0, 0.02)]:
+        pcm, spans = _held_out_speech(seed, noise_dbfs, hum)
+        speech = _speech_decisions(pcm)
+        truth = _speech_mask(pcm.size, spans)
+
+        assert np.mean(speech == truth) > 0.94, (noise_dbfs, hum)
+        assert np.mean(~speech[truth]) < 0.03, (noise_dbfs, hum)
+
+
+def test_mains_hum_alone_is_not_speech():
+    rng = np.random.default_rng(5)
+    for noise_dbfs, hum in [(-60.0, 0.05), (-50.0, 0.02), (-40.0, 0.005)]:
+        noise = _pink_noise(rng, 16000 * 8) * 10 ** (noise_dbfs / 20) + _hum(16000 * 8, hum)
+        pcm = np.round(noise * 32767).astype(np.int16)
+
+        assert np.mean(_speech_decisions(pcm)[16:]) < 0.02, (noise_dbfs, hum)
+
+
+def test_devices_are_scored_in_one_batch_with_their_own_state():
+    rng = np.random.default_rng(0)
+    quiet = (rng.standard_normal(512 * 40) * 30).astype(np.int16)
+    loud = synthetic_speech(n_utterances=1, lead_s=0.0, noise_dbfs=-50.0).pcm[: 512 * 40]
+    together, alone = SpectralFluxVad(), SpectralFluxVad()
+
+    for a, b in zip(_frames(quiet, "a"), _frames(loud, "b"), strict=True):
+        probs = together.process([a, b])
+        assert probs[0] == alone.process([a])[0]
+    assert probs[0] < 0.1 < probs[1]
+
+
+def test_config_selects_the_backend():
+    config = Config()
+    assert isinstance(vad_backend(config.vad), SileroVadEngine)
+    config.vad.backend = "spectral"
+    assert isinstance(vad_backend(config.vad), SpectralFluxVad)
+
+
+def test_detector_falls_back_when_silero_cannot_load(monkeypatch):
+    def no_network(_path):
+        raise ConnectionError("no route to github")
+
+    monkeypatch.setattr(vad_module, "_open_session", no_network)
+    detector = Detector(Config(), queue.Queue(), queue.Queue(), lambda _d: None)
+
+    detector.prewarm()
+
+    assert isinstance(detector.vad, SpectralFluxVad)
+    detector.process_frames(_frames(np.zeros(512, dtype=np.int16)))
@@ -4,8 +4,15 @@ import numpy as np
 import pytest
 
 from scriba.config import Config
-from scriba.messages import AudioChunk, Transcript
-from scriba.stt.streaming import StreamingSession, local_agreement_prefix, partial_text
+from scriba.messages import AudioChunk, Transcript, WordTiming
+from scriba.stt.features import MelFeatureCache
+from scriba.stt.streaming import (
+    StreamingSession,
+    _buffer_sample,
+    coalesce_chunks,
+    local_agreement_prefix,
+    partial_text,
+)
 
 
 class _FakeBackend:
@@ -25,7 +32,7 @@ class _FakeBackend:
     def descriptor(self) -> str:
         return "fake/int8/cpu"
 
-    def transcribe(self, pcm, language, hotwords=None, initial_prompt=None):
+    def transcribe(self, pcm, language, hotwords=None, initial_prompt=None, final=False):
         index = min(len(self.calls), len(self.texts) - 1)
         self.calls.append(
             {
@@ -33,6 +40,7 @@ class _FakeBackend:
                 "language": language,
                 "hotwords": hotwords,
                 "initial_prompt": initial_prompt,
+                "final": final,
             }
         )
         return Transcript(
@@ -44,7 +52,50 @@ class _FakeBackend:
         )
 
 
-def _chunk(utterance_id, t, pcm=None, is_final=False, language=None):
+class _BlockBackend:
+    """Word-timestamping test double: every 0.5 s block of constant samples `v`
+    "is" the word `w<v>`, so the text tracks exactly which audio was decoded."""
+
+    BLOCK = 8000
+
+    def __init__(self, garble_timestamps=False):
+        self.calls: list[dict] = []
+        self.garble_timestamps = garble_timestamps
+
+    @property
+    def descriptor(self) -> str:
+        return "blocks/int8/cpu"
+
+    def transcribe(
+        self, pcm, language, hotwords=None, initial_prompt=None, word_timestamps=False, final=False
+    ):
+        self.calls.append(
+            {"pcm_len": int(pcm.size), "initial_prompt": initial_prompt, "words": word_timestamps}
+        )
+        words = []
+        for start in range(0, pcm.size, self.BLOCK):
+            block = pcm[start : start + self.BLOCK]
+            if block.size and block[0] != 0:
+                words.append(
+                    WordTiming(f"w{block[0]}", start / 16000, (start + block.size) / 16000)
+                )
+        return Transcript(
+            text=" ".join(w.word for w in words),
+            avg_logprob=-0.2,
+            no_speech_prob=0.05,
+            duration_s=pcm.size / 16000,
+            language=language or "en",
+            words=words[:-1] if self.garble_timestamps else words,
+        )
+
+
+def _block(value):
+    return np.full(_BlockBackend.BLOCK, value, dtype=np.int16)
+
+
+def _chunk(
+    utterance_id, t, pcm=None, is_final=False, language=None, tentative_end=False, probs=None
+):
     return AudioChunk(
         utterance_id=utterance_id,
         device_id="mic0",
@@ -52,6 +103,8 @@ def _chunk(utterance_id, t, pcm=None, is_final=False, language=None):
         t_monotonic=t,
         is_final=is_final,
         language=language,
+        tentative_end=tentative_end,
+        vad_probs=None if probs is None else np.asarray(probs, dtype=np.float32),
     )
 
 
@@ -111,6 +164,86 @@ def test_partial_text_unknown_policy_raises():
         partial_text("bogus", [], [])
 
 
+# --- coalesce_chunks (drain-and-coalesce in the STT worker) ---
+
+
+def test_coalesce_merges_same_utterance_run():
+    chunks = [
+        _chunk(1, 0.1, np.full(3, 1, dtype=np.int16), language="en"),
+        _chunk(1, 0.2, np.full(2, 2, dtype=np.int16)),
+        _chunk(1, 0.3, np.full(1, 3, dtype=np.int16)),
+    ]
+
+    (merged,) = coalesce_chunks(chunks)
+
+    assert merged.pcm.tolist() == [1, 1, 1, 2, 2, 3]
+    assert merged.t_monotonic == 0.3
+    assert merged.language == "en"
+    assert merged.is_final is False
+
+
+def test_coalesce_keeps_final_flag_and_utterance_order():
+    chunks = [
+        _chunk(1, 0.1, _pcm(10)),
+        _chunk(1, 0.2, None, is_final=True),
+        _chunk(2, 0.3, _pcm(20)),
+        _chunk(2, 0.4, _pcm(5)),
+    ]
+
+    merged = coalesce_chunks(chunks)
+
+    assert [(c.utterance_id, c.is_final) for c in merged] == [(1, True), (2, False)]
+    assert merged[0].pcm.size == 10
+    assert merged[1].pcm.size == 25
+
+
+def test_coalesce_tentative_end_only_if_every_chunk_had_it():
+    resumed = coalesce_chunks([_chunk(1, 0.1, _pcm(), tentative_end=True), _chunk(1, 0.2, _pcm())])
+    silent = coalesce_chunks(
+        [_chunk(1, 0.1, _pcm(), tentative_end=True), _chunk(1, 0.2, _pcm(), tentative_end=True)]
+    )
+    assert resumed[0].tentative_end is False
+    assert silent[0].tentative_end is True
+
+
+def test_coalesce_concatenates_vad_probs_while_they_line_up():
+    preroll_and_frames = _chunk(1, 0.1, _pcm(300 + 2 * 512), probs=[0.9, 0.8])
+    frame = _chunk(1, 0.2, _pcm(512), probs=[0.1])
+    (merged,) = coalesce_chunks([preroll_and_frames, frame])
+    (unscored,) = coalesce_chunks([frame, _chunk(1, 0.3, _pcm(512))])
+    (misaligned,) = coalesce_chunks([frame, preroll_and_frames])
+
+    assert merged.vad_probs.tolist() == pytest.approx([0.9, 0.8, 0.1])
+    assert unscored.vad_probs is None
+    assert misaligned.vad_probs is None
+
+
+def test_coalesce_single_chunk_passes_through_unchanged():
+    chunk = _chunk(3, 0.1, None, is_final=True)
+    assert coalesce_chunks([chunk]) == [chunk]
+    assert coalesce_chunks([]) == []
+
+
+def test_coalesced_backlog_runs_one_partial_then_final():
+    config = Config()
+    config.streaming.interval_ms = 100
+    backend = _FakeBackend(["one", "one two"])
+    results: list[Transcript] = []
+    session = StreamingSession(backend, config, results.append)
+
+    session.feed(_chunk(4, 0.0, _pcm(), language="en"))
+    backlog = [_chunk(4, 0.1 * i, _pcm()) for i in range(1, 11)]
+    for chunk in coalesce_chunks(backlog):
+        session.feed(chunk)
+    assert len(backend.calls) == 1  # ten queued chunks, one partial pass
+    assert backend.calls[0]["pcm_len"] == 11 * 1600
+
+    for chunk in coalesce_chunks([_chunk(4, 1.1, _pcm()), _chunk(4, 1.2, None, is_final=True)]):
+        session.feed(chunk)
+    assert len(backend.calls) == 2  # straight to the final pass, no partial first
+    assert results[-1].is_partial is False
+
+
 # --- StreamingSession ---
 
 
@@ -203,6 +336,23 @@ def test_streaming_stable_only_types_committed_prefix():
     assert partials[1].text == "hello there"  # agreement between pass 0 and pass 1
 
 
+def test_only_the_final_pass_is_marked_final_for_the_backend():
+    config = Config()
+    config.streaming.interval_ms = 500
+    backend = _FakeBackend(["hello", "hello there"])
+    session = StreamingSession(backend, config, lambda transcript: None)
+
+    t = 0.0
+    session.feed(_chunk(4, t, _pcm(), language="en"))
+    for _ in range(6):
+        t += 0.1
+        session.feed(_chunk(4, t, _pcm()))
+    session.feed(_chunk(4, t + 0.1, None, is_final=True))
+
+    assert [call["final"] for call in backend.calls] == [False] * (len(backend.calls) - 1) + [True]
+    assert len(backend.calls) >= 2
+
+
 def test_streaming_window_management_trims_and_carries_prefix():
     config = Config()
     config.streaming.enabled = True
@@ -230,6 +380,98 @@ def test_streaming_window_management_trims_and_carries_prefix():
     assert partials[-1].text == "hello world continues nicely"
 
 
+def test_streaming_trim_committed_decodes_only_uncommitted_tail():
+    config = Config()
+    config.streaming.policy = "eager"
+    config.streaming.interval_ms = 100
+    config.streaming.trim_committed = True
+    backend = _BlockBackend()
+    results: list[Transcript] = []
+    session = StreamingSession(backend, config, results.append)
+
+    for i in range(1, 7):
+        session.feed(_chunk(4, i * 0.5, _block(i), language="en"))
+    session.feed(_chunk(4, 3.5, None, is_final=True))
+
+    # pass 1 (w1 w2) has nothing to agree with; pass 2 (w1 w2 w3) commits
+    # and trims w1 w2; every later pass decodes just the previous tail word
+    # plus the new block, so decoded audio stays <= 3 blocks instead of
+    # growing to 6.
+    assert all(call["words"] for call in backend.calls[:-1])
+    assert backend.calls[-1]["words"] is False  # the final pass needs no alignment
+    assert [call["pcm_len"] // _BlockBackend.BLOCK for call in backend.calls] == [2, 3, 2, 2, 2, 1]
+    assert backend.calls[-1]["initial_prompt"] == "w1 w2 w3 w4 w5"
+
+    partials = [r.text for r in results if r.is_partial]
+    assert partials[-1] == "w1 w2 w3 w4 w5 w6"
+    assert results[-1].is_partial is False
+    assert results[-1].text == "w1 w2 w3 w4 w5 w6"
+
+
+def test_streaming_trim_committed_skips_misaligned_word_timestamps():
+    config = Config()
+    config.streaming.interval_ms = 100
+    config.streaming.trim_committed = True
+    backend = _BlockBackend(garble_timestamps=True)
+    session = StreamingSession(backend, config, lambda _t: None)
+
+    for i in range(1, 5):
+        session.feed(_chunk(5, i * 0.5, _block(i), language="en"))
+
+    assert session._buffer.size == 4 * _BlockBackend.BLOCK
+    assert session._prefix_text == ""
+
+
+class _SlowBackend(_FakeBackend):
+    """Charges `rtf` x decoded audio to a shared fake clock per decode."""
+
+    def __init__(self, clock: list[float], rtf: float):
+        super().__init__(["slow words"])
+        self.clock = clock
+        self.rtf = rtf
+
+    def transcribe(self, pcm, language, hotwords=None, initial_prompt=None, final=False):
+        self.clock[0] += self.rtf * pcm.size / 16000
+        return super().transcribe(pcm, language, hotwords, initial_prompt, final)
+
+
+def _run_slow_utterance(adaptive: bool) -> tuple[StreamingSession, _SlowBackend, list[float]]:
+    config = Config()
+    config.streaming.interval_ms = 500
+    config.streaming.adaptive = adaptive
+    clock = [0.0]
+    backend = _SlowBackend(clock, rtf=0.3)
+    final_at: list[float] = []
+    session = StreamingSession(
+        backend,
+        config,
+        lambda tr: None if tr.is_partial else final_at.append(clock[0]),
+        clock=lambda: clock[0],
+    )
+    # The STT worker can only pick a chunk up once it exists and the
+    # previous decode has finished -- model that on the fake clock.
+    for i in range(100):  # 10 s of audio in 100 ms chunks
+        t = i * 0.1
+        clock[0] = max(clock[0], t)
+        session.feed(_chunk(6, t, _pcm(), language="en"))
+    clock[0] = max(clock[0], 10.0)
+    session.feed(_chunk(6, 10.0, None, is_final=True))
+    return session, backend, final_at
+
+
+def test_adaptive_cadence_keeps_slow_backend_from_falling_behind():
+    fixed_session, fixed_backend, fixed_final = _run_slow_utterance(adaptive=False)
+    session, backend, final_at = _run_slow_utterance(adaptive=True)
+
+    assert len(backend.calls) < len(fixed_backend.calls)
+    assert session.cadence.effective_cadence_ms > 500
+    # the final pass runs as soon as the final chunk arrives: 10 s of audio
+    # at RTF 0.3 -> done 3 s after the endpoint, vs. queued behind the
+    # backlog at the fixed cadence
+    assert final_at[0] <= 10.0 + 0.3 * 10.0 + 0.5
+    assert final_at[0] < fixed_final[0]
+
+
 def test_streaming_emits_to_queue_sink():
     config = Config()
     config.streaming.enabled = False
@@ -269,3 +511,289 @@ def test_streaming_session_reusable_after_final():
 
     assert [r.utterance_id for r in results] == [1, 2]
     assert [r.text for r in results] == ["first", "second"]
+
+
+# --- speculative final (stt.speculative_final) ---
+
+
+def _speculative_session(texts, after_ms=64):
+    config = Config()
+    config.streaming.interval_ms = 100
+    config.stt.speculative_after_ms = after_ms
+    backend = _FakeBackend(texts)
+    results: list[Transcript] = []
+    return StreamingSession(backend, config, results.append), backend, results
+
+
+def _frame():
+    return _pcm(512)  # 32 ms
+
+
+def test_speculative_final_hit_emits_held_result_without_second_decode():
+    session, backend, results = _speculative_session(["partial", "final text"])
+    session.feed(_chunk(1, 0.0, _pcm(), language="en"))
+    session.feed(_chunk(1, 0.2, _pcm()))  # one partial pass
+    assert len(backend.calls) == 1
+
+    t = 0.2
+    for _ in range(10):  # endpoint silence: speculates at 64 ms, nothing after
+        t += 0.032
+        session.feed(_chunk(1, t, _frame(), tentative_end=True))
+    assert len(backend.calls) == 2
+    assert len(results) == 1  # the speculative result is held, not emitted yet
+
+    session.feed(_chunk(1, t, None, is_final=True, tentative_end=True))
+
+    assert len(backend.calls) == 2
+    assert [(r.text, r.is_partial) for r in results] == [("partial", True), ("final text", False)]
+    assert session.speculation.hits == 1
+    assert session.speculation.misses == 0
+
+
+def test_speculative_final_waits_for_after_ms_of_silence():
+    session, backend, _results = _speculative_session(["final"], after_ms=160)
+    session._config.streaming.enabled = False  # the speculative pass is the only one
+    session.feed(_chunk(1, 0.0, _pcm(), language="en"))
+    calls = len(backend.calls)
+
+    t = 0.0
+    for _ in range(4):  # 128 ms of silence: too short to speculate
+        t += 0.032
+        session.feed(_chunk(1, t, _frame(), tentative_end=True))
+    assert len(backend.calls) == calls
+    session.feed(_chunk(1, t + 0.032, _frame(), tentative_end=True))  # 160 ms
+    assert len(backend.calls) == calls + 1
+
+
+def test_speculative_final_miss_drops_result_when_speech_resumes():
+    session, backend, results = _speculative_session(["early", "late final"], after_ms=0)
+    session.feed(_chunk(1, 0.0, _pcm(), language="en", tentative_end=False))
+    session.feed(_chunk(1, 0.032, _frame(), tentative_end=True))  # speculates immediately
+    speculative_calls = len(backend.calls)
+
+    session.feed(_chunk(1, 0.064, _frame()))  # speech resumed
+    session.feed(_chunk(1, 0.1, None, is_final=True))
+
+    assert len(backend.calls) == speculative_calls + 1  # re-decoded with the resumed audio
+    assert backend.calls[-1]["pcm_len"] == 1600 + 2 * 512
+    assert results[-1].is_partial is False
+    assert session.speculation.misses == 1
+    assert session.speculation.hits == 0
+
+
+def test_speculative_final_off_decodes_after_endpoint():
+    session, backend, results = _speculative_session(["final"], after_ms=0)
+    session._config.streaming.enabled = False
+    session._config.stt.speculative_final = False
+    session.feed(_chunk(1, 0.0, _pcm(), language="en"))
+    for i in range(1, 5):
+        session.feed(_chunk(1, 0.032 * i, _frame(), tentative_end=True))
+    assert backend.calls == []
+
+    session.feed(_chunk(1, 0.2, None, is_final=True, tentative_end=True))
+    assert len(backend.calls) == 1
+    assert results[0].is_partial is False
+
+
+def test_on_text_sees_partial_and_speculative_passes_but_not_the_final():
+    config = Config()
+    config.streaming.interval_ms = 100
+    config.stt.speculative_after_ms = 0
+    backend = _FakeBackend(["one", "one two.", "one two three"])
+    seen: list[tuple[int, str]] = []
+    session = StreamingSession(
+        backend, config, lambda _t: None, on_text=lambda uid, text: seen.append((uid, text))
+    )
+
+    session.feed(_chunk(7, 0.0, _pcm(), language="en"))
+    session.feed(_chunk(7, 0.2, _pcm()))  # partial
+    session.feed(_chunk(7, 0.232, _frame(), tentative_end=True))  # speculative final
+    session.feed(_chunk(7, 0.264, _frame()))  # speech resumed
+    session.feed(_chunk(7, 0.3, None, is_final=True))  # real final
+
+    assert len(backend.calls) == 3
+    assert seen == [(7, "one"), (7, "one two.")]
+
+
+# --- two-model cascade (streaming.partial_model) ---
+
+
+def test_partial_backend_runs_partials_and_main_backend_runs_finals():
+    config = Config()
+    config.streaming.interval_ms = 100
+    config.stt.speculative_after_ms = 0
+    small = _FakeBackend(["won", "won too"])
+    large = _FakeBackend(["one two three"])
+    results: list[Transcript] = []
+    session = StreamingSession(large, config, results.append, partial_backend=small)
+
+    session.feed(_chunk(1, 0.0, _pcm(), language="en"))
+    session.feed(_chunk(1, 0.2, _pcm()))
+    session.feed(_chunk(1, 0.4, _pcm()))
+    session.feed(_chunk(1, 0.432, _frame(), tentative_end=True))  # speculative final
+    session.feed(_chunk(1, 0.5, None, is_final=True, tentative_end=True))
+
+    assert len(small.calls) == 2
+    assert len(large.calls) == 1
+    assert [(r.text, r.is_partial) for r in results] == [
+        ("won", True),
+        ("won too", True),
+        ("one two three", False),
+    ]
+
+
+def test_partial_backend_disables_committed_audio_trimming():
+    config = Config()
+    config.streaming.interval_ms = 100
+    config.streaming.trim_committed = True
+    small = _BlockBackend()
+    large = _BlockBackend()
+    session = StreamingSession(large, config, lambda _t: None, partial_backend=small)
+
+    for i in range(1, 5):
+        session.feed(_chunk(4, i * 0.5, _block(i), language="en"))
+    session.feed(_chunk(4, 2.5, None, is_final=True))
+
+    assert not any(call["words"] for call in small.calls)
+    assert large.calls[-1]["pcm_len"] == 4 * _BlockBackend.BLOCK  # the whole utterance
+    assert large.calls[-1]["initial_prompt"] is None
+
+
+# --- silence trimming (stt.trim_silence) ---
+
+
+def _final_only_session(**stt):
+    config = Config()
+    config.streaming.enabled = False
+    config.stt.speculative_final = False
+    for key, value in stt.items():
+        setattr(config.stt, key, value)
+    backend = _FakeBackend(["hello"])
+    return StreamingSession(backend, config, lambda _t: None), backend
+
+
+def _feed_frames(session, utterance_id, probs, t=0.0, head=0):
+    """Confirming chunk (`head` unscored pre-roll samples + the first two
+    frames), then one 512-sample chunk per remaining probability."""
+    session.feed(_chunk(utterance_id, t, _pcm(head + 2 * 512), language="en", probs=probs[:2]))
+    for prob in probs[2:]:
+        t += 0.032
+        session.feed(_chunk(utterance_id, t, _pcm(512), probs=[prob]))
+    session.feed(_chunk(utterance_id, t + 0.032, None, is_final=True))
+
+
+def test_final_pass_skips_preroll_and_endpoint_silence_beyond_the_guard():
+    session, backend = _final_only_session(trim_guard_ms=200)
+
+    _feed_frames(session, 1, [0.9] * 12 + [0.1] * 20, head=6400)
+
+    guard = 3200
+    assert backend.calls[-1]["pcm_len"] == guard + 12 * 512 + guard
+    assert session.trim.buffered_s == pytest.approx((6400 + 32 * 512) / 16000)
+    assert session.trim.decoded_s == pytest.approx((2 * guard + 12 * 512) / 16000)
+
+
+def test_trim_silence_off_decodes_the_whole_buffer():
+    session, backend = _final_only_session(trim_silence=False)
+
+    _feed_frames(session, 1, [0.9] * 12 + [0.1] * 20, head=6400)
+
+    assert backend.calls[-1]["pcm_len"] == 6400 + 32 * 512
+
+
+def test_unscored_audio_is_never_trimmed():
+    session, backend = _final_only_session()
+
+    session.feed(_chunk(1, 0.0, _pcm(8000), language="en"))
+    session.feed(_chunk(1, 0.5, None, is_final=True))
+
+    assert backend.calls[-1]["pcm_len"] == 8000
+
+
+def test_max_pause_ms_collapses_long_internal_pauses():
+    probs = [0.9] * 2 + [0.1] * 40 + [0.9] * 5 + [0.1] * 10
+    kept, kept_backend = _final_only_session(max_pause_ms=0)
+    collapsed, collapsed_backend = _final_only_session(max_pause_ms=300)
+
+    _feed_frames(kept, 1, probs)
+    _feed_frames(collapsed, 1, probs)
+
+    # speech [0, 1024) and [21504, 24064); 200 ms guard after the end
+    assert kept_backend.calls[-1]["pcm_len"] == 24064 + 3200
+    # the 20480-sample pause shrinks to 300 ms = 4800 samples
+    assert collapsed_backend.calls[-1]["pcm_len"] == 24064 + 3200 - (20480 - 4800)
+
+
+def test_buffer_sample_maps_decoded_time_back_through_the_cuts():
+    ranges = [(1000, 3000), (10000, 12000)]
+
+    assert _buffer_sample(0.0, ranges) == 1000
+    assert _buffer_sample(1500 / 16000, ranges) == 2500
+    assert _buffer_sample(2500 / 16000, ranges) == 10500
+    assert _buffer_sample(10.0, ranges) == 12000
+
+
+# --- log-mel feature cache (streaming.feature_cache) ---
+
+
+class _FeatureBackend(_FakeBackend):
+    """Records the `features` each pass gets; offers a `MelFeatureCache`."""
+
+    def __init__(self, texts):
+        super().__init__(texts)
+        self.features: list = []
+        self.caches: list[MelFeatureCache] = []
+
+    def feature_cache(self):
+        self.caches.append(MelFeatureCache(np.ones((80, 201), dtype=np.float32)))
+        return self.caches[-1]
+
+    def transcribe(self, pcm, language, hotwords=None, initial_prompt=None, final=False, **extra):
+        self.features.append(extra.get("features"))
+        return super().transcribe(pcm, language, hotwords, initial_prompt, final)
+
+
+def test_passes_get_features_for_exactly_the_audio_they_decode():
+    config = Config()
+    config.streaming.interval_ms = 100
+    backend = _FeatureBackend(["hello", "hello there"])
+    session = StreamingSession(backend, config, lambda _t: None)
+
+    for i in range(4):
+        session.feed(_chunk(1, i * 0.1, _pcm(1600), language="en"))
+    session.feed(_chunk(1, 0.5, None, is_final=True))
+
+    assert len(backend.caches) == 1
+    assert len(backend.features) >= 2
+    for call, features in zip(backend.calls, backend.features, strict=True):
+        assert features.shape == (80, call["pcm_len"] // 160 + 1)
+
+
+def test_window_drops_are_hop_aligned_while_features_are_cached():
+    config = Config()
+    config.streaming.interval_ms = 100
+    config.streaming.window_s = 1
+    backend = _FeatureBackend(["hello"])
+    session = StreamingSession(backend, config, lambda _t: None)
+
+    for i in range(12):
+        session.feed(_chunk(1, i * 0.1, _pcm(1500), language="en"))
+
+    # 18000 samples fed: the 2000 over the window are dropped as 2080 (13 hops)
+    assert backend.calls[-1]["pcm_len"] == 18000 - 2080
+    assert backend.caches[0].stable_frames > 0
+
+
+def test_feature_cache_off_passes_no_features():
+    config = Config()
+    config.streaming.interval_ms = 100
+    config.streaming.feature_cache = False
+    backend = _FeatureBackend(["hello"])
+    session = StreamingSession(backend, config, lambda _t: None)
+
+    session.feed(_chunk(1, 0.0, _pcm(1600), language="en"))
+    session.feed(_chunk(1, 0.2, _pcm(1600)))
+    session.feed(_chunk(1, 0.3, None, is_final=True))
+
+    assert backend.caches == []
+    assert backend.features and all(f is None for f in backend.features)
@@ -0,0 +1,106 @@
+"""Latency trace ring and its Chrome trace export (scriba/trace.py), plus the
+segmenter and streaming session recording into the process-wide ring."""
+
+import json
+import threading
+import time
+
+import numpy as np
+
+from scriba.config import Config, VadConfig
+from scriba.detect.vad import UtteranceSegmenter
+from scriba.messages import AudioChunk, Transcript
+from scriba.stt.streaming import StreamingSession
+from scriba.trace import TRACE, TraceRing, export_chrome_trace
+
+
+def test_ring_is_bounded_and_keeps_the_newest_events():
+    ring = TraceRing(capacity=3)
+    for i in range(5):
+        ring.record("e", i, float(i))
+    assert [e[1] for e in ring.events()] == [2, 3, 4]
+
+
+def test_span_times_the_block_and_takes_late_args():
+    ring = TraceRing()
+    with ring.span("work", 7, kind="partial") as args:
+        time.sleep(0.01)
+        args["chars"] = 12
+    ((name, utterance_id, start, end, thread_id, recorded),) = ring.events()
+    assert (name, utterance_id, thread_id) == ("work", 7, threading.get_ident())
+    assert end - start >= 0.009
+    assert recorded == {"kind": "partial", "chars": 12}
+
+
+def test_monotonic_timestamps_land_on_the_perf_counter_timebase():
+    ring = TraceRing()
+    ring.record_monotonic("now", 1, time.monotonic())
+    assert abs(ring.events()[0][2] - time.perf_counter()) < 0.05
+
+
+def test_chrome_trace_has_thread_tracks_events_and_one_async_span_per_utterance(tmp_path):
+    ring = TraceRing()
+    ring.record("speech", 1, 10.0, 10.25)
+    ring.record("endpoint", 1, 11.0)
+
+    def other_thread():
+        ring.record("decode", 1, 11.1, 11.5, kind="final")
+
+    worker = threading.Thread(target=other_thread, name="stt")
+    worker.start()
+    worker.join()
+
+    path = tmp_path / "trace.json"
+    assert export_chrome_trace(path, ring) == 3
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+
+    thread_names = {e["args"]["name"] for e in events if e["name"] == "thread_name"}
+    assert "stt" in thread_names
+    by_name = {e["name"]: e for e in events}
+    assert by_name["speech"]["ph"] == "X"
+    assert (by_name["speech"]["ts"], by_name["speech"]["dur"]) == (0.0, 250000.0)
+    assert by_name["endpoint"]["ph"] == "i" and by_name["endpoint"]["ts"] == 1e6
+    assert by_name["decode"]["args"] == {"utterance": 1, "kind": "final"}
+    spans = [e for e in events if e.get("cat") == "utterance"]
+    assert [(e["ph"], e["id"], e["ts"]) for e in spans] == [("b", 1, 0.0), ("e", 1, 1.5e6)]
+
+
+def test_segmenter_records_speech_start_to_confirm_and_the_endpoint():
+    TRACE.clear()
+    config = VadConfig(threshold=0.5, endpoint_silence_ms=96, min_speech_ms=96, pre_roll_ms=0)
+    segmenter = UtteranceSegmenter(config, lambda _d: None)
+    frame_s = 512 / 16_000
+    t0 = time.monotonic()
+    for i, prob in enumerate([0.9] * 5 + [0.1] * 4):
+        segmenter.process_frame("mic", np.zeros(512, dtype=np.int16), prob, t0 + i * frame_s)
+
+    events = {e[0]: e for e in TRACE.events()}
+    speech, endpoint = events["speech"], events["endpoint"]
+    assert speech[1] == endpoint[1] == 1
+    assert abs((speech[3] - speech[2]) - 2 * frame_s) < 1e-6  # trigger frame -> confirm frame
+    assert endpoint[3] is None and endpoint[5] == {"cause": "vad"}
+
+
+def test_streaming_session_records_each_decode_pass():
+    class _Backend:
+        descriptor = "fake/int8/cpu"
+
+        def transcribe(self, pcm, language, hotwords=None, initial_prompt=None, final=False):
+            return Transcript(
+                "hi", avg_logprob=-0.1, no_speech_prob=0.0, duration_s=0.0, language="en"
+            )
+
+    TRACE.clear()
+    config = Config()
+    config.streaming.interval_ms = 100
+    config.streaming.adaptive = False
+    config.stt.speculative_final = False
+    session = StreamingSession(_Backend(), config, emit=lambda _t: None)
+    pcm = np.ones(3200, dtype=np.int16)
+    session.feed(AudioChunk(4, "mic", pcm, 0.0))
+    session.feed(AudioChunk(4, "mic", pcm, 0.2))
+    session.feed(AudioChunk(4, "mic", None, 0.3, is_final=True))
+
+    decodes = [e for e in TRACE.events() if e[0] == "decode"]
+    assert [e[5]["kind"] for e in decodes][-1] == "final"
+    assert all(e[1] == 4 for e in decodes) and len(decodes) >= 2
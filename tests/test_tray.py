@@ -114,6 +114,16 @@ def test_quit_action_emits_quit_requested(tray):
     assert seen == [True]
 
 
+def test_export_trace_action_emits_trace_export_requested(tray):
+    seen = []
+    tray.trace_export_requested.connect(lambda: seen.append(True))
+
+    action = next(a for a in tray._menu.actions() if a.text() == "Export latency trace")
+    action.trigger()
+
+    assert seen == [True]
+
+
 def test_set_enabled_checked_does_not_reemit_signal(tray):
     seen = []
     tray.enabled_changed.connect(seen.append)
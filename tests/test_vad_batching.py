@@ -0,0 +1,270 @@
+"""Batched multi-device VAD (`SileroVadEngine`) and the detector's batching,
+against a fake ONNX session -- no model download. The fake's "model" makes
+each row's output depend only on that row's own state and input, so any
+cross-device mixing of state or context shows up as a wrong number.
+"""
+
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from scriba.config import Config
+from scriba.detect import vad as vad_module
+from scriba.detect.vad import (
+    Detector,
+    PerDeviceVad,
+    SileroVadEngine,
+    _one_frame_per_device,
+)
+from scriba.messages import AudioFrame
+
+
+class _FakeSession:
+    """state' = state + 1 (so state counts frames seen); prob = first state
+    value / 100 + mean of the row's 64-sample context."""
+
+    def __init__(self):
+        self.batch_sizes: list[int] = []
+        self.inputs: list[np.ndarray] = []
+
+    def run(self, _outputs, feeds):
+        x, state = feeds["input"], feeds["state"]
+        assert x.shape == (state.shape[1], 576)
+        assert state.shape[0] == 2 and state.shape[2] == 128
+        self.batch_sizes.append(x.shape[0])
+        self.inputs.append(x.copy())
+        out = state[0, :, 0:1] / 100 + x[:, :64].mean(axis=1, keepdims=True)
+        return out, state + 1
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full(512, value, dtype=np.int16)
+
+
+def _af(device_id: str, t: float = 0.0, pcm: np.ndarray | None = None) -> AudioFrame:
+    return AudioFrame(device_id, _frame(0) if pcm is None else pcm, t)
+
+
+def test_engine_batches_devices_into_one_run_with_independent_state():
+    session = _FakeSession()
+    engine = SileroVadEngine(session=session)
+
+    engine.process([_af("a"), _af("b")])
+    engine.process([_af("a")])
+    probs = engine.process([_af("b"), _af("a")])
+
+    assert session.batch_sizes == [2, 1, 2]
+    # b has seen 1 frame before this call, a has seen 2
+    assert probs == pytest.approx([0.01, 0.02])
+
+
+def test_engine_carries_each_devices_context():
+    session = _FakeSession()
+    engine = SileroVadEngine(session=session)
+
+    engine.process([_af("a", pcm=_frame(16384)), _af("b", pcm=_frame(-16384))])
+    engine.process([_af("b"), _af("a")])
+
+    x = session.inputs[-1]
+    assert np.allclose(x[0, :64], -0.5)  # b's row starts with b's previous tail
+    assert np.allclose(x[1, :64], 0.5)
+    assert np.allclose(session.inputs[0][:, :64], 0.0)  # fresh devices start silent
+
+
+def test_engine_skip_advances_the_context_but_not_the_state():
+    session = _FakeSession()
+    engine = SileroVadEngine(session=session)
+    engine.process([_af("a")])
+
+    engine.skip([_af("a", pcm=_frame(16384))])
+    probs = engine.process([_af("a")])
+
+    assert len(session.batch_sizes) == 2  # the skipped frame never reached the model
+    assert np.allclose(session.inputs[-1][0, :64], 0.5)  # ...but its tail is the context
+    assert probs == pytest.approx([0.01 + 0.5])  # state has seen one frame, not two
+
+
+def test_detector_energy_gate_skips_idle_noise_but_not_speech():
+    session = _FakeSession()
+    detector = Detector(
+        Config(),
+        queue.Queue(),
+        queue.Queue(),
+        lambda _d: None,
+        vad=SileroVadEngine(session=session),
+    )
+    rng = np.random.default_rng(0)
+    for i in range(200):  # ~6 s of a quiet room
+        pcm = rng.normal(0, 30, 512).astype(np.int16)
+        detector.process_frames([_af("a", i * 0.032, pcm)])
+    gated = detector.gated_frames
+    assert 150 < gated <= 200 - 31  # everything after the calibration second, give or take
+    assert sum(session.batch_sizes) == 200 - gated
+
+    detector.process_frames([_af("a", 7.0, _frame(3000))])  # a word starts
+    for i in range(10):  # and trails off back into the room: still scored
+        pcm = rng.normal(0, 30, 512).astype(np.int16)
+        detector.process_frames([_af("a", 7.0 + i * 0.032, pcm)])
+    assert detector.gated_frames == gated
+
+
+def test_engine_reset_clears_only_that_device():
+    session = _FakeSession()
+    engine = SileroVadEngine(session=session)
+    engine.process([_af("a"), _af("b")])
+
+    engine.reset("a")
+    probs = engine.process([_af("a"), _af("b")])
+
+    assert probs == pytest.approx([0.0, 0.01])
+
+
+def test_engine_rejects_wrong_frame_size():
+    engine = SileroVadEngine(session=_FakeSession())
+    with pytest.raises(ValueError):
+        engine.process([_af("a", pcm=np.zeros(511, dtype=np.int16))])
+
+
+def test_engine_construction_is_lazy():
+    engine = SileroVadEngine()  # no session, no download until first use
+    assert engine._session is None
+
+
+def test_audio_frame_carries_float32_samples_rms_and_peak():
+    frame = AudioFrame("a", np.array([0, 16384, -32768, 16384], dtype=np.int16), 0.0)
+
+    assert frame.samples.dtype == np.float32
+    assert frame.samples.tolist() == [0.0, 0.5, -1.0, 0.5]
+    assert frame.rms == pytest.approx(np.sqrt((0.25 + 1.0 + 0.25) / 4))
+    assert frame.peak == 1.0
+
+
+def test_one_frame_per_device_splits_on_repeat_preserving_order():
+    frames = [_af("a"), _af("b"), _af("a"), _af("c"), _af("b"), _af("b")]
+
+    batches = _one_frame_per_device(frames)
+
+    assert [[f.device_id for f in batch] for batch in batches] == [
+        ["a", "b"],
+        ["a", "c", "b"],
+        ["b"],
+    ]
+
+
+def test_detector_run_scores_queued_devices_in_batches():
+    session = _FakeSession()
+    frame_queue: queue.Queue = queue.Queue()
+    for i in range(3):
+        for device_id in ("a", "b", "c"):
+            frame_queue.put(_af(device_id, i * 0.032))
+    detector = Detector(
+        Config(),
+        frame_queue,
+        queue.Queue(),
+        lambda _d: None,
+        vad=SileroVadEngine(session=session),
+    )
+
+    class _StopWhenDrained:
+        def is_set(self):
+            return frame_queue.empty() and bool(session.batch_sizes)
+
+    detector.run(_StopWhenDrained())
+
+    assert session.batch_sizes == [3, 3, 3]
+
+
+def test_per_device_vad_builds_one_instance_per_device_lazily():
+    built = []
+
+    class _Stub:
+        def __init__(self):
+            built.append(self)
+            self.calls = 0
+
+        def reset(self):
+            self.calls = 0
+
+        def process_frame(self, pcm):
+            self.calls += 1
+            return float(self.calls)
+
+    vad = PerDeviceVad(_Stub)
+    assert vad.process([_af("a"), _af("b")]) == [1.0, 1.0]
+    assert vad.process([_af("a")]) == [2.0]
+    vad.reset("a")
+    assert vad.process([_af("a"), _af("b")]) == [1.0, 2.0]
+    assert len(built) == 2
+
+
+# --- prewarm: session + batch widths built off the detector thread --------
+
+
+def test_prewarm_runs_each_new_batch_width_once_without_touching_state():
+    session = _FakeSession()
+    engine = SileroVadEngine(session=session)
+
+    engine.prewarm(2)
+    engine.prewarm(3)
+    engine.prewarm(1)
+
+    assert session.batch_sizes == [1, 2, 3]
+    assert engine.process([_af("a")]) == pytest.approx([0.0])  # state still fresh
+
+
+def test_detector_on_device_opened_widens_prewarm_to_open_device_count():
+    session = _FakeSession()
+    detector = Detector(
+        Config(),
+        queue.Queue(),
+        queue.Queue(),
+        lambda _d: None,
+        vad=SileroVadEngine(session=session),
+    )
+
+    detector.prewarm()
+    detector.on_device_opened("a")
+    detector.on_device_opened("a")  # reopened after a replug: same width
+    detector.on_device_opened("b")
+
+    assert session.batch_sizes == [1, 2]
+
+
+def test_device_arrival_causes_no_frame_backlog(monkeypatch):
+    """Session creation is slow (~190 ms for the real model); once prewarmed,
+    a newly arriving device's frames are scored as fast as they come in."""
+    sessions = []
+
+    def slow_open_session(_model_path):
+        time.sleep(0.2)
+        sessions.append(_FakeSession())
+        return sessions[-1]
+
+    monkeypatch.setattr(vad_module, "_open_session", slow_open_session)
+    frame_queue: queue.Queue = queue.Queue()
+    detector = Detector(Config(), frame_queue, queue.Queue(), lambda _d: None)
+    detector.prewarm(1)  # startup (ScribaApp's provisioning thread)
+
+    stop = threading.Event()
+    thread = threading.Thread(target=detector.run, args=(stop,), daemon=True)
+    thread.start()
+    try:
+        detector.on_device_opened("hotplugged")  # AudioCapture's hook
+        backlog = []
+        for i in range(20):
+            frame_queue.put(_af("hotplugged", i * 0.032))
+            time.sleep(0.005)
+            backlog.append(frame_queue.qsize())
+        deadline = time.monotonic() + 1.0
+        while frame_queue.qsize() and time.monotonic() < deadline:
+            time.sleep(0.005)
+    finally:
+        stop.set()
+        thread.join(timeout=1.0)
+
+    assert len(sessions) == 1
+    assert max(backlog) <= 2
+    assert frame_queue.qsize() == 0
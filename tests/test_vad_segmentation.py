@@ -70,6 +70,30 @@ def test_start_end_timing_and_preroll_prepend():
     assert segmenter.is_idle
 
 
+def test_chunks_flag_tentative_end_during_endpoint_silence():
+    config = VadConfig(threshold=0.5, endpoint_silence_ms=160, min_speech_ms=96, pre_roll_ms=400)
+    segmenter = UtteranceSegmenter(config, get_preroll_stub)
+    # A 2-frame dip mid-utterance, then the real endpoint silence.
+    probs = [0.9] * 6 + [0.1] * 2 + [0.9] * 3 + [0.1] * 5
+    results = feed(segmenter, probs)
+
+    flags = [(i, c.tentative_end, c.is_final) for i, c in enumerate(results) if c is not None]
+    assert [i for i, tentative, _ in flags if tentative] == [6, 7, 11, 12, 13, 14, 15]
+    assert flags[-1] == (15, True, True)
+
+
+def test_chunks_carry_the_vad_probs_of_their_frames():
+    config = VadConfig(threshold=0.5, endpoint_silence_ms=160, min_speech_ms=96, pre_roll_ms=400)
+    segmenter = UtteranceSegmenter(config, get_preroll_stub)
+    probs = [0.1] * 2 + [0.6, 0.7, 0.8, 0.9] + [0.2] * 5
+    chunks = [c for c in feed(segmenter, probs) if c is not None]
+
+    # the confirming chunk: the three frames since the trigger, not the pre-roll
+    assert chunks[0].vad_probs.tolist() == pytest.approx([0.6, 0.7, 0.8])
+    assert chunks[0].vad_probs.size * FRAME_SAMPLES == chunks[0].pcm.size - len(PREROLL)
+    assert [c.vad_probs.tolist() for c in chunks[1:]] == [[pytest.approx(p)] for p in probs[5:]]
+
+
 def test_short_blip_below_min_speech_ms_is_silently_dropped():
     config = VadConfig(threshold=0.5, endpoint_silence_ms=160, min_speech_ms=96, pre_roll_ms=400)
     segmenter = UtteranceSegmenter(config, get_preroll_stub)
@@ -141,6 +165,80 @@ def test_max_utterance_s_hard_cap_when_speech_never_dips():
     assert not segmenter.is_idle  # still mid-utterance-2, no endpoint fed yet
 
 
+# --- force_endpoint: push-to-talk release --------------------------------
+
+
+def test_force_endpoint_emits_pure_finalize_marker_for_confirmed_utterance():
+    config = VadConfig(threshold=0.5, endpoint_silence_ms=600, min_speech_ms=64)
+    segmenter = UtteranceSegmenter(config, get_preroll_stub)
+    results = feed(segmenter, [0.9] * 6)
+    assert not any(c.is_final for c in results if c is not None)
+
+    final = segmenter.force_endpoint(1.0)
+
+    assert final is not None
+    assert final.is_final and final.pcm is None
+    assert final.utterance_id == results[-1].utterance_id
+    assert final.device_id == DEVICE
+    assert final.t_monotonic == 1.0
+    assert segmenter.is_idle
+
+
+def test_force_endpoint_discards_unconfirmed_candidate_and_is_noop_when_idle():
+    config = VadConfig(threshold=0.5, endpoint_silence_ms=600, min_speech_ms=320)
+    segmenter = UtteranceSegmenter(config, get_preroll_stub)
+    assert segmenter.force_endpoint(0.0) is None
+
+    feed(segmenter, [0.9] * 3)  # triggered, not yet min_speech_ms
+    assert segmenter.force_endpoint(0.1) is None
+    assert segmenter.is_idle
+
+    results = feed(segmenter, [0.9] * 12)  # the next utterance starts cleanly
+    assert {c.utterance_id for c in results if c is not None} == {1}
+
+
+def test_detector_force_endpoint_flushes_queued_frames_before_finalizing():
+    import queue
+    import threading
+
+    from scriba.config import Config
+    from scriba.detect.vad import Detector, PerDeviceVad
+    from scriba.messages import AudioFrame
+
+    class _LoudIsSpeech:
+        def reset(self):
+            pass
+
+        def process_frame(self, pcm):
+            return 0.9 if pcm[0] else 0.0
+
+    config = Config()
+    config.vad.min_speech_ms = 64
+    frame_queue: queue.Queue = queue.Queue()
+    chunk_queue: queue.Queue = queue.Queue()
+    detector = Detector(
+        config, frame_queue, chunk_queue, get_preroll_stub, vad=PerDeviceVad(_LoudIsSpeech)
+    )
+    for i in range(1, 11):  # still queued at key-up: the tail of what was said
+        frame_queue.put(AudioFrame(DEVICE, make_frame(i), i * 0.032))
+    detector.force_endpoint()
+    frame_queue.put(AudioFrame(DEVICE, make_frame(99), 1.0))  # captured after key-up
+
+    stop = threading.Event()
+    thread = threading.Thread(target=detector.run, args=(stop,), daemon=True)
+    thread.start()
+    chunks = []
+    while not chunks or not chunks[-1].is_final:
+        chunks.append(chunk_queue.get(timeout=2.0))
+    stop.set()
+    thread.join(timeout=1.0)
+
+    body = np.concatenate([c.pcm for c in chunks if c.pcm is not None])
+    assert body[-1] == 10  # every pre-key-up frame made it in, in order
+    assert chunks[-1].pcm is None
+    assert len({c.utterance_id for c in chunks}) == 1
+
+
 @pytest.mark.gpu
 def test_silero_vad_onnx_wrapper_smoke(tmp_path):
     """Downloads the real model and confirms the wrapper's shapes/API don't crash."""
@@ -157,3 +255,118 @@ def test_silero_vad_onnx_wrapper_smoke(tmp_path):
     vad.reset()
     prob_after_reset = vad.process_frame(silence)
     assert 0.0 <= prob_after_reset <= 1.0
+
+
+def test_detector_denoise_hands_the_segmenter_cleaned_audio():
+    import queue
+
+    from scriba.config import Config
+    from scriba.detect.vad import Detector, PerDeviceVad
+    from scriba.messages import AudioFrame
+
+    class _LoudIsSpeech:
+        def reset(self):
+            pass
+
+        def process_frame(self, pcm):
+            return 0.9 if np.abs(pcm).max() > 5000 else 0.0
+
+    rng = np.random.default_rng(0)
+    n_noise, n_speech = 40, 20
+    noise = rng.normal(0, 600, (n_noise + n_speech) * FRAME_SAMPLES)
+    t = np.arange(n_speech * FRAME_SAMPLES) / 16000
+    noise[n_noise * FRAME_SAMPLES :] += 9000 * np.sin(2 * np.pi * 300 * t)
+    pcm = noise.astype(np.int16)
+
+    def detect(denoise: bool) -> np.ndarray:
+        config = Config()
+        config.stt.denoise = denoise
+        raw_ring = []
+        chunk_queue: queue.Queue = queue.Queue()
+        detector = Detector(
+            config,
+            queue.Queue(),
+            chunk_queue,
+            lambda _d: np.concatenate(raw_ring)[-config.vad.pre_roll_ms * 16 :],
+            vad=PerDeviceVad(_LoudIsSpeech),
+        )
+        for i in range(n_noise + n_speech):
+            frame = pcm[i * FRAME_SAMPLES : (i + 1) * FRAME_SAMPLES]
+            raw_ring.append(frame)
+            detector.process_frame(AudioFrame(DEVICE, frame, i * 0.032))
+        return np.concatenate([chunk.pcm for chunk in chunk_queue.queue])
+
+    raw, cleaned = detect(False), detect(True)
+    head, tail = slice(0, 2 * FRAME_SAMPLES), slice(-5 * FRAME_SAMPLES, None)
+
+    # same audio, pre-roll included: its noise-only start is quieter, the tone isn't
+    assert raw.size == cleaned.size
+    assert np.std(cleaned[head]) < 0.7 * np.std(raw[head])
+    assert np.std(cleaned[tail]) > 0.95 * np.std(raw[tail])
+
+
+def test_detector_skips_vad_on_losing_devices_and_resyncs_them_on_release():
+    import queue
+
+    from scriba.config import Config
+    from scriba.detect.vad import Detector, PerDeviceVad
+    from scriba.messages import AudioFrame
+
+    class _CountingVad:
+        def __init__(self):
+            self.frames = 0
+            self.resets = 0
+
+        def reset(self):
+            self.resets += 1
+
+        def process_frame(self, pcm):
+            self.frames += 1
+            return 0.9 if pcm[0] else 0.0
+
+    script = [0] * 10 + [7] * 30 + [0] * 30  # silence, speech, silence past the endpoint
+
+    def detect(skip: bool):
+        config = Config()
+        config.vad.skip_losing_devices = skip
+        config.vad.energy_gate_db = 0.0  # count every scored frame
+        vads: dict[str, _CountingVad] = {}
+
+        def factory():
+            vad = _CountingVad()
+            vads[f"mic{len(vads) + 1}"] = vad
+            return vad
+
+        rings: dict[str, list[np.ndarray]] = {"mic1": [], "mic2": []}
+        chunk_queue: queue.Queue = queue.Queue()
+        detector = Detector(
+            config,
+            queue.Queue(),
+            chunk_queue,
+            lambda d: np.concatenate(rings[d])[-config.vad.pre_roll_ms * 16 :],
+            vad=PerDeviceVad(factory),
+        )
+        for i, level in enumerate(script):
+            frames = []
+            for device in ("mic1", "mic2"):
+                pcm = np.full(FRAME_SAMPLES, level, dtype=np.int16)
+                rings[device].append(pcm)
+                frames.append(AudioFrame(device, pcm, i * 0.032))
+            detector.process_frames(frames)
+        return list(chunk_queue.queue), vads, detector
+
+    skipped_chunks, vads, detector = detect(True)
+    scored_chunks, all_vads, _ = detect(False)
+
+    # the winner's utterance is untouched...
+    assert [(c.utterance_id, c.device_id, c.is_final) for c in skipped_chunks] == [
+        (c.utterance_id, c.device_id, c.is_final) for c in scored_chunks
+    ]
+    assert skipped_chunks[0].device_id == "mic1"
+    # ...while the loser went unscored for the length of the lock, then was
+    # reset and replayed its 400 ms pre-roll (12 whole frames) on release
+    assert detector.skipped_frames > 30
+    assert vads["mic1"].frames == len(script)
+    assert vads["mic2"].frames == len(script) - detector.skipped_frames + 12
+    assert vads["mic2"].resets == 1
+    assert all_vads["mic2"].frames == len(script)
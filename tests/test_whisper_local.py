@@ -1,11 +1,25 @@
-"""Tests for the pure, hardware-free helpers in whisper_local.py. The model
-fallback ladder / actual transcription need a real GPU+model and are covered
-manually / by @pytest.mark.gpu smoke tests elsewhere, not here.
+"""Tests for the pure, hardware-free helpers in whisper_local.py. Actual
+transcription needs a real GPU+model and is covered manually / by
+@pytest.mark.gpu smoke tests elsewhere; which model/device the fallback
+ladder picks is checked below with `WhisperModel` replaced by a recorder.
 """
 
+import threading
+import time
+from types import SimpleNamespace
+
 import numpy as np
+import pytest
 
-from scriba.stt.whisper_local import _denoise, _is_cuda_oom, _to_float32
+from scriba.config import Config
+from scriba.stt import whisper_local
+from scriba.stt.whisper_local import (
+    WhisperLocalBackend,
+    _is_cuda_oom,
+    _LoadedRung,
+    _to_float32,
+    _whitespace_words,
+)
 
 _SAMPLE_RATE = 16000
 
@@ -37,50 +51,282 @@ def test_is_cuda_oom_does_not_match_unrelated_errors():
     assert not _is_cuda_oom(ValueError("invalid language code"))
 
 
-def _tone(
-    freq_hz: float, duration_s: float, amplitude: float, sr: int = _SAMPLE_RATE
-) -> np.ndarray:
-    t = np.arange(int(duration_s * sr)) / sr
-    return (amplitude * np.sin(2 * np.pi * freq_hz * t)).astype(np.float32)
+def test_whitespace_words_merges_tokenizer_pieces_into_text_tokens():
+    def word(text, start, end):
+        return SimpleNamespace(word=text, start=start, end=end)
+
+    segments = [
+        SimpleNamespace(
+            words=[word(" a", 0.0, 0.2), word(" well", 0.3, 0.5), word("-known", 0.5, 0.8)]
+        ),
+        SimpleNamespace(words=[word(" fact", 1.0, 1.3), word(".", 1.3, 1.3)]),
+        SimpleNamespace(words=None),
+    ]
+
+    words = _whitespace_words(segments)
+
+    assert [w.word for w in words] == ["a", "well-known", "fact."]
+    assert (words[1].start, words[1].end) == (0.3, 0.8)
+    assert words[2].end == 1.3
+
+
+def test_model_and_device_overrides_select_the_partial_model(monkeypatch, tmp_path):
+    loaded = []
+
+    class _RecordingModel:
+        def __init__(self, path, device, compute_type):
+            loaded.append((path, device, compute_type))
+
+    monkeypatch.setattr(whisper_local, "WhisperModel", _RecordingModel)
+    monkeypatch.setattr(whisper_local, "_warmup", lambda model: None)
+    monkeypatch.setattr(
+        whisper_local, "_ensure_downloaded", lambda name, progress_cb: tmp_path / name
+    )
+    config = Config()
+    config.stt.device = "cuda"  # the main model's device doesn't apply to partials
+    backend = WhisperLocalBackend(config, model="base", device="cpu")
+    backend.load(lambda frac, label: None)
+
+    assert loaded == [(str(tmp_path / "base"), "cpu", "int8")]
+    assert backend.descriptor == "base/int8/cpu"
+
+
+class _ScriptedModel:
+    """`WhisperModel` stand-in: one segment per call, scripted by beam size."""
+
+    def __init__(self, by_beam):
+        self.by_beam = by_beam  # beam_size -> (text, avg_logprob, no_speech_prob, compression)
+        self.beams: list[int] = []
+        self.features: list[np.ndarray] = []
+        self.feature_extractor = SimpleNamespace(mel_filters=np.zeros((80, 201)))
+
+    def transcribe(self, audio, beam_size, **kwargs):
+        self.beams.append(beam_size)
+        if not isinstance(self.feature_extractor, SimpleNamespace):
+            self.features.append(self.feature_extractor(audio))
+        text, avg_logprob, no_speech_prob, compression_ratio = self.by_beam[beam_size]
+        segment = SimpleNamespace(
+            text=text,
+            avg_logprob=avg_logprob,
+            no_speech_prob=no_speech_prob,
+            compression_ratio=compression_ratio,
+            words=None,
+        )
+        info = SimpleNamespace(duration=audio.size / _SAMPLE_RATE, language="en")
+        return iter([segment]), info
+
+
+def _scripted_backend(by_beam) -> tuple[WhisperLocalBackend, _ScriptedModel]:
+    backend = WhisperLocalBackend(Config())
+    model = _ScriptedModel(by_beam)
+    backend._active = _LoadedRung(model, 1, 0, "test", "cuda", "int8_float16")
+    return backend, model
+
+
+def test_confident_final_pass_stays_greedy():
+    backend, model = _scripted_backend({1: (" Hello there.", -0.2, 0.05, 1.2)})
+
+    transcript = backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en", final=True)
+
+    assert model.beams == [1]
+    assert transcript.text == "Hello there."
+    assert transcript.escalation == ""
+    assert (backend.escalation.finals, backend.escalation.escalated) == (1, 0)
+
+
+def test_low_confidence_final_pass_escalates_to_beam_search():
+    backend, model = _scripted_backend(
+        {1: (" Hollow bear.", -0.9, 0.05, 1.2), 5: (" Hello there.", -0.3, 0.05, 1.2)}
+    )
+
+    transcript = backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en", final=True)
+
+    assert model.beams == [1, 5]
+    assert transcript.text == "Hello there."
+    assert transcript.escalation.startswith("avg_logprob -0.90")
+    assert transcript.escalation_ms >= 0.0
+    assert (backend.escalation.finals, backend.escalation.escalated) == (1, 1)
+
+
+def test_repetitive_final_pass_escalates_on_compression_ratio():
+    backend, model = _scripted_backend(
+        {1: (" the the the the the", -0.2, 0.05, 3.1), 5: (" the end", -0.2, 0.05, 1.0)}
+    )
+
+    transcript = backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en", final=True)
+
+    assert model.beams == [1, 5]
+    assert transcript.escalation.startswith("compression ratio")
+
+
+def test_partial_passes_never_escalate_and_ignore_beam_size():
+    backend, model = _scripted_backend({1: (" Hollow bear", -0.9, 0.5, 3.0)})
+    backend._config.stt.beam_size = 5
+
+    transcript = backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en")
+
+    assert model.beams == [1]
+    assert transcript.escalation == ""
+    assert backend.escalation.finals == 0
+
+
+def test_escalation_off_when_escalate_beam_size_does_not_exceed_beam_size():
+    backend, model = _scripted_backend({1: (" Hollow bear.", -0.9, 0.05, 1.2)})
+    backend._config.stt.escalate_beam_size = 1
+
+    backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en", final=True)
+
+    assert model.beams == [1]
+
+
+def test_precomputed_features_replace_extraction_for_the_decode_only():
+    backend, model = _scripted_backend({1: (" Hello", -0.2, 0.05, 1.2)})
+    extractor = model.feature_extractor
+    features = np.ones((80, 101), dtype=np.float32)
+
+    backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en", features=features)
+    backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en", features=np.ones((128, 101)))
+
+    assert len(model.features) == 1  # the 128-band features don't fit this model
+    assert model.features[0] is features
+    assert model.feature_extractor is extractor
+
+
+# --- hot-standby fallback on CUDA OOM ---
+
+
+class _OomLadder:
+    """`WhisperModel` factory for the fallback ladder: the configured model
+    on CUDA runs out of memory on every decode; loading anything else
+    blocks until `release` is set (a slow download/load)."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.loaded: list[tuple[str, str, str]] = []
+        self.load_threads: list[str] = []
+
+    def __call__(self, path, device, compute_type):
+        self.load_threads.append(threading.current_thread().name)
+        if (device, compute_type) != ("cuda", "int8_float16") or "small" in path:
+            assert self.release.wait(5.0)
+        self.loaded.append((path, device, compute_type))
+        model = _ScriptedModel({1: (f" {path} {device}", -0.1, 0.0, 1.0)})
+        if device == "cuda" and "small" not in path:
+            model.transcribe = self._oom
+        return model
+
+    @staticmethod
+    def _oom(audio, beam_size, **kwargs):
+        raise RuntimeError("CUDA failed with error out of memory")
+
+
+def _oom_backend(monkeypatch, tmp_path, standby="warm"):
+    ladder = _OomLadder()
+    monkeypatch.setattr(whisper_local, "WhisperModel", ladder)
+    monkeypatch.setattr(whisper_local, "_warmup", lambda model: None)
+    monkeypatch.setattr(
+        whisper_local, "_ensure_downloaded", lambda name, progress_cb: tmp_path / name
+    )
+    config = Config()
+    config.stt.model = "large-v3-turbo"
+    config.stt.standby = standby
+    return WhisperLocalBackend(config), ladder
+
+
+def _wait_for(predicate, timeout_s: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_oom_swaps_to_the_warm_standby_without_loading_on_the_stt_thread(monkeypatch, tmp_path):
+    backend, ladder = _oom_backend(monkeypatch, tmp_path)
+    backend.load(lambda frac, label: None)
+    _wait_for(lambda: backend._standby is not None)
+    loads_before = len(ladder.loaded)
+
+    transcript = backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en")
+
+    assert "large-v3-turbo cpu" in transcript.text  # rung 2 served the utterance
+    assert backend.rung == 2
+    assert len(ladder.loaded) == loads_before  # the swap loaded nothing
+    assert ladder.load_threads[1:] == ["stt-standby"]
+
+
+def test_oom_with_no_standby_ready_loads_the_next_rung_off_the_stt_thread(monkeypatch, tmp_path):
+    backend, ladder = _oom_backend(monkeypatch, tmp_path, standby="download")
+    backend.load(lambda frac, label: None)
+    _wait_for(lambda: backend._loader is None)
+    assert len(ladder.loaded) == 1  # files fetched, nothing loaded
+    pcm = np.zeros(_SAMPLE_RATE, np.int16)
+
+    with pytest.raises(RuntimeError, match="this utterance is lost"):
+        backend.transcribe(pcm, "en")
+    _wait_for(lambda: backend.rung == 2)
+
+    assert ladder.load_threads == ["MainThread", "stt-standby"]  # none on the STT thread
+    assert "large-v3-turbo cpu" in backend.transcribe(pcm, "en").text
+
+
+def test_repeated_oom_while_the_fallback_loads_starts_one_load(monkeypatch, tmp_path):
+    backend, ladder = _oom_backend(monkeypatch, tmp_path, standby="download")
+    backend.load(lambda frac, label: None)
+    _wait_for(lambda: backend._loader is None)
+    ladder.release.clear()  # rung 2 takes a while to load
+    pcm = np.zeros(_SAMPLE_RATE, np.int16)
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="this utterance is lost"):
+            backend.transcribe(pcm, "en")
+    ladder.release.set()
+    _wait_for(lambda: backend.rung == 2)
+
+    assert ladder.load_threads == ["MainThread", "stt-standby"]
+
+
+def test_oom_while_the_warm_standby_is_still_loading_still_serves_the_utterance(
+    monkeypatch, tmp_path
+):
+    backend, ladder = _oom_backend(monkeypatch, tmp_path)
+    ladder.release.clear()  # rung 2 is still loading on the standby thread
+    backend.load(lambda frac, label: None)
+    threading.Timer(0.1, ladder.release.set).start()
+
+    transcript = backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en")
 
+    assert "cpu" in transcript.text
+    assert backend.rung == 2
+    assert ladder.load_threads == ["MainThread", "stt-standby"]  # waited, didn't load it again
 
-def test_denoise_reduces_pure_noise_energy():
-    rng = np.random.default_rng(0)
-    noise = rng.normal(0, 0.05, _SAMPLE_RATE * 2).astype(np.float32)
 
-    denoised = _denoise(noise)
+def test_oom_with_every_fallback_rung_failing_raises(monkeypatch, tmp_path):
+    backend, ladder = _oom_backend(monkeypatch, tmp_path, standby="download")
+    backend.load(lambda frac, label: None)
+    _wait_for(lambda: backend._loader is None)
 
-    assert denoised.dtype == np.float32
-    assert denoised.shape == noise.shape
-    # pure noise has no stable spectral profile to preserve, so gating should
-    # visibly attenuate it rather than pass it through unchanged
-    assert np.sqrt(np.mean(denoised**2)) < np.sqrt(np.mean(noise**2)) * 0.9
+    def broken(path, device, compute_type):
+        raise RuntimeError("cannot load")
 
+    monkeypatch.setattr(whisper_local, "WhisperModel", broken)
+    with pytest.raises(RuntimeError, match="this utterance is lost"):
+        backend.transcribe(np.zeros(_SAMPLE_RATE, np.int16), "en")
+    _wait_for(lambda: backend._loader is None)
 
-def test_denoise_increases_contrast_between_loud_and_quiet_segments():
-    """A crude proxy for "improves intelligibility over background noise".
+    assert backend.rung == 1
+    assert backend._failover is False  # the next OOM tries the ladder again
 
-    A perfectly stationary pure tone is exactly the degenerate case spectral
-    gating handles badly (tried first: it reads as "noise" itself and gets
-    gated to near-silence, since it has no bursty/non-stationary structure
-    to distinguish it from a hum). Real speech is bursty, so this uses
-    alternating loud/quiet segments and checks that denoising increases the
-    relative energy contrast between them, rather than asserting exact
-    waveform preservation -- perceptual audio quality is something only
-    manual listening can really judge.
-    """
-    rng = np.random.default_rng(2)
-    sr = _SAMPLE_RATE
-    quiet = rng.normal(0, 0.03, sr).astype(np.float32)
-    loud = _tone(200, 1.0, 0.4) + rng.normal(0, 0.03, sr).astype(np.float32)
-    noisy = np.concatenate([quiet, loud, quiet, loud, quiet]).astype(np.float32)
 
-    denoised = _denoise(noisy)
+def test_unload_discards_a_standby_that_lands_afterwards(monkeypatch, tmp_path):
+    backend, ladder = _oom_backend(monkeypatch, tmp_path)
+    ladder.release.clear()
+    backend.load(lambda frac, label: None)
+    loader = backend._loader
 
-    def _segment_rms(arr: np.ndarray, segment_index: int) -> float:
-        segment = arr[segment_index * sr : (segment_index + 1) * sr]
-        return float(np.sqrt(np.mean(segment**2)))
+    backend.unload()
+    ladder.release.set()
+    loader.join(5.0)
 
-    original_contrast = _segment_rms(noisy, 1) / (_segment_rms(noisy, 0) + 1e-9)
-    denoised_contrast = _segment_rms(denoised, 1) / (_segment_rms(denoised, 0) + 1e-9)
-    assert denoised_contrast > original_contrast
+    assert backend._standby is None
+    assert backend.rung == 0